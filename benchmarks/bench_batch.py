@@ -0,0 +1,50 @@
+"""
+Throughput of `getDecksByIds` (decks/sec) against worker count
+
+Run from the repository root:
+    python -m benchmarks.bench_batch [-n DECKS] [--latency SECONDS]
+"""
+
+from __future__ import annotations
+from pyrchidekt.api import ArchidektClient
+from pyrchidekt.mockserver import MockArchidekt
+from pyrchidekt.synthetic import generateDeck
+from time import perf_counter
+import argparse
+import json
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", "--decks", type=int, default=400)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    args = parser.parse_args()
+
+    server = MockArchidekt(
+        latency=args.latency, body=json.dumps(generateDeck(1)).encode()
+    ).start()
+    try:
+        for workers in args.workers:
+            for ordered in (True, False):
+                with ArchidektClient(
+                    base_url=server.base_url, pool_maxsize=workers
+                ) as client:
+                    start = perf_counter()
+                    results = list(
+                        client.getDecksByIds(
+                            range(args.decks), max_workers=workers, ordered=ordered
+                        )
+                    )
+                    elapsed = perf_counter() - start
+                assert all(x.ok for x in results)
+                mode = "ordered" if ordered else "as-completed"
+                print(
+                    f"{workers:>3} workers {mode:<12} {args.decks / elapsed:9.1f} decks/s"
+                )
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
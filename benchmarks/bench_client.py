@@ -0,0 +1,56 @@
+"""
+Per-request latency of the pooled `ArchidektClient` against bare `requests.get`
+
+Run from the repository root:
+    python -m benchmarks.bench_client [-n REQUESTS]
+"""
+
+from __future__ import annotations
+from pyrchidekt.api import ArchidektClient
+from pyrchidekt.mockserver import MockArchidekt
+from pyrchidekt.synthetic import generateDeck
+from time import perf_counter
+import argparse
+import json
+import requests
+import statistics
+
+
+def _measure(fetch, count: int) -> list:
+    timings = []
+    for i in range(count):
+        start = perf_counter()
+        fetch(i)
+        timings.append(perf_counter() - start)
+    return timings
+
+
+def _report(name: str, timings: list) -> None:
+    timings = sorted(timings)
+    print(
+        f"{name:<22} mean {statistics.mean(timings) * 1e3:7.3f} ms  "
+        f"p50 {timings[len(timings) // 2] * 1e3:7.3f} ms  "
+        f"p99 {timings[int(len(timings) * 0.99)] * 1e3:7.3f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", "--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server = MockArchidekt(body=json.dumps(generateDeck(1)).encode()).start()
+    try:
+        url = server.base_url + "decks/{}/"
+        _report(
+            "requests.get",
+            _measure(lambda i: requests.get(url.format(i)).json(), args.requests),
+        )
+        with ArchidektClient(base_url=server.base_url) as client:
+            _report("ArchidektClient", _measure(client.getDeckJson, args.requests))
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Corpus statistics with per-card Python loops versus a stacked `DeckFrame`
+
+Each run computes, for every deck, its card count, mana curve, average converted mana cost, color counts and
+vendor price totals. The frame is built once; its build time is reported separately from the aggregations.
+
+Run from the repository root:
+    python -m benchmarks.bench_columns [--decks N] [--cards N]
+"""
+
+from __future__ import annotations
+from pyrchidekt.columns import COLORS, DeckFrame
+from pyrchidekt.deck import Deck
+from pyrchidekt.synthetic import generateCorpus
+from time import perf_counter
+import argparse
+
+
+def _loops(decks: list) -> float:
+    start = perf_counter()
+    for deck in decks:
+        count = 0
+        curve = [0] * 8
+        cmc_total = nonland = 0
+        colors = dict.fromkeys(COLORS, 0)
+        prices = {}
+        for card in deck.cards:
+            oracle_card = card.card.oracle_card
+            if deck.isIncluded(card, price=True):
+                for vendor, price in card.card.prices.items():
+                    prices[vendor] = prices.get(vendor, 0) + card.quantity * price
+            if not deck.isIncluded(card):
+                continue
+            count += card.quantity
+            for color in oracle_card.colors:
+                colors[color] += card.quantity
+            if "Land" not in oracle_card.types:
+                cmc = (
+                    card.custom_cmc if card.custom_cmc is not None else oracle_card.cmc
+                )
+                curve[min(int(cmc), 7)] += card.quantity
+                cmc_total += cmc * card.quantity
+                nonland += card.quantity
+        cmc_total / nonland if nonland else None
+    return perf_counter() - start
+
+
+def _frame(frame: DeckFrame) -> float:
+    start = perf_counter()
+    frame.count(per_deck=True)
+    frame.manaCurve(per_deck=True)
+    frame.averageCmc(per_deck=True)
+    frame.colorCounts(per_deck=True)
+    frame.priceTotals(per_deck=True)
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks", type=int, default=1000)
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    decks = [Deck.fromJson(x) for x in generateCorpus(args.decks, args.cards)]
+    start = perf_counter()
+    frame = DeckFrame.fromDecks(decks)
+    build = perf_counter() - start
+    loops = min(_loops(decks) for _ in range(args.repeat))
+    vectorized = min(_frame(frame) for _ in range(args.repeat))
+    print(f"{args.decks} decks of {args.cards} cards, {len(frame)} rows")
+    print(f"python loops:       {loops * 1e3:8.1f} ms")
+    print(f"frame build:        {build * 1e3:8.1f} ms")
+    print(f"frame aggregations: {vectorized * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Random access and filtered iteration over a memory-mapped deck corpus
+
+Run from the repository root:
+    python -m benchmarks.bench_corpus [--decks N] [--cards N] [--lookups N]
+"""
+
+from __future__ import annotations
+from pyrchidekt.corpus import DeckCorpus
+from pyrchidekt.deck import Deck
+from pyrchidekt.formats import Format
+from pyrchidekt.synthetic import generateCorpus
+from time import perf_counter
+import argparse
+import os
+import random
+import tempfile
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks", type=int, default=5000)
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    corpus = generateCorpus(args.decks, args.cards)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "decks.corpus")
+        start = perf_counter()
+        with DeckCorpus(path, create=True) as writer:
+            writer.extend(Deck.fromJson(x) for x in corpus)
+        ingested = perf_counter() - start
+        size = os.path.getsize(path) + os.path.getsize(path + ".idx")
+        print(
+            f"ingested {args.decks} decks of {args.cards} cards in {ingested:.2f} s, "
+            f"{size / 2**20:.1f} MiB"
+        )
+
+        start = perf_counter()
+        reader = DeckCorpus(path)
+        print(f"open             {(perf_counter() - start) * 1e3:9.2f} ms")
+
+        ids = random.Random(0).choices(list(reader), k=args.lookups)
+        start = perf_counter()
+        for id in ids:
+            reader[id]
+        elapsed = perf_counter() - start
+        print(f"corpus[id]       {elapsed / len(ids) * 1e6:9.1f} us per deck")
+
+        for format in (None, Format.COMMANDER):
+            start = perf_counter()
+            count = sum(1 for _ in reader.iter(format=format))
+            elapsed = perf_counter() - start
+            name = "iter()" if format is None else f"iter({format.name})"
+            print(f"{name:<16} {elapsed:9.2f} s   {count / elapsed:9.0f} decks/s")
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()
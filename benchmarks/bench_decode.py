@@ -0,0 +1,51 @@
+"""
+Decks per second of the msgspec decoder against `json.loads` + `Deck.fromJson`
+
+Both paths start from the raw bytes of a deck, as returned by the API.
+
+Run from the repository root:
+    python -m benchmarks.bench_decode [--sizes N ...]
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from pyrchidekt.deck import Deck
+from pyrchidekt.decode import FAST_DECODE, decodeDeck
+from pyrchidekt.synthetic import generateDeck
+from time import perf_counter
+import argparse
+import json
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "unit" / "resources" / "deck.json"
+
+
+def _rate(decode, raw: bytes, seconds: float = 1.0) -> float:
+    count = 0
+    start = perf_counter()
+    while (elapsed := perf_counter() - start) < seconds:
+        decode(raw)
+        count += 1
+    return count / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    args = parser.parse_args()
+
+    if not FAST_DECODE:
+        print("msgspec is not installed, both paths use json.loads + Deck.fromJson")
+
+    payloads = [("deck.json", FIXTURE.read_bytes())]
+    payloads += [
+        (f"{x} cards", json.dumps(generateDeck(1, x)).encode()) for x in args.sizes
+    ]
+    print(f"{'deck':<10} {'fromJson':>14} {'decodeDeck':>14} {'speedup':>8}")
+    for name, raw in payloads:
+        slow = _rate(lambda x: Deck.fromJson(json.loads(x)), raw)
+        fast = _rate(decodeDeck, raw)
+        print(f"{name:<10} {slow:10.1f}/s {fast:12.1f}/s {fast / slow:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Import time of the package, measured in fresh interpreters
+
+Each statement is timed in its own subprocess, so nothing is already imported. The total is the wall-clock time
+of the statement and the modules are those it added to `sys.modules`, which includes the submodules loaded
+lazily with `importlib.import_module`. `-X importtime` doesn't report those, so the slowest modules listed, which
+come from it, leave them out. Modules that the parse-only path must not load, such as requests, are reported,
+and `--max-ms` turns the run into a regression check.
+
+Run from the repository root:
+    python -m benchmarks.bench_import [--repeat N] [--max-ms MS] [--top N]
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Tuple
+import argparse
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import pyrchidekt": "import pyrchidekt",
+    "from pyrchidekt import Deck": "from pyrchidekt import Deck",
+    "from pyrchidekt import Format": "from pyrchidekt import Format",
+    "import pyrchidekt.api": "import pyrchidekt.api",
+}
+"""`Dict[str, str]` The statements timed, by name"""
+
+PARSE_ONLY = (
+    "import pyrchidekt",
+    "from pyrchidekt import Deck",
+    "from pyrchidekt import Format",
+)
+"""`Tuple[str, ...]` The statements that must stay free of `FORBIDDEN` modules"""
+
+FORBIDDEN = ("requests", "urllib3", "aenum", "msgspec", "numpy")
+"""`Tuple[str, ...]` Modules the parse-only statements must not import"""
+
+CLIENT_FORBIDDEN = ("msgspec", "numpy")
+"""`Tuple[str, ...]` Modules the other statements must not import, as they are only loaded when used"""
+
+# Times the statement and lists what it imported, after the marker that starts the `-X importtime` lines
+_HARNESS = """
+import sys, time
+before = set(sys.modules)
+print("-", file=sys.stderr)
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(round(elapsed * 1e6))
+print("\\n".join(sorted(set(sys.modules) - before)))
+"""
+
+
+def importTimes(statement: str) -> Tuple[int, List[str], Dict[str, Tuple[int, int]]]:
+    """Runs a statement in a fresh interpreter with `-X importtime`
+
+    Arguments:
+        statement: `str` The Python statement
+
+    Returns:
+        The wall-clock microseconds the statement took, the modules it imported and the self and cumulative
+        microseconds of those `-X importtime` reported
+    """
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _HARNESS.format(statement=statement),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total, *loaded = process.stdout.split()
+    lines = process.stderr.splitlines()
+    lines = lines[lines.index("-") + 1 :]
+    timed = {}
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        if not own.strip().isdigit():
+            continue
+        timed[name.strip()] = (int(own), int(cumulative))
+    return int(total), loaded, timed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument(
+        "--max-ms", type=float, help="fail when a parse-only import takes longer"
+    )
+    parser.add_argument("--top", type=int, default=5, help="show the slowest modules")
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    for name, statement in STATEMENTS.items():
+        runs = [importTimes(statement) for _ in range(args.repeat)]
+        total, modules, timed = min(runs, key=lambda x: x[0])
+        print(f"{name:<30} {total / 1e3:8.2f} ms  {len(modules):>4} modules")
+        slowest = sorted(timed.items(), key=lambda x: -x[1][0])[: args.top]
+        for module, (own, _) in slowest:
+            print(f"    {module:<34} {own / 1e3:7.2f} ms")
+        forbidden = FORBIDDEN if name in PARSE_ONLY else CLIENT_FORBIDDEN
+        loaded = [x for x in modules if x.split(".")[0] in forbidden]
+        if loaded:
+            failures.append(f"{name} imports {', '.join(sorted(loaded))}")
+        if name in PARSE_ONLY and args.max_ms is not None and total / 1e3 > args.max_ms:
+            failures.append(f"{name} takes {total / 1e3:.2f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
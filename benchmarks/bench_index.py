@@ -0,0 +1,56 @@
+"""
+Card lookups on a deck with linear scans versus `Deck.find` and `Deck.byType`
+
+Each round asks, for a set of card names, whether the card is in the deck, and lists the creatures. The scans
+loop over `Deck.cards` the way callers had to before the indexes; the indexed time includes building them.
+
+Run from the repository root:
+    python -m benchmarks.bench_index [--sizes N ...] [--queries N]
+"""
+
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.synthetic import generateDeck
+from time import perf_counter
+import argparse
+import random
+
+
+def _scan(deck: Deck, names: list) -> float:
+    start = perf_counter()
+    for name in names:
+        name = name.casefold()
+        any(x.card.oracle_card.name.casefold() == name for x in deck.cards)
+        [x for x in deck.cards if "Creature" in x.card.oracle_card.types]
+    return perf_counter() - start
+
+
+def _indexed(deck: Deck, names: list) -> float:
+    start = perf_counter()
+    deck.invalidate()
+    for name in names:
+        deck.find(name=name)
+        deck.byType("Creature")
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'cards':>6} {'queries':>8} {'scan':>11} {'indexed':>11}")
+    for size in args.sizes:
+        deck = Deck.fromJson(generateDeck(1, size))
+        pool = [x.card.oracle_card.name for x in deck.cards] + ["Not A Card"]
+        names = random.Random(0).choices(pool, k=args.queries)
+        scan = _scan(deck, names)
+        indexed = _indexed(deck, names)
+        print(
+            f"{size:>6} {args.queries:>8} {scan * 1e3:8.1f} ms {indexed * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Time to first field of eager and lazy `Deck.fromJson` on large decks
+
+Each run builds the deck and reads `name`, `format`, `owner` and the number of cards. The lazy deck is then also
+iterated in full, to show what building every card on demand costs.
+
+Run from the repository root:
+    python -m benchmarks.bench_lazy [--sizes N ...]
+"""
+
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.synthetic import generateDeck
+from time import perf_counter
+import argparse
+
+
+def _firstFields(data: dict, lazy: bool) -> float:
+    start = perf_counter()
+    deck = Deck.fromJson(data, lazy=lazy)
+    deck.name, deck.format, deck.owner.username, len(deck.cards)
+    return perf_counter() - start
+
+
+def _allCards(data: dict) -> float:
+    start = perf_counter()
+    for card in Deck.fromJson(data, lazy=True).cards:
+        card.quantity
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'cards':>6} {'eager':>11} {'lazy':>11} {'lazy, all cards':>16}")
+    for size in args.sizes:
+        data = generateDeck(1, size)
+        eager = min(_firstFields(data, False) for _ in range(args.repeat))
+        lazy = min(_firstFields(data, True) for _ in range(args.repeat))
+        full = min(_allCards(data) for _ in range(args.repeat))
+        print(
+            f"{size:>6} {eager * 1e3:8.2f} ms {lazy * 1e3:8.2f} ms {full * 1e3:13.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Parse time and memory per card of `Legalities` against the previous `Dict[Format, str]`
+
+Run from the repository root:
+    python -m benchmarks.bench_legalities [-n CARDS]
+"""
+
+from __future__ import annotations
+from pyrchidekt.formats import Format, Legalities
+from pyrchidekt.synthetic import defaultPool
+from time import perf_counter
+import argparse
+import gc
+import tracemalloc
+
+
+def legalitiesDict(data: dict) -> dict:
+    """The per-card parsing `OracleCard.fromJson` used to do"""
+    legalities = dict()
+    for x in data:
+        try:
+            legalities[Format(x.lower())] = data[x]
+        except ValueError:
+            pass
+    return legalities
+
+
+def _measure(parse, payloads: list) -> tuple:
+    start = perf_counter()
+    for x in payloads:
+        parse(x)
+    elapsed = perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    held = [parse(x) for x in payloads]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return elapsed / len(payloads), size / len(payloads)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", "--cards", type=int, default=5000)
+    args = parser.parse_args()
+
+    payloads = [x["legalities"] for x in defaultPool().oracle_cards[: args.cards]]
+    for name, parse in (
+        ("Dict[Format, str]", legalitiesDict),
+        ("Legalities", Legalities.fromJson),
+    ):
+        seconds, size = _measure(parse, payloads)
+        print(f"{name:<18} {seconds * 1e6:7.2f} us/card  {size:7.0f} B/card")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Checking a corpus against every format with `checkLegality` versus walking each card's legality strings
+
+The baseline reads the legality of every card in every format the way callers had to before, through the
+`Legalities` mapping. Both sides check the same decks; the corpus is doubled each step to show the time growing
+linearly.
+
+Run from the repository root:
+    python -m benchmarks.bench_legality [--decks N] [--steps N] [--cards N]
+"""
+
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.formats import Format, Legalities
+from pyrchidekt.legality import checkLegality
+from pyrchidekt.synthetic import generateCorpus
+from time import perf_counter
+import argparse
+import gc
+
+_FORMATS = [x for x in Format if x.string is not None]
+
+
+def _walk(decks: list) -> float:
+    start = perf_counter()
+    for deck in decks:
+        for format in _FORMATS:
+            [
+                x
+                for x in deck.cards
+                if x.card.oracle_card.legalities.get(format)
+                not in (Legalities.LEGAL, Legalities.RESTRICTED)
+            ]
+    return perf_counter() - start
+
+
+def _batch(decks: list) -> float:
+    start = perf_counter()
+    checkLegality(decks, _FORMATS)
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks", type=int, default=250)
+    parser.add_argument("--steps", type=int, default=4)
+    parser.add_argument("--cards", type=int, default=100)
+    args = parser.parse_args()
+
+    corpus = [
+        Deck.fromJson(x)
+        for x in generateCorpus(args.decks * 2 ** (args.steps - 1), args.cards)
+    ]
+    gc.collect()
+    print(f"{len(_FORMATS)} formats, {args.cards} cards per deck")
+    print(f"{'decks':>6} {'walk':>11} {'checkLegality':>14} {'per deck':>10}")
+    for step in range(args.steps):
+        decks = corpus[: args.decks * 2**step]
+        walk = _walk(decks)
+        batch = _batch(decks)
+        print(
+            f"{len(decks):>6} {walk * 1e3:8.1f} ms {batch * 1e3:11.1f} ms "
+            f"{batch / len(decks) * 1e6:7.0f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
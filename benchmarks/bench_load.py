@@ -0,0 +1,63 @@
+"""
+Load test of the asyncio client against `MockArchidekt` with realistic latency and throttling
+
+Run from the repository root:
+    python -m benchmarks.bench_load [-n DECKS] [--concurrency N ...] [--latency SPEC] [--throttle RATE]
+"""
+
+from __future__ import annotations
+from collections import Counter
+from pyrchidekt.aio import AsyncArchidektClient
+from pyrchidekt.api import DeckFetchError
+from pyrchidekt.mockserver import Latency, MockArchidekt
+from pyrchidekt.synthetic import generateDeck
+from time import perf_counter
+import argparse
+import asyncio
+import json
+
+
+async def _load(base_url: str, decks: int, concurrency: int) -> tuple:
+    outcomes = Counter()
+    start = perf_counter()
+    async with AsyncArchidektClient(
+        base_url=base_url, max_connections=concurrency
+    ) as client:
+        async for result in client.get_decks(range(decks)):
+            if result.ok:
+                outcomes[200] += 1
+            elif isinstance(result.error, DeckFetchError):
+                outcomes[result.error.status_code] += 1
+            else:
+                outcomes[type(result.error).__name__] += 1
+    return perf_counter() - start, outcomes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", "--decks", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32, 128, 512])
+    parser.add_argument("--latency", type=Latency.parse, default="lognormal:0.05:0.5")
+    parser.add_argument("--throttle", type=float, default=0.02, help="429 rate")
+    args = parser.parse_args()
+
+    server = MockArchidekt(
+        body=json.dumps(generateDeck(1)).encode(),
+        latency=args.latency,
+        error_rates={429: args.throttle},
+    ).start()
+    try:
+        for concurrency in args.concurrency:
+            elapsed, outcomes = asyncio.run(
+                _load(server.base_url, args.decks, concurrency)
+            )
+            print(
+                f"{concurrency:>4} connections {args.decks / elapsed:8.1f} decks/s  "
+                + "  ".join(f"{x}: {y}" for x, y in sorted(outcomes.items(), key=str))
+            )
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
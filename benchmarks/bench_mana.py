@@ -0,0 +1,44 @@
+"""
+Parsing the mana costs of a corpus with and without the `parseManaCost` cache
+
+Run from the repository root:
+    python -m benchmarks.bench_mana [--decks N] [--cards N]
+"""
+
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.mana import parseManaCost
+from pyrchidekt.synthetic import generateCorpus
+from time import perf_counter
+import argparse
+
+
+def _parse(costs: list, parse) -> float:
+    start = perf_counter()
+    for cost in costs:
+        parse(cost)
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks", type=int, default=1000)
+    parser.add_argument("--cards", type=int, default=100)
+    args = parser.parse_args()
+
+    costs = [
+        x.card.oracle_card.mana_cost
+        for data in generateCorpus(args.decks, args.cards)
+        for x in Deck.fromJson(data).cards
+    ]
+    uncached = _parse(costs, parseManaCost.__wrapped__)
+    parseManaCost.cache_clear()
+    cached = _parse(costs, parseManaCost)
+    info = parseManaCost.cache_info()
+    print(f"{len(costs)} costs, {info.currsize} distinct")
+    print(f"uncached: {uncached * 1e3:8.1f} ms")
+    print(f"cached:   {cached * 1e3:8.1f} ms ({info.hits / len(costs):.1%} hits)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Memory held by a built `Deck`, measured with tracemalloc
+
+The deck is built from freshly parsed JSON, as it would be from a response, and everything still held once the
+deck is built is counted. This includes the strings and lists the models keep from the JSON. The size of the
+model instances alone, including any per-instance `__dict__`, is reported separately.
+
+Run from the repository root:
+    python -m benchmarks.bench_memory [--sizes N ...]
+"""
+
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.synthetic import generateDeck
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+
+
+def _held(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del value
+    return held
+
+
+def _instances(deck: Deck) -> int:
+    objects = {id(deck): deck, id(deck.owner): deck.owner}
+    for category in deck.categories:
+        objects[id(category)] = category
+    for card in deck.cards:
+        for x in (card, card.card, card.card.edition, card.card.oracle_card):
+            objects[id(x)] = x
+        production = card.card.oracle_card.mana_production
+        objects[id(production)] = production
+    return sum(
+        sys.getsizeof(x) + (sys.getsizeof(x.__dict__) if hasattr(x, "__dict__") else 0)
+        for x in objects.values()
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    print(
+        f"{'cards':>6} {'deck':>12} {'per card':>10} {'instances':>12} {'per card':>10}"
+    )
+    for size in args.sizes:
+        raw = json.dumps(generateDeck(1, size))
+        held = _held(lambda: Deck.fromJson(json.loads(raw)))
+        instances = _instances(Deck.fromJson(json.loads(raw)))
+        print(
+            f"{size:>6} {held / 1024:8.0f} KiB {held / size:8.0f} B "
+            f"{instances / 1024:8.0f} KiB {instances / size:8.0f} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
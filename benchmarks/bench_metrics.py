@@ -0,0 +1,48 @@
+"""
+Cost of instrumentation: building a corpus with no metrics sink, and with a `MetricsRecorder`
+
+Run from the repository root:
+    python -m benchmarks.bench_metrics [--decks N] [--cards N] [--repeat N]
+"""
+
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.metrics import HYDRATE, MetricsRecorder, setMetrics
+from pyrchidekt.synthetic import generateCorpus
+from time import perf_counter
+import argparse
+
+
+def _hydrate(corpus: list) -> float:
+    start = perf_counter()
+    for data in corpus:
+        Deck.fromJson(data)
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks", type=int, default=200)
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = generateCorpus(args.decks, args.cards)
+    setMetrics(None)
+    disabled = min(_hydrate(corpus) for _ in range(args.repeat))
+    recorder = MetricsRecorder()
+    setMetrics(recorder)
+    enabled = min(_hydrate(corpus) for _ in range(args.repeat))
+    setMetrics(None)
+
+    print(f"disabled: {disabled * 1e3:8.1f} ms")
+    print(f"recorder: {enabled * 1e3:8.1f} ms ({enabled / disabled - 1:+.1%})")
+    summary = recorder.summary()[HYDRATE]
+    print(
+        f"hydrate p50 {summary['p50'] * 1e3:.2f} ms, p99 {summary['p99'] * 1e3:.2f} ms "
+        f"over {summary['count']} decks"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Pricing a corpus deck by deck with a Python loop versus in one batch with `priceDecks`
+
+The loop prices each card once at its vendor's foil or nonfoil price, skipping cards whose primary category
+doesn't count towards the price, as `priceDecks` does. The batch includes building its `DeckFrame`.
+
+Run from the repository root:
+    python -m benchmarks.bench_prices [--decks N] [--cards N]
+"""
+
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.prices import priceDecks
+from pyrchidekt.synthetic import generateCorpus
+from time import perf_counter
+import argparse
+
+
+def _loop(decks: list) -> float:
+    start = perf_counter()
+    for deck in decks:
+        inclusions = deck.inclusions()
+        totals = {}
+        for card in deck.cards:
+            if not inclusions.get(card.primary_category, (True, True))[1]:
+                continue
+            foil = card.modifier == "Foil"
+            for vendor in ("ck", "cm", "mtgo", "tcg"):
+                price = card.card.prices.get(vendor + "foil" if foil else vendor)
+                if price:
+                    totals[vendor] = totals.get(vendor, 0) + card.quantity * price
+    return perf_counter() - start
+
+
+def _batch(decks: list) -> float:
+    for deck in decks:
+        deck.invalidate()
+    start = perf_counter()
+    priceDecks(decks)
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks", type=int, default=1000)
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    decks = [Deck.fromJson(x) for x in generateCorpus(args.decks, args.cards)]
+    loop = min(_loop(decks) for _ in range(args.repeat))
+    batch = min(_batch(decks) for _ in range(args.repeat))
+    start = perf_counter()
+    priceDecks(decks)
+    memoized = perf_counter() - start
+    print(f"{args.decks} decks of {args.cards} cards")
+    print(f"python loop:      {loop * 1e3:8.1f} ms")
+    print(f"priceDecks:       {batch * 1e3:8.1f} ms")
+    print(f"memoized:         {memoized * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Hydration time of a corpus with each projection profile of `Deck.fromJson`
+
+Run from the repository root:
+    python -m benchmarks.bench_projection [--decks N] [--cards N] [--repeat N]
+"""
+
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.synthetic import generateCorpus
+from time import perf_counter
+import argparse
+
+PROFILES = {"full": None, "gameplay": "gameplay", "pricing": "pricing", "minimal": ()}
+
+
+def _hydrate(corpus: list, include) -> float:
+    start = perf_counter()
+    for data in corpus:
+        Deck.fromJson(data, include=include)
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks", type=int, default=200)
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = generateCorpus(args.decks, args.cards)
+    cards = args.decks * args.cards
+    full = None
+    for name, include in PROFILES.items():
+        elapsed = min(_hydrate(corpus, include) for _ in range(args.repeat))
+        full = full or elapsed
+        print(
+            f"{name:<9} {elapsed * 1e3:8.1f} ms {elapsed / cards * 1e6:6.2f} us/card "
+            f"{full / elapsed:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Memory held by a corpus of decks with and without a `CardRegistry`
+
+Decks are serialized and parsed one at a time, as they would arrive from the API, and the memory still held
+once the whole corpus is built is measured with tracemalloc.
+
+Run from the repository root:
+    python -m benchmarks.bench_registry [--decks N] [--cards N]
+"""
+
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.registry import CardRegistry
+from pyrchidekt.synthetic import generateDeck
+from time import perf_counter
+import argparse
+import gc
+import json
+import tracemalloc
+
+
+def _build(payloads: list, registry: CardRegistry | None) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    start = perf_counter()
+    decks = [Deck.fromJson(json.loads(x), registry) for x in payloads]
+    elapsed = perf_counter() - start
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del decks
+    return held, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks", type=int, default=2000)
+    parser.add_argument("--cards", type=int, default=60)
+    args = parser.parse_args()
+
+    payloads = [json.dumps(generateDeck(i, args.cards)) for i in range(args.decks)]
+    plain, plain_time = _build(payloads, None)
+    registry = CardRegistry()
+    shared, shared_time = _build(payloads, registry)
+
+    total = args.decks * args.cards
+    print(f"{args.decks} decks, {total} cards")
+    print(
+        f"without registry {plain / 2**20:8.1f} MiB  {plain / total:7.0f} B/card  {plain_time:6.2f} s"
+    )
+    print(
+        f"with registry    {shared / 2**20:8.1f} MiB  {shared / total:7.0f} B/card  {shared_time:6.2f} s"
+    )
+    print(
+        f"saved            {(plain - shared) / 2**20:8.1f} MiB  ({1 - shared / plain:.0%})"
+    )
+    print(
+        f"oracle hit rate {registry.oracle_stats.hit_rate:.1%} "
+        f"({registry.oracle_stats.misses} parsed), "
+        f"edition hit rate {registry.edition_stats.hit_rate:.1%} "
+        f"({registry.edition_stats.misses} parsed)"
+    )
+
+
+if __name__ == "__main__":
+    main()
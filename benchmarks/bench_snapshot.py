@@ -0,0 +1,70 @@
+"""
+Reloading a corpus from a snapshot, against `json.load` with `Deck.fromJson` and against pickle
+
+Run from the repository root:
+    python -m benchmarks.bench_snapshot [--decks N] [--cards N] [--repeat N]
+"""
+
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.snapshot import dumpDecks, loadDecks
+from pyrchidekt.synthetic import generateCorpus
+from time import perf_counter
+import argparse
+import gc
+import io
+import json
+import pickle
+
+
+def _best(load, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = perf_counter()
+        load()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks", type=int, default=500)
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = generateCorpus(args.decks, args.cards)
+    decks = [Deck.fromJson(x) for x in corpus]
+    raw_json = json.dumps(corpus).encode()
+    raw_pickle = pickle.dumps(decks, pickle.HIGHEST_PROTOCOL)
+    file = io.BytesIO()
+    start = perf_counter()
+    dumpDecks(decks, file)
+    dumped = perf_counter() - start
+    raw_snapshot = file.getvalue()
+    assert loadDecks(io.BytesIO(raw_snapshot)) == decks
+
+    loaders = {
+        "json + fromJson": (
+            raw_json,
+            lambda: [Deck.fromJson(x) for x in json.loads(raw_json)],
+        ),
+        "pickle": (raw_pickle, lambda: pickle.loads(raw_pickle)),
+        "snapshot": (raw_snapshot, lambda: loadDecks(io.BytesIO(raw_snapshot))),
+    }
+    baseline = None
+    print(
+        f"{args.decks} decks of {args.cards} cards, snapshot written in {dumped * 1e3:.1f} ms"
+    )
+    for name, (raw, load) in loaders.items():
+        elapsed = _best(load, args.repeat)
+        baseline = baseline or elapsed
+        print(
+            f"{name:<16} {len(raw) / 2**20:8.2f} MiB {elapsed * 1e3:9.1f} ms "
+            f"{baseline / elapsed:6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Ingestion throughput and indexed queries of the SQLite deck store
+
+Decks are generated and built a chunk at a time, so memory stays flat however many decks are ingested, and only
+storing them is timed.
+
+Run from the repository root:
+    python -m benchmarks.bench_store [--decks N] [--cards N] [--batch-size N] [--path FILE]
+"""
+
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.formats import Format
+from pyrchidekt.registry import CardRegistry
+from pyrchidekt.store import DeckStore
+from pyrchidekt.synthetic import defaultPool, generateDeck
+from time import perf_counter
+import argparse
+import os
+import tempfile
+
+CHUNK = 2000
+
+
+def _time(name: str, query, repeat: int = 20) -> None:
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        result = query()
+        timings.append(perf_counter() - start)
+    print(f"{name:<44} {min(timings) * 1e3:9.2f} ms  {len(result):>7} decks")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks", type=int, default=100_000)
+    parser.add_argument("--cards", type=int, default=60)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--path", help="the database file, a temporary one by default")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.path or os.path.join(directory, "decks.sqlite")
+        registry = CardRegistry()
+        pool = defaultPool()
+        stored = 0
+        elapsed = 0.0
+        with DeckStore(path) as store:
+            for start in range(0, args.decks, CHUNK):
+                decks = [
+                    Deck.fromJson(
+                        generateDeck(x, args.cards, pool=pool), registry=registry
+                    )
+                    for x in range(start, min(start + CHUNK, args.decks))
+                ]
+                begin = perf_counter()
+                stored += store.extend(decks, batch_size=args.batch_size)
+                elapsed += perf_counter() - begin
+            print(
+                f"ingested {stored} decks of {args.cards} cards in {elapsed:.1f} s: "
+                f"{stored / elapsed:.0f} decks/s, {stored * args.cards / elapsed:.0f} cards/s, "
+                f"{os.path.getsize(path) / 2**20:.0f} MiB"
+            )
+
+            deck = store.getDeck(0)
+            card = deck.cards[-1].card.oracle_card.name
+            after = deck.updated_at
+            _time(f"find(card={card[:20]!r})", lambda: store.find(card=card))
+            _time(
+                "find(format=COMMANDER, updated_after=...)",
+                lambda: store.find(format=Format.COMMANDER, updated_after=after),
+                repeat=3,
+            )
+            _time(
+                f"find(owner={deck.owner.username!r})",
+                lambda: store.find(owner=deck.owner.username),
+            )
+            _time(
+                "getDeck",
+                lambda: [
+                    store.getDeck(x) for x in range(0, stored, stored // 100 or 1)
+                ],
+                repeat=3,
+            )
+
+
+if __name__ == "__main__":
+    main()
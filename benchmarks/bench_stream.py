@@ -0,0 +1,91 @@
+"""
+Peak memory of reading a large deck file whole versus streaming it with `DeckStream`
+
+Each measurement runs in its own subprocess so the peak resident set size reported by the OS belongs to that
+measurement alone. Loading reads the file with `json.load` and builds a `Deck`; streaming builds each card from
+a `DeckStream` and lets it go, as a consumer that only aggregates over the cards would.
+
+Run from the repository root:
+    python -m benchmarks.bench_stream [--sizes N ...]
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+_LOAD = """
+import json, sys
+from pyrchidekt.deck import Deck
+with open(sys.argv[1], "rb") as f:
+    deck = Deck.fromJson(json.load(f))
+total = sum(x.quantity for x in deck.cards)
+"""
+
+_STREAM = """
+import sys
+from pyrchidekt.stream import DeckStream
+from pyrchidekt.synthetic import generateDeck
+with open(sys.argv[1], "rb") as f:
+    total = sum(x.quantity for x in DeckStream(f))
+"""
+
+_BASELINE = """
+import sys
+import pyrchidekt.deck, pyrchidekt.stream
+"""
+
+# ru_maxrss carries over the parent's peak through fork, so prefer the peak of this process's own memory
+_REPORT = """
+import resource
+try:
+    with open("/proc/self/status") as status:
+        print(next(x for x in status if x.startswith("VmHWM")).split()[1])
+except OSError:
+    print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def _peak(script: str, path: str) -> tuple:
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", script + _REPORT, path],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    # Both are in KiB on Linux
+    return int(output.split()[-1]), time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "deck.json")
+        baseline, _ = _peak(_BASELINE, path)
+        print(f"interpreter and imports: {baseline / 1024:.1f} MiB")
+        print(
+            f"{'cards':>6} {'file':>10} {'load peak':>11} {'time':>7} "
+            f"{'stream peak':>12} {'time':>7}"
+        )
+        for size in args.sizes:
+            with open(path, "w") as f:
+                json.dump(generateDeck(1, size), f)
+            file_size = os.path.getsize(path)
+            load, load_time = _peak(_LOAD, path)
+            stream, stream_time = _peak(_STREAM, path)
+            print(
+                f"{size:>6} {file_size / 2**20:6.1f} MiB {load / 1024:7.1f} MiB "
+                f"{load_time:6.2f}s {stream / 1024:8.1f} MiB {stream_time:6.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Refreshing a deck with `Deck.applyUpdate` against building it again with `Deck.fromJson`
+
+The deck is refreshed alternately from two versions that differ by a handful of edits: cards with another
+quantity, one removed and one added.
+
+Run from the repository root:
+    python -m benchmarks.bench_update [--cards N] [--edits N] [--repeat N]
+"""
+
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.synthetic import generateDeck
+from time import perf_counter
+import argparse
+import copy
+
+
+def _edited(data: dict, edits: int) -> dict:
+    edited = copy.deepcopy(data)
+    for card in edited["cards"][:edits]:
+        card["quantity"] += 1
+        card["updatedAt"] = "2030-01-01T00:00:00.000000Z"
+    added = copy.deepcopy(edited["cards"].pop())
+    added["id"] = 1
+    edited["cards"].append(added)
+    return edited
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--edits", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    versions = [generateDeck(1, args.cards)]
+    versions.append(_edited(versions[0], args.edits))
+
+    start = perf_counter()
+    for i in range(args.repeat):
+        Deck.fromJson(versions[i % 2])
+    rebuild = (perf_counter() - start) / args.repeat
+
+    deck = Deck.fromJson(versions[0])
+    start = perf_counter()
+    for i in range(args.repeat):
+        deck.applyUpdate(versions[(i + 1) % 2])
+    update = (perf_counter() - start) / args.repeat
+    assert deck == Deck.fromJson(versions[args.repeat % 2])
+
+    print(f"{args.cards} cards, {args.edits} edited, 1 removed, 1 added")
+    print(f"Deck.fromJson     {rebuild * 1e6:9.1f} us")
+    print(f"Deck.applyUpdate  {update * 1e6:9.1f} us  {rebuild / update:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+Benchmark suite for building decks, from raw JSON through every nested `fromJson` to the full client round trip
+
+Every benchmark runs on synthetic decks (see `benchmarks.synthetic`) at each deck size, so runs on the same code
+are comparable. Results can be written as JSON and compared against an earlier run to catch regressions.
+
+Run from the repository root:
+    python -m benchmarks.suite [--sizes 60 100 1000 10000] [--filter NAME] [--output FILE] [--compare FILE]
+"""
+
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+from pyrchidekt.api import ArchidektClient
+from pyrchidekt.cards import ArchidektCard, Card, OracleCard
+from pyrchidekt.categories import Category
+from pyrchidekt.deck import Deck
+from pyrchidekt.decode import FAST_DECODE, decodeDeck
+from pyrchidekt.edition import Edition
+from pyrchidekt.formats import Legalities
+from pyrchidekt.mana import ManaProduction
+from pyrchidekt.mockserver import MockArchidekt
+from pyrchidekt.owner import Owner
+from pyrchidekt.synthetic import generateDeck
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Tuple
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+
+SIZES = (60, 100, 1000, 10000)
+"""`Tuple[int, ...]` The default deck sizes, from a 60 card constructed deck to a 10,000 card collection"""
+
+SCHEMA = 1
+"""`int` The version of the results file layout"""
+
+
+@dataclass
+class Result:
+    """The timing of one benchmark at one deck size
+
+    Attributes:
+        name: `str` The benchmark
+
+        cards: `int` The number of card entries of the deck
+
+        loops: `int` How many calls each repeat timed
+
+        best: `float` Seconds per call of the fastest repeat, the figure compared between runs
+
+        median: `float` Seconds per call of the median repeat
+    """
+
+    name: str
+    cards: int
+    loops: int
+    best: float
+    median: float
+
+    @property
+    def per_card(self) -> float:
+        return self.best / self.cards
+
+
+def benchmarks(
+    cards: int, server: MockArchidekt
+) -> Iterator[Tuple[str, Callable[[], object]]]:
+    """Yields every benchmark for a deck size, as its name and the call to time
+
+    Arguments:
+        cards: `int` The number of card entries of the deck
+
+        server: `MockArchidekt` The server the client benchmarks fetch from. Its body is set to the deck.
+
+    Returns:
+        An iterator of `(name, call)` pairs
+    """
+    data = generateDeck(1, cards)
+    raw = json.dumps(data).encode()
+    entries = data["cards"]
+    printings = [x["card"] for x in entries]
+    oracle_cards = [x["oracleCard"] for x in printings]
+
+    yield "json.loads", lambda: json.loads(raw)
+    yield "Deck.fromJson", lambda: Deck.fromJson(data)
+    yield "Deck.fromJson(lazy)", lambda: Deck.fromJson(data, lazy=True)
+    yield "decodeDeck", lambda: decodeDeck(raw)
+    yield "ArchidektCard.fromJson", lambda: [ArchidektCard.fromJson(x) for x in entries]
+    yield "Card.fromJson", lambda: [Card.fromJson(x) for x in printings]
+    yield "OracleCard.fromJson", lambda: [OracleCard.fromJson(x) for x in oracle_cards]
+    yield "Edition.fromJson", lambda: [
+        Edition.fromJson(x["edition"]) for x in printings
+    ]
+    yield "Legalities.fromJson", lambda: [
+        Legalities.fromJson(x["legalities"]) for x in oracle_cards
+    ]
+    yield "ManaProduction.fromJson", lambda: [
+        ManaProduction.fromJson(x["manaProduction"]) for x in oracle_cards
+    ]
+    yield "Category.fromJson", lambda: [
+        Category.fromJson(x) for x in data["categories"]
+    ]
+    yield "Owner.fromJson", lambda: Owner.fromJson(data["owner"])
+
+    deck = Deck.fromJson(data)
+    yield "Deck.linkCategories", deck.linkCategories
+
+    server.body = raw
+    client = ArchidektClient(base_url=server.base_url)
+    try:
+        yield "getDeckById", lambda: client.getDeckById(1)
+    finally:
+        client.close()
+
+
+def measure(
+    name: str, cards: int, call: Callable[[], object], repeat: int, min_time: float
+) -> Result:
+    """Times a call, calibrating the number of loops so each repeat takes at least `min_time`
+
+    Arguments:
+        name: `str` The benchmark
+
+        cards: `int` The deck size
+
+        call: `Callable[[], object]` What to time
+
+        repeat: `int` How many times to time the loops
+
+        min_time: `float` The least number of seconds a repeat should take
+
+    Returns:
+        The `Result`
+    """
+    loops = 1
+    while True:
+        elapsed = _time(call, loops)
+        if elapsed >= min_time:
+            break
+        loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9)))
+    timings = [_time(call, loops) / loops for _ in range(repeat)]
+    return Result(name, cards, loops, min(timings), statistics.median(timings))
+
+
+def _time(call: Callable[[], object], loops: int) -> float:
+    gc.collect()
+    start = perf_counter()
+    for _ in range(loops):
+        call()
+    return perf_counter() - start
+
+
+def run(
+    sizes: Tuple[int, ...] = SIZES,
+    filter: str | None = None,
+    repeat: int = 5,
+    min_time: float = 0.1,
+) -> List[Result]:
+    """Runs the suite, printing each result as it is measured
+
+    Arguments:
+        sizes: `Tuple[int, ...]` The deck sizes
+
+        filter: `str | None` Only run the benchmarks with this in their name
+
+        repeat: `int` How many times to time each benchmark
+
+        min_time: `float` The least number of seconds each repeat should take
+
+    Returns:
+        Every `Result`
+    """
+    server = MockArchidekt().start()
+    retval = []
+    try:
+        for cards in sizes:
+            for name, call in benchmarks(cards, server):
+                if filter and filter not in name:
+                    continue
+                result = measure(name, cards, call, repeat, min_time)
+                retval.append(result)
+                print(
+                    f"{name:<24} {cards:>6} cards {result.best * 1e3:10.3f} ms "
+                    f"{result.per_card * 1e6:8.2f} us/card"
+                )
+    finally:
+        server.stop()
+    return retval
+
+
+def metadata() -> Dict[str, object]:
+    """Describes the environment the suite ran in, to tell apart results from different setups"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "schema": SCHEMA,
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "fast_decode": FAST_DECODE,
+    }
+
+
+def compare(results: List[Result], baseline: dict, threshold: float) -> List[str]:
+    """Compares results against an earlier run, printing the change of each benchmark
+
+    Arguments:
+        results: `List[Result]` This run
+
+        baseline: `dict` The earlier run, as written with `--output`
+
+        threshold: `float` The relative slowdown that counts as a regression, such as 0.1 for 10%
+
+    Returns:
+        The names, with sizes, of the benchmarks that regressed
+    """
+    before = {(x["name"], x["cards"]): x["best"] for x in baseline["results"]}
+    regressions = []
+    for result in results:
+        previous = before.get((result.name, result.cards))
+        if previous is None:
+            continue
+        change = result.best / previous - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(f"{result.name}[{result.cards}]")
+        print(f"{result.name:<24} {result.cards:>6} cards {change:+8.1%}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--filter", help="only run benchmarks with this in their name")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="compare against results written earlier")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = run(tuple(args.sizes), args.filter, args.repeat, args.min_time)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "meta": metadata(),
+                    "results": [asdict(x) | {"per_card": x.per_card} for x in results],
+                },
+                f,
+                indent=2,
+            )
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print()
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regressions: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Python wrapper around the Archidekt API
+
+The public API is available from the package itself, `from pyrchidekt import Deck, getDeckById`. Each name is
+imported from its submodule on first use, so `import pyrchidekt` is cheap and dependencies such as requests are
+only loaded by what needs them: parsing JSON with `Deck.fromJson` uses the standard library alone.
+"""
+
+from __future__ import annotations
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+_EXPORTS = {
+    "ArchidektCard": "cards",
+    "Card": "cards",
+    "LazyCardList": "cards",
+    "OracleCard": "cards",
+    "Category": "categories",
+    "Deck": "deck",
+    "Edition": "edition",
+    "Format": "formats",
+    "Legalities": "formats",
+    "ManaProduction": "mana",
+    "ManaCost": "mana",
+    "parseManaCost": "mana",
+    "Owner": "owner",
+    "Projection": "projection",
+    "SkippedFieldError": "projection",
+    "CardRegistry": "registry",
+    "DeckStream": "stream",
+    "DeckStore": "store",
+    "DeckCorpus": "corpus",
+    "DeckCache": "cache",
+    "DiskCache": "cache",
+    "ArchidektClient": "api",
+    "DeckFetchError": "api",
+    "DeckNotFoundError": "api",
+    "DeckResult": "api",
+    "getDeckById": "api",
+    "getDecksByIds": "api",
+    "AsyncArchidektClient": "aio",
+    "decodeDeck": "decode",
+    "DeckDiff": "diff",
+    "checkLegality": "legality",
+    "LegalityReport": "legality",
+    "MetricsRecorder": "metrics",
+    "setMetrics": "metrics",
+}
+
+__all__ = sorted(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .aio import AsyncArchidektClient
+    from .api import (
+        ArchidektClient,
+        DeckFetchError,
+        DeckNotFoundError,
+        DeckResult,
+        getDeckById,
+        getDecksByIds,
+    )
+    from .cache import DeckCache, DiskCache
+    from .cards import ArchidektCard, Card, LazyCardList, OracleCard
+    from .categories import Category
+    from .corpus import DeckCorpus
+    from .deck import Deck
+    from .decode import decodeDeck
+    from .diff import DeckDiff
+    from .edition import Edition
+    from .formats import Format, Legalities
+    from .legality import LegalityReport, checkLegality
+    from .mana import ManaCost, ManaProduction, parseManaCost
+    from .metrics import MetricsRecorder, setMetrics
+    from .owner import Owner
+    from .projection import Projection, SkippedFieldError
+    from .registry import CardRegistry
+    from .store import DeckStore
+    from .stream import DeckStream
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    # Kept as a module attribute, so later lookups don't come back here
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,181 @@
+"""
+Asyncio api for retrieving decks, including bounded-concurrency bulk fetching
+"""
+
+from __future__ import annotations
+from .api import ARCHIDEKT_API_BASE, ArchidektClient, DeckResult
+from .cache import DeckCache, DiskCache
+from .deck import Deck
+from .registry import CardRegistry
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterator, Iterable, Tuple
+import asyncio
+
+
+class AsyncArchidektClient:
+    """Asyncio client for the Archidekt API
+
+    Requests are made by a pooled `ArchidektClient` on a dedicated thread pool so the event loop never blocks
+    on the network. Turning the JSON into a `Deck` with `decodeDeck` also happens off the event loop, on
+    `hydrate_executor`, so that parsing big decks doesn't stall other I/O. Pass a
+    `concurrent.futures.ProcessPoolExecutor` there to parse on several cores, though a deck cache and a registry
+    are only used when decks are built in this process.
+
+    Attributes:
+        client: `ArchidektClient` The synchronous client making the requests
+
+        max_connections: `int` The maximum number of requests in flight at once
+    """
+
+    def __init__(
+        self,
+        base_url: str = ARCHIDEKT_API_BASE,
+        max_connections: int = 10,
+        timeout: float | Tuple[float, float] | None = None,
+        retries: int = 0,
+        hydrate_executor: Executor | None = None,
+        cache: DiskCache | None = None,
+        deck_cache: DeckCache | None = None,
+        registry: CardRegistry | None = None,
+    ):
+        """Creates the client, its connection pool and its request threads
+
+        Arguments:
+            base_url: `str` The root of the API, ending in a slash
+
+            max_connections: `int` The maximum number of requests in flight and of pooled connections
+
+            timeout: `float | Tuple[float, float] | None` The request timeout
+
+            retries: `int` How many times to retry failed connections
+
+            hydrate_executor: `Executor | None` Where decks are decoded. Defaults to the event loop's
+            default executor.
+
+            cache: `DiskCache | None` An optional cache of deck JSON
+
+            deck_cache: `DeckCache | None` An optional cache of built decks
+
+            registry: `CardRegistry | None` An optional registry of shared oracle cards and editions
+        """
+        self.max_connections = max_connections
+        self.client = ArchidektClient(
+            base_url=base_url,
+            pool_maxsize=max_connections,
+            timeout=timeout,
+            retries=retries,
+            cache=cache,
+            deck_cache=deck_cache,
+            registry=registry,
+        )
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=max_connections, thread_name_prefix="pyrchidekt-io"
+        )
+        self._hydrate_executor = hydrate_executor
+
+    async def __aenter__(self: AsyncArchidektClient) -> AsyncArchidektClient:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops the request threads and closes all pooled connections"""
+        self._io_executor.shutdown(wait=False, cancel_futures=True)
+        self.client.close()
+
+    async def get_deck_json(self, id: int) -> dict:
+        """Retrieves the raw JSON of a deck
+
+        Arguments:
+            id: `int` The ID of the deck
+
+        Returns:
+            The JSON deserialized `dict` of the deck
+
+        Raises:
+            DeckNotFoundError: The deck doesn't exist or is private
+
+            DeckFetchError: The deck can't be retrieved for some other reason
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_executor, self.client.getDeckJson, id
+        )
+
+    async def get_deck(self, id: int) -> Deck:
+        """Retrieves a deck by id from Archidekt
+
+        Arguments:
+            id: `int` The ID of the deck
+
+        Returns:
+            The `Deck` object
+
+        Raises:
+            DeckNotFoundError: The deck doesn't exist or is private
+
+            DeckFetchError: The deck can't be retrieved for some other reason
+        """
+        from .decode import decodeDeck
+
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(
+            self._io_executor, self.client.getDeckBytes, id
+        )
+        if self.client.deck_cache is None and self.client.registry is None:
+            return await loop.run_in_executor(self._hydrate_executor, decodeDeck, data)
+        return await loop.run_in_executor(
+            self._hydrate_executor, self.client.hydrate, data
+        )
+
+    async def get_decks(
+        self, ids: Iterable[int], concurrency: int | None = None
+    ) -> AsyncIterator[DeckResult]:
+        """Retrieves many decks, yielding each one as soon as it is ready
+
+        At most `concurrency` decks are being fetched or parsed at any time, and `ids` is consumed lazily so
+        it may be a very long or unbounded iterable. Results come back in completion order. A deck that fails
+        doesn't stop the batch: its `DeckResult` carries the error instead.
+
+        ```python
+        async with AsyncArchidektClient() as client:
+            async for result in client.get_decks(ids, concurrency=32):
+                if result.ok:
+                    print(result.deck.name)
+        ```
+
+        Arguments:
+            ids: `Iterable[int]` The IDs of the decks
+
+            concurrency: `int | None` How many decks to work on at once. Defaults to `max_connections`.
+
+        Returns:
+            An async iterator of `DeckResult`s
+        """
+        concurrency = concurrency or self.max_connections
+        ids = iter(ids)
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def worker() -> None:
+            for id in ids:
+                try:
+                    result = DeckResult(id, deck=await self.get_deck(id))
+                except Exception as e:
+                    result = DeckResult(id, error=e)
+                await results.put(result)
+            await results.put(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                result = await results.get()
+                if result is None:
+                    running -= 1
+                else:
+                    yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,101 @@
+"""
+Colored pip, devotion and mana source statistics of a deck
+"""
+
+from __future__ import annotations
+from .deck import Deck
+from .mana import COLORS
+from typing import Dict, Iterator, Tuple
+
+_NONPERMANENT_TYPES = {"Instant", "Sorcery"}
+
+
+def pipCounts(deck: Deck) -> Dict[str, int]:
+    """Counts the colored pips in the mana costs of the nonland cards in the deck
+
+    Only the front face of each card is counted, and only cards that count towards the deck (see
+    `Deck.isIncluded`), weighted by their quantity. Hybrid symbols count as a pip of each of their colors.
+
+    Arguments:
+        deck: `Deck` The deck
+
+    Returns:
+        The number of pips of each of `COLORS`
+    """
+    retval = dict.fromkeys(COLORS, 0)
+    for card, quantity in _included(deck):
+        oracle_card = card.card.oracle_card
+        if "Land" in (oracle_card.types or ()):
+            continue
+        for color, pips in oracle_card.manaCosts()[0].pips.items():
+            retval[color] += pips * quantity
+    return retval
+
+
+def devotion(deck: Deck) -> Dict[str, int]:
+    """Counts the deck's devotion to each color: the colored pips in the mana costs of its permanent cards
+
+    As in `pipCounts`, only front faces of cards that count towards the deck are counted.
+
+    Arguments:
+        deck: `Deck` The deck
+
+    Returns:
+        The devotion to each of `COLORS`
+    """
+    retval = dict.fromkeys(COLORS, 0)
+    for card, quantity in _included(deck):
+        oracle_card = card.card.oracle_card
+        if _NONPERMANENT_TYPES.intersection(oracle_card.types or ()):
+            continue
+        for color, pips in oracle_card.manaCosts()[0].pips.items():
+            retval[color] += pips * quantity
+    return retval
+
+
+def colorSources(deck: Deck) -> Dict[str, int]:
+    """Counts the cards in the deck that can produce each color of mana, according to their `ManaProduction`
+
+    Arguments:
+        deck: `Deck` The deck
+
+    Returns:
+        The number of sources of each of `COLORS`
+    """
+    retval = dict.fromkeys(COLORS, 0)
+    for card, quantity in _included(deck):
+        production = card.card.oracle_card.mana_production
+        amounts = (
+            production.white,
+            production.blue,
+            production.black,
+            production.red,
+            production.green,
+        )
+        for color, amount in zip(COLORS, amounts):
+            if amount:
+                retval[color] += quantity
+    return retval
+
+
+def sourceRatios(deck: Deck) -> Dict[str, float | None]:
+    """Compares the mana sources of each color to the pips that need them
+
+    A ratio below the deck's average points at a color the mana base is short of.
+
+    Arguments:
+        deck: `Deck` The deck
+
+    Returns:
+        The number of sources of each of `COLORS` per pip of it, `None` for colors without pips
+    """
+    pips = pipCounts(deck)
+    sources = colorSources(deck)
+    return {x: sources[x] / pips[x] if pips[x] else None for x in COLORS}
+
+
+def _included(deck: Deck) -> Iterator[Tuple]:
+    inclusions = deck.inclusions()
+    for card in deck.cards:
+        if inclusions.get(card.primary_category, (True, True))[0]:
+            yield card, card.quantity
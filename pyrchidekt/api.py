@@ -2,17 +2,472 @@
 This is the api querying that will return decks based on ID
 """
 
+from __future__ import annotations
+from .cache import DeckCache, DiskCache
 from .deck import Deck
-import requests
+from .metrics import (
+    BYTES,
+    CACHE_HITS,
+    CACHE_MISSES,
+    CONNECT,
+    DECK_CACHE_HITS,
+    DECK_CACHE_MISSES,
+    DECODE,
+    ERRORS,
+    RETRIES,
+    TRANSFER,
+    Metrics,
+    getMetrics,
+)
+from .registry import CardRegistry
+from .stream import DeckStream
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Lock
+from time import perf_counter
+from typing import Iterable, Iterator, Tuple
+import json
+import os
 
-ARCHIDEKT_API_BASE = "https://www.archidekt.com/api/"
+ARCHIDEKT_API_BASE = os.environ.get(
+    "PYRCHIDEKT_API_BASE", "https://www.archidekt.com/api/"
+)
+"""`str` The default root of the API. Set the `PYRCHIDEKT_API_BASE` environment variable to point every client,
+including the default one, at another server such as `pyrchidekt.mockserver`."""
 DECK_SEARCH_ENDPOINT = ARCHIDEKT_API_BASE + "decks/{}/"
 
 
+class DeckFetchError(RuntimeError):
+    """Raised when a deck can't be retrieved from Archidekt
+
+    Attributes:
+        deck_id: `int` The ID of the deck that was requested
+
+        status_code: `int | None` The HTTP status code of the response, if there was one
+    """
+
+    def __init__(self, message: str, deck_id: int, status_code: int | None = None):
+        super().__init__(message)
+        self.deck_id = deck_id
+        self.status_code = status_code
+
+
+class DeckNotFoundError(DeckFetchError):
+    """Raised when a deck either doesn't exist or is private"""
+
+
+@dataclass
+class DeckResult:
+    """The outcome of fetching one deck in a batch
+
+    Batch fetches report failures per deck instead of aborting, so exactly one of `deck` and `error` is set.
+
+    Attributes:
+        id: `int` The ID of the requested deck
+
+        deck: `Deck | None` The deck, if it was retrieved
+
+        error: `Exception | None` What went wrong, if the deck couldn't be retrieved. HTTP failures are
+        `DeckFetchError`s, anything else (connection errors, malformed data) is passed through as raised.
+    """
+
+    id: int
+    deck: Deck | None = field(default=None)
+    error: Exception | None = field(default=None)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ArchidektClient:
+    """Pooled HTTP client for the Archidekt API
+
+    This client owns a `requests.Session` so that connections to Archidekt are kept alive and reused between
+    requests instead of paying a fresh TCP and TLS handshake for every deck. A single client is safe to share
+    between threads.
+
+    When a metrics sink is installed with `pyrchidekt.metrics.setMetrics`, the client reports the time spent
+    in each phase of loading a deck (`CONNECT`, `TRANSFER`, `DECODE`, `HYDRATE`) along with response sizes,
+    retries, errors and cache hits.
+
+    Attributes:
+        base_url: `str` The root of the API. Point this at a local server to avoid hitting Archidekt.
+
+        timeout: `float | Tuple[float, float] | None` The timeout passed to every request, either a single
+        value or a `(connect, read)` tuple. `None` waits forever.
+
+        session: `requests.Session` The pooled session used for all requests
+
+        cache: `DiskCache | None` Where deck JSON is looked up before, and stored after, going to the network
+
+        deck_cache: `DeckCache | None` Where built decks are looked up before, and stored after, building them
+
+        registry: `CardRegistry | None` Shares oracle cards and editions between the decks this client builds
+    """
+
+    def __init__(
+        self,
+        base_url: str = ARCHIDEKT_API_BASE,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        timeout: float | Tuple[float, float] | None = None,
+        retries: int = 0,
+        cache: DiskCache | None = None,
+        deck_cache: DeckCache | None = None,
+        registry: CardRegistry | None = None,
+    ):
+        """Creates the client and its connection pool
+
+        Arguments:
+            base_url: `str` The root of the API, ending in a slash
+
+            pool_connections: `int` The number of distinct hosts to keep pools for
+
+            pool_maxsize: `int` The maximum number of kept-alive connections per host. This should be at least
+            the number of threads sharing the client.
+
+            timeout: `float | Tuple[float, float] | None` The request timeout
+
+            retries: `int` How many times to retry failed connections
+
+            cache: `DiskCache | None` An optional cache of deck JSON
+
+            deck_cache: `DeckCache | None` An optional cache of built decks
+
+            registry: `CardRegistry | None` An optional registry of shared oracle cards and editions
+        """
+        # Imported here so that parsing decks, which doesn't need requests, never loads it
+        from requests.adapters import HTTPAdapter
+        import requests
+
+        if not base_url.endswith("/"):
+            base_url += "/"
+        self.base_url = base_url
+        self.timeout = timeout
+        self.cache = cache
+        self.deck_cache = deck_cache
+        self.registry = registry
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retries,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self: ArchidektClient) -> ArchidektClient:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes all pooled connections"""
+        self.session.close()
+
+    def deckUrl(self, id: int) -> str:
+        """Returns the URL of a deck on the configured API
+
+        Arguments:
+            id: `int` The ID of the deck
+
+        Returns:
+            The URL of the deck endpoint
+        """
+        return f"{self.base_url}decks/{id}/"
+
+    def getDeckJson(self, id: int) -> dict:
+        """Retrieves the raw JSON of a deck
+
+        Arguments:
+            id: `int` The ID of the deck
+
+        Returns:
+            The JSON deserialized `dict` of the deck
+
+        Raises:
+            DeckNotFoundError: The deck doesn't exist or is private
+
+            DeckFetchError: The deck can't be retrieved for some other reason
+        """
+        raw = self.getDeckBytes(id)
+        metrics = getMetrics()
+        if metrics is None:
+            return json.loads(raw)
+        start = perf_counter()
+        data = json.loads(raw)
+        metrics.timing(DECODE, perf_counter() - start)
+        return data
+
+    def getDeckBytes(self, id: int) -> bytes:
+        """Retrieves the JSON of a deck as the raw bytes of the response
+
+        Arguments:
+            id: `int` The ID of the deck
+
+        Returns:
+            The undecoded JSON of the deck
+
+        Raises:
+            DeckNotFoundError: The deck doesn't exist or is private
+
+            DeckFetchError: The deck can't be retrieved for some other reason
+        """
+        metrics = getMetrics()
+        if self.cache is not None:
+            cached = self.cache.get(id)
+            if metrics is not None:
+                metrics.count(CACHE_MISSES if cached is None else CACHE_HITS)
+            if cached is not None:
+                return cached
+
+        if metrics is None:
+            response = self.session.get(self.deckUrl(id), timeout=self.timeout)
+            checkResponse(id, response.status_code)
+            content = response.content
+        else:
+            content = self._measuredGet(id, metrics)
+        if self.cache is not None:
+            self.cache.set(id, content)
+        return content
+
+    def _measuredGet(self, id: int, metrics: Metrics) -> bytes:
+        # Streaming the body apart from the headers splits the wait for the server from the transfer
+        start = perf_counter()
+        response = self.session.get(self.deckUrl(id), timeout=self.timeout, stream=True)
+        headers_at = perf_counter()
+        metrics.timing(CONNECT, headers_at - start)
+        retries = response.raw.retries
+        if retries is not None and retries.history:
+            metrics.count(RETRIES, len(retries.history))
+        try:
+            checkResponse(id, response.status_code)
+        except DeckFetchError:
+            metrics.count(ERRORS)
+            response.close()
+            raise
+        content = response.content
+        metrics.timing(TRANSFER, perf_counter() - headers_at)
+        metrics.count(BYTES, len(content))
+        return content
+
+    def getDeckById(self, id: int) -> Deck:
+        """Retrieves a deck by id from Archidekt
+
+        Arguments:
+            id: `int` The ID of the deck
+
+        Returns:
+            The `Deck` object.
+
+        Raises:
+            DeckNotFoundError: The deck doesn't exist or is private
+
+            DeckFetchError: The deck can't be retrieved for some other reason
+        """
+        return self.hydrate(self.getDeckBytes(id))
+
+    def streamDeckById(self, id: int, chunk_size: int = 65536) -> DeckStream:
+        """Retrieves a deck as a stream of its cards, parsed while the response is still arriving
+
+        Memory use stays roughly constant whatever the size of the deck, see `DeckStream`. Streamed decks
+        don't go through the caches.
+
+        Arguments:
+            id: `int` The ID of the deck
+
+            chunk_size: `int` How many bytes of the response to read at once
+
+        Returns:
+            The `DeckStream` of the deck
+
+        Raises:
+            DeckNotFoundError: The deck doesn't exist or is private
+
+            DeckFetchError: The deck can't be retrieved for some other reason
+        """
+        response = self.session.get(self.deckUrl(id), timeout=self.timeout, stream=True)
+        try:
+            checkResponse(id, response.status_code)
+        except DeckFetchError:
+            response.close()
+            raise
+        return DeckStream(response.iter_content(chunk_size), self.registry)
+
+    def hydrate(self, data: dict | bytes) -> Deck:
+        """Builds a deck from its JSON, reusing the deck cache when the deck hasn't changed
+
+        Raw bytes are decoded with the fast decoder when msgspec is installed, see `pyrchidekt.decode`. Oracle
+        cards and editions are shared through the registry, if the client has one.
+
+        Arguments:
+            data: `dict | bytes` The JSON deserialized deck, or its raw JSON
+
+        Returns:
+            The `Deck` object
+        """
+        # Imported here, as the decoder loads msgspec
+        from .decode import FAST_DECODE, decodeDeck, decodeDeckVersion
+
+        metrics = getMetrics()
+        if isinstance(data, (bytes, bytearray)) and not FAST_DECODE:
+            if metrics is None:
+                data = json.loads(data)
+            else:
+                start = perf_counter()
+                data = json.loads(data)
+                metrics.timing(DECODE, perf_counter() - start)
+
+        if self.deck_cache is not None:
+            if isinstance(data, dict):
+                id, updated_at = data["id"], datetime.fromisoformat(data["updatedAt"])
+            else:
+                id, updated_at = decodeDeckVersion(data)
+            deck = self.deck_cache.get(id, updated_at)
+            if metrics is not None:
+                metrics.count(DECK_CACHE_MISSES if deck is None else DECK_CACHE_HITS)
+            if deck is not None:
+                return deck
+
+        if isinstance(data, dict):
+            deck = Deck.fromJson(data, self.registry)
+        else:
+            deck = decodeDeck(data, self.registry)
+        if self.deck_cache is not None:
+            self.deck_cache.put(deck)
+        return deck
+
+    def getDeckResult(self, id: int) -> DeckResult:
+        """Retrieves a deck, capturing any failure in the result instead of raising
+
+        Arguments:
+            id: `int` The ID of the deck
+
+        Returns:
+            The `DeckResult` for the deck
+        """
+        try:
+            return DeckResult(id, deck=self.getDeckById(id))
+        except Exception as e:
+            return DeckResult(id, error=e)
+
+    def getDecksByIds(
+        self, ids: Iterable[int], max_workers: int = 10, ordered: bool = True
+    ) -> Iterator[DeckResult]:
+        """Retrieves many decks using a pool of threads sharing this client's connections
+
+        Each deck is fetched and parsed on a worker thread. Failures are reported per deck in the results
+        rather than raised. `ids` is consumed lazily and only a couple of decks per worker are held at any
+        time, so very long id lists are fine. For full parallelism, `max_workers` shouldn't exceed the
+        client's `pool_maxsize`.
+
+        Arguments:
+            ids: `Iterable[int]` The IDs of the decks
+
+            max_workers: `int` The number of worker threads
+
+            ordered: `bool` If `True` results are yielded in the order of `ids`, otherwise they are yielded as
+            soon as each one completes
+
+        Returns:
+            An iterator of `DeckResult`s
+        """
+        ids = iter(ids)
+        window = max_workers * 2
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pyrchidekt"
+        ) as executor:
+            if ordered:
+                pending = deque()
+                for id in ids:
+                    pending.append(executor.submit(self.getDeckResult, id))
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            else:
+                pending = set()
+                for id in ids:
+                    pending.add(executor.submit(self.getDeckResult, id))
+                    if len(pending) >= window:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+
+def checkResponse(id: int, status_code: int) -> None:
+    """Raises the matching error for an unsuccessful deck response
+
+    Arguments:
+        id: `int` The ID of the requested deck
+
+        status_code: `int` The HTTP status code of the response
+
+    Raises:
+        DeckNotFoundError: On a 404, the deck doesn't exist or is private
+
+        DeckFetchError: On any other status than 200
+    """
+    match status_code:
+        case 200:
+            return
+        case 404:
+            raise DeckNotFoundError(
+                f"{id} is either not a valid deck or it's private", id, status_code
+            )
+        case _:
+            raise DeckFetchError(
+                f"Unknown error trying to retrieve deck {id}", id, status_code
+            )
+
+
+_default_client: ArchidektClient | None = None
+_default_client_lock = Lock()
+
+
+def getDefaultClient() -> ArchidektClient:
+    """Returns the module-level client used by `getDeckById`
+
+    The client is created on first use with the default settings. Threads calling this at the same time all get
+    the same client.
+
+    Returns:
+        The default `ArchidektClient`
+    """
+    global _default_client
+    client = _default_client
+    if client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = ArchidektClient()
+            client = _default_client
+    return client
+
+
+def setDefaultClient(client: ArchidektClient) -> None:
+    """Replaces the module-level client used by `getDeckById`
+
+    Arguments:
+        client: `ArchidektClient` The client to use from now on
+    """
+    global _default_client
+    with _default_client_lock:
+        _default_client = client
+
+
 def getDeckById(id: int) -> Deck:
     """Retrieves a deck by id from Archidekt
 
-    This queries the Archidekt API to retrieve the deck, returning the object representing the deck.
+    This queries the Archidekt API to retrieve the deck, returning the object representing the deck. Requests
+    go through the pooled default client, see `getDefaultClient`.
 
     Args:
         id: `int` The ID of the deck
@@ -21,13 +476,37 @@ def getDeckById(id: int) -> Deck:
         The `Deck` object.
 
     Raises:
-        RuntimeError: In either the case that the deck doesn't exist or it can't be retrieved for some reason
+        RuntimeError: In either the case that the deck doesn't exist or it can't be retrieved for some reason.
+        These are `DeckNotFoundError` and `DeckFetchError` respectively.
     """
-    response = requests.get(DECK_SEARCH_ENDPOINT.format(id))
-    match response.status_code:
-        case 200:
-            return Deck.fromJson(response.json())
-        case 404:
-            raise RuntimeError(f"{id} is either not a valid deck or it's private")
-        case _:
-            raise RuntimeError(f"Unknown error trying to retrieve deck {id}")
+    return getDefaultClient().getDeckById(id)
+
+
+def getDecksByIds(
+    ids: Iterable[int], max_workers: int = 10, ordered: bool = True
+) -> Iterator[DeckResult]:
+    """Retrieves many decks by id from Archidekt using a pool of threads
+
+    Requests go through the pooled default client, see `getDefaultClient`. Failures are reported per deck
+    instead of raising:
+    ```python
+    for result in getDecksByIds([1, 2, 3], max_workers=8, ordered=False):
+        if result.ok:
+            print(result.deck.name)
+        else:
+            print(f"{result.id}: {result.error}")
+    ```
+
+    Args:
+        ids: `Iterable[int]` The IDs of the decks
+
+        max_workers: `int` The number of worker threads
+
+        ordered: `bool` If `True` results are yielded in the order of `ids`, otherwise as they complete
+
+    Returns:
+        An iterator of `DeckResult`s
+    """
+    return getDefaultClient().getDecksByIds(
+        ids, max_workers=max_workers, ordered=ordered
+    )
@@ -0,0 +1,351 @@
+"""
+Caches for deck data. The disk cache keeps the raw deck JSON between runs and can be shared by many processes,
+the deck cache keeps fully built `Deck` objects in memory.
+"""
+
+from __future__ import annotations
+from .cards import LazyCardList
+from .deck import Deck
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+import os
+import tempfile
+import time
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a cache is doing
+
+    Attributes:
+        hits: `int` Lookups answered from the cache
+
+        misses: `int` Lookups that weren't in the cache, including expired entries
+
+        expirations: `int` Entries dropped because they were older than the TTL
+
+        evictions: `int` Entries dropped to stay within the size limit
+    """
+
+    hits: int = field(default=0)
+    misses: int = field(default=0)
+    expirations: int = field(default=0)
+    evictions: int = field(default=0)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DiskCache:
+    """Persistent cache of raw deck JSON, keyed by deck id
+
+    Each deck is stored as its own file in `directory`. Writes go to a temporary file that is then renamed into
+    place, so readers never see a partial file and many processes can share one directory. An entry's age is
+    taken from its file's modification time and its last use from its access time, which the cache sets on
+    every hit. When the files grow past `max_size` bytes, the least recently used ones are removed until the
+    cache is back under 90% of the limit.
+
+    ```python
+    client = ArchidektClient(cache=DiskCache("~/.cache/pyrchidekt", ttl=3600, max_size=512 * 2**20))
+    ```
+
+    Attributes:
+        directory: `Path` Where the entries are stored
+
+        ttl: `float | None` How many seconds an entry stays valid. `None` never expires entries.
+
+        max_size: `int | None` The maximum total size of all entries in bytes. `None` is unbounded.
+
+        stats: `CacheStats` Hit, miss, expiration and eviction counters of this process
+    """
+
+    SUFFIX = ".json"
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        ttl: float | None = None,
+        max_size: int | None = None,
+    ):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._lock = Lock()
+        self._size: int | None = None
+
+    def _path(self, id: int) -> Path:
+        return self.directory / f"{id}{self.SUFFIX}"
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def get(self, id: int) -> bytes | None:
+        """Returns the cached JSON of a deck
+
+        Arguments:
+            id: `int` The ID of the deck
+
+        Returns:
+            The raw JSON `bytes`, or `None` if the deck isn't cached or has expired
+        """
+        path = self._path(id)
+        try:
+            stat = path.stat()
+            now = time.time()
+            if self.ttl is not None and now - stat.st_mtime > self.ttl:
+                self._count("expirations")
+                self._remove(path, stat.st_size)
+                self._count("misses")
+                return None
+            data = path.read_bytes()
+            os.utime(path, (now, stat.st_mtime))
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return data
+
+    def set(self, id: int, data: bytes) -> None:
+        """Stores the JSON of a deck
+
+        Arguments:
+            id: `int` The ID of the deck
+
+            data: `bytes` The raw JSON
+        """
+        fd, temp = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp, self._path(id))
+        except BaseException:
+            try:
+                os.unlink(temp)
+            except FileNotFoundError:
+                pass
+            raise
+
+        if self.max_size is not None:
+            with self._lock:
+                if self._size is not None:
+                    self._size += len(data)
+            if self._size is None or self._size > self.max_size:
+                self.evict()
+
+    def delete(self, id: int) -> None:
+        """Removes a deck from the cache, if it is there
+
+        Arguments:
+            id: `int` The ID of the deck
+        """
+        path = self._path(id)
+        try:
+            self._remove(path, path.stat().st_size)
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        """Removes every entry from the cache"""
+        for entry in self._entries():
+            self._remove(Path(entry.path), entry.stat().st_size)
+        with self._lock:
+            self._size = 0
+
+    def evict(self) -> None:
+        """Removes least recently used entries until the cache is under 90% of `max_size`
+
+        The size of the whole directory is recounted, so this also accounts for entries written by other
+        processes.
+        """
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, entry.path))
+
+        size = sum(x[1] for x in entries)
+        if self.max_size is not None and size > self.max_size:
+            target = self.max_size * 0.9
+            entries.sort()
+            for _, entry_size, path in entries:
+                if size <= target:
+                    break
+                if self._remove(Path(path), entry_size):
+                    self._count("evictions")
+                size -= entry_size
+
+        with self._lock:
+            self._size = size
+
+    def _entries(self):
+        with os.scandir(self.directory) as it:
+            return [x for x in it if x.name.endswith(self.SUFFIX) and x.is_file()]
+
+    def _remove(self, path: Path, size: int) -> bool:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        with self._lock:
+            if self._size is not None:
+                self._size -= size
+        return True
+
+
+class DeckCache:
+    """Bounded in-memory cache of hydrated `Deck` objects
+
+    Building a `Deck` from JSON is the most expensive part of loading one, so this keeps recently built decks
+    around. Entries are keyed by deck id together with the deck's `updated_at`: a lookup with a newer
+    `updated_at` is a miss, and storing the newer deck replaces the stale one. The cache is bounded by the
+    number of decks and optionally by the total number of cards, which is what their memory use scales with.
+    The least recently used decks are evicted first.
+
+    Every `get` returns a copy of the cached deck (copy-on-read). The copy has its own `cards`, `categories`,
+    `editors` and `deck_tags` lists and its own `Category` objects, so adding, removing and re-categorizing
+    cards or changing deck fields never affects the cache. The copies of lazily created decks also keep their
+    own record of which cards are built, so updating one with `Deck.applyUpdate` leaves the cached deck as it
+    was. The `ArchidektCard` objects themselves, and everything beneath them, are shared between copies and must
+    be treated as read-only.
+
+    Attributes:
+        max_entries: `int` The maximum number of decks held
+
+        max_cards: `int | None` The maximum number of cards across all held decks. `None` is unbounded.
+
+        stats: `CacheStats` Hit, miss and eviction counters
+    """
+
+    def __init__(self, max_entries: int = 1024, max_cards: int | None = None):
+        self.max_entries = max_entries
+        self.max_cards = max_cards
+        self.stats = CacheStats()
+        self._decks: OrderedDict[int, Deck] = OrderedDict()
+        self._cards = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._decks)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._decks
+
+    def get(self, id: int, updated_at: datetime | None = None) -> Deck | None:
+        """Returns a copy of a cached deck
+
+        Arguments:
+            id: `int` The ID of the deck
+
+            updated_at: `datetime | None` When the deck was last updated upstream. A cached deck with a
+            different `updated_at` is stale and isn't returned. `None` accepts any cached version.
+
+        Returns:
+            A copy of the `Deck`, or `None` if there isn't a fresh one
+        """
+        with self._lock:
+            deck = self._decks.get(id)
+            if deck is None or (
+                updated_at is not None and deck.updated_at != updated_at
+            ):
+                self.stats.misses += 1
+                return None
+            self._decks.move_to_end(id)
+            self.stats.hits += 1
+        return copyDeck(deck)
+
+    def put(self, deck: Deck) -> None:
+        """Stores a deck, replacing any older version of it
+
+        The cache keeps its own copy, so the caller may keep using and changing `deck`.
+
+        Arguments:
+            deck: `Deck` The deck to store
+
+        Raises:
+            ValueError: If the deck was created with `include`, as it may not have the fields the cache reads
+        """
+        deck._requireAllFields("cache")
+        deck = copyDeck(deck)
+        with self._lock:
+            self._pop(deck.id)
+            self._decks[deck.id] = deck
+            self._cards += len(deck.cards)
+            while len(self._decks) > 1 and (
+                len(self._decks) > self.max_entries
+                or (self.max_cards is not None and self._cards > self.max_cards)
+            ):
+                self._pop(next(iter(self._decks)))
+                self.stats.evictions += 1
+
+    def invalidate(self, id: int) -> None:
+        """Drops a deck from the cache, if it is there
+
+        Arguments:
+            id: `int` The ID of the deck
+        """
+        with self._lock:
+            self._pop(id)
+
+    def clear(self) -> None:
+        """Drops every deck from the cache"""
+        with self._lock:
+            self._decks.clear()
+            self._cards = 0
+
+    def _pop(self, id: int) -> None:
+        deck = self._decks.pop(id, None)
+        if deck is not None:
+            self._cards -= len(deck.cards)
+
+
+def copyDeck(deck: Deck) -> Deck:
+    """Returns a copy of a deck sharing its cards
+
+    The copy has its own lists and `Category` objects, while the `ArchidektCard` objects are shared. This is
+    the copy `DeckCache` hands out. Fields skipped by the projection a deck was created with are skipped in the
+    copy too.
+
+    Arguments:
+        deck: `Deck` The deck to copy
+
+    Returns:
+        The copied `Deck`
+    """
+    values = {x.name: getattr(deck, x.name) for x in _FIELDS if hasattr(deck, x.name)}
+    cards = values["cards"] = deck.cards.copy()
+    if isinstance(cards, LazyCardList):
+        # The categories share the copy's built cards, as those of a deck created lazily do
+        values["categories"] = [
+            replace(x, cards=cards.sibling(x.cards.entries())) for x in deck.categories
+        ]
+    else:
+        values["categories"] = [
+            replace(x, cards=x.cards.copy()) for x in deck.categories
+        ]
+    for name in ("editors", "deck_tags"):
+        if name in values:
+            values[name] = list(values[name])
+
+    if deck._projection is None:
+        copied = Deck(**values)
+    else:
+        copied = object.__new__(Deck)
+        for name, value in values.items():
+            setattr(copied, name, value)
+        copied.invalidate()
+    copied._registry = deck._registry
+    copied._projection = deck._projection
+    return copied
+
+
+_FIELDS = tuple(x for x in fields(Deck) if x.init)
@@ -5,15 +5,20 @@ that contains all the actual card info.
 
 from __future__ import annotations
 from .edition import Edition
-from .formats import Format
-from .mana import ManaProduction
+from .formats import Legalities
+from .mana import ManaCost, ManaProduction, parseManaCosts
+from .projection import Projection, projectable
+from collections.abc import MutableSequence
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List
-from warnings import warn
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
 
+if TYPE_CHECKING:
+    from .registry import CardRegistry
 
-@dataclass
+
+@projectable
+@dataclass(slots=True)
 class OracleCard:
     """Actual Card Representation
 
@@ -33,8 +38,9 @@ class OracleCard:
 
         layout: `str` The layout of the card
 
-        legalities: `Dict[Format, bool]` The formats in which the card is legal to play. This is a dictionary
-        with an Enum representation of all formats and a boolean if it is legal in that format.
+        legalities: `Legalities` The formats in which the card is legal to play. This reads like a dictionary
+        from an Enum representation of each format to its legality string (ex. "legal", "not_legal", "banned"),
+        but is stored as a few integer bitmasks.
 
         mana_cost: `str` The raw mana cost string. Uses special characters to represent the colors for example:
         "1{U}" is 1 generic and 1 blue mana
@@ -66,27 +72,27 @@ class OracleCard:
 
     id: int = field(default=-1)
     cmc: int = field(default=-1)
-    color_identity: List[str] = field(default=list)
-    colors: List[str] = field(default=list)
-    faces: List = field(default=list)
+    color_identity: List[str] = field(default_factory=list)
+    colors: List[str] = field(default_factory=list)
+    faces: List = field(default_factory=list)
     layout: str = field(default="")
-    legalities: Dict[Format, bool] = field(default=dict)
+    legalities: Legalities = field(default_factory=Legalities)
     mana_cost: str = field(default="")
-    mana_production: ManaProduction = field(default=ManaProduction)
+    mana_production: ManaProduction = field(default_factory=ManaProduction)
     name: str = field(default="")
     power: str = field(default="")
     salt: float = field(default=-1.0)
-    sub_types: List[str] = field(default=list)
-    super_types: List[str] = field(default=list)
+    sub_types: List[str] = field(default_factory=list)
+    super_types: List[str] = field(default_factory=list)
     text: str = field(default="")
-    tokens: List[str] = field(default=list)
+    tokens: List[str] = field(default_factory=list)
     toughness: str = field(default="")
-    types: List[str] = field(default=list)
+    types: List[str] = field(default_factory=list)
     loyalty: str = field(default="")
     default_category: str = field(default="")
 
     @staticmethod
-    def fromJson(data: dict) -> OracleCard:
+    def fromJson(data: dict, projection: Projection | None = None) -> OracleCard:
         """Returns an `OracleCard` from a dictionary.
 
         This takes in a formatted dictionary and returns an Object. An example of this is the following:
@@ -165,21 +171,13 @@ class OracleCard:
         Arguments:
             data: `dict` Formatted dictionary containing the data for the card
 
+            projection: `Projection | None` If given, only the fields it loads are read
+
         Returns:
             The `OracleCard` object created from the data.
         """
-        legalities = dict()
-        for x in data["legalities"]:
-            try:
-                legalities[Format(x.lower())] = data["legalities"][x]
-            except ValueError as e:
-                warn(
-                    message=f"{e} -> skipping card legality\n"
-                    f"For new formats, please file an issue at "
-                    f"https://github.com/linkian209/pyrchidekt/issues",
-                    category=RuntimeWarning,
-                    stacklevel=2,
-                )
+        if projection is not None:
+            return projection.build(OracleCard, _ORACLE_CARD_READERS, data)
 
         return OracleCard(
             id=data["id"],
@@ -188,7 +186,7 @@ class OracleCard:
             colors=data["colors"],
             faces=data["faces"],
             layout=data["layout"],
-            legalities=legalities,
+            legalities=Legalities.fromJson(data["legalities"]),
             mana_cost=data["manaCost"],
             mana_production=ManaProduction.fromJson(data["manaProduction"]),
             name=data["name"],
@@ -204,8 +202,17 @@ class OracleCard:
             default_category=data["defaultCategory"],
         )
 
+    def manaCosts(self) -> Tuple[ManaCost, ...]:
+        """Parses the mana cost of each face of the card, front face first, see `parseManaCosts`
 
-@dataclass
+        Returns:
+            The `ManaCost` of each face
+        """
+        return parseManaCosts(self.mana_cost, self.faces)
+
+
+@projectable
+@dataclass(slots=True)
 class Card:
     """The inner card representation
 
@@ -276,7 +283,11 @@ class Card:
     rarity: str
 
     @staticmethod
-    def fromJson(data: dict) -> Card:
+    def fromJson(
+        data: dict,
+        registry: CardRegistry | None = None,
+        projection: Projection | None = None,
+    ) -> Card:
         """Returns a `Card` from a dictionary
 
         Used in `Deck` creation, this method returns a `Card` from a JSON serialized object. An example of
@@ -327,9 +338,24 @@ class Card:
         Arguments:
             data: `dict` A formated dictionary
 
+            registry: `CardRegistry | None` If given, the oracle card and edition are taken from, and shared
+            through, this registry instead of always being parsed
+
+            projection: `Projection | None` If given, only the fields it loads are read
+
         Returns:
             The `Card` object represented by the dictionary
         """
+        if projection is not None:
+            return _projectedCard(data, registry, projection)
+
+        if registry is None:
+            edition = Edition.fromJson(data["edition"])
+            oracle_card = OracleCard.fromJson(data["oracleCard"])
+        else:
+            edition = registry.edition(data["edition"])
+            oracle_card = registry.oracleCard(data["oracleCard"])
+
         return Card(
             id=data["id"],
             artist=data["artist"],
@@ -343,18 +369,19 @@ class Card:
             mtgo_normal_id=data["mtgoNormalId"],
             uid=data["uid"],
             display_name=data["displayName"],
-            edition=Edition.fromJson(data["edition"]),
+            edition=edition,
             flavor=data["flavor"],
             games=data["games"],
             options=data["options"],
-            oracle_card=OracleCard.fromJson(data["oracleCard"]),
+            oracle_card=oracle_card,
             owned=data["owned"],
             prices=data["prices"],
             rarity=data["rarity"],
         )
 
 
-@dataclass
+@projectable
+@dataclass(slots=True)
 class ArchidektCard:
     """The Archidekt Wrapper for a card
 
@@ -408,7 +435,11 @@ class ArchidektCard:
     deleted_at: datetime | None
 
     @staticmethod
-    def fromJson(data: dict) -> ArchidektCard:
+    def fromJson(
+        data: dict,
+        registry: CardRegistry | None = None,
+        projection: Projection | None = None,
+    ) -> ArchidektCard:
         """Returns an `ArchidektCard` from a dictionary
 
         Used in `Deck` creation, this takes in a JSON deserialized dictionary and returns the `ArchidektCard`
@@ -436,27 +467,26 @@ class ArchidektCard:
         Arguments:
             data: `dict` The dictionary containing the data
 
+            registry: `CardRegistry | None` An optional registry to share oracle cards and editions through
+
+            projection: `Projection | None` If given, only the fields it loads are read
+
         Returns:
             The `ArchidektCard` represented by this data
         """
-        label = ""
-        label_color = ""
-
-        if data["label"]:
-            split_label = data["label"].split(",")
-            if len(split_label) != 2:
-                if len(split_label) == 1:
-                    if "#" in split_label[0]:
-                        label_color = split_label[0]
-                    else:
-                        label = split_label[0]
-            else:
-                label = split_label[0]
-                label_color = split_label[1]
+        if projection is not None:
+            return projection.build(
+                ArchidektCard,
+                _ARCHIDEKT_CARD_READERS,
+                data,
+                card=Card.fromJson(data["card"], registry, projection),
+            )
+
+        label, label_color = _splitLabel(data["label"])
 
         return ArchidektCard(
             id=data["id"],
-            card=Card.fromJson(data["card"]),
+            card=Card.fromJson(data["card"], registry),
             categories=data["categories"],
             companion=data["companion"],
             flipped_default=data["flippedDefault"],
@@ -472,3 +502,244 @@ class ArchidektCard:
                 datetime.fromisoformat(data["deletedAt"]) if data["deletedAt"] else None
             ),
         )
+
+    @property
+    def primary_category(self) -> str | None:
+        """`str | None` The first of the card's categories, or its oracle card's default category if it has none"""
+        if self.categories:
+            return self.categories[0]
+        return self.card.oracle_card.default_category
+
+
+class LazyCardList(MutableSequence):
+    """A list of `ArchidektCard`s that are only built from their JSON when first used
+
+    This is what `Deck.cards` and `Category.cards` are when a deck is created with `Deck.fromJson(data,
+    lazy=True)`. Each entry keeps its card JSON until it is first indexed or iterated over, then builds the
+    `ArchidektCard` once and keeps it. Lists made from the same deck share their built cards, so a card reached
+    through a category is the same object as the one in the deck's cards. Otherwise it behaves like a list,
+    including comparing equal to a list of the same cards.
+
+    Cards can be added, removed and replaced as with a list. Entries may be either built cards or card JSON.
+    """
+
+    __slots__ = ("_items", "_built", "_registry", "_projection")
+
+    def __init__(
+        self,
+        items: Iterable[dict | ArchidektCard] = (),
+        registry: CardRegistry | None = None,
+        built: Dict[int, Tuple[dict, ArchidektCard]] | None = None,
+        projection: Projection | None = None,
+    ):
+        """Creates the list
+
+        Arguments:
+            items: `Iterable[dict | ArchidektCard]` Card JSON, or cards that are already built
+
+            registry: `CardRegistry | None` An optional registry to share oracle cards and editions through
+
+            built: `Dict[int, Tuple[dict, ArchidektCard]] | None` Cards already built, with the JSON they were
+            built from, by the card's `"id"`. Lists sharing this share their cards.
+
+            projection: `Projection | None` If given, cards are built with only the fields it loads
+        """
+        self._items = list(items)
+        self._registry = registry
+        self._built = {} if built is None else built
+        self._projection = projection
+
+    def _lookup(self, item: dict) -> ArchidektCard | None:
+        entry = self._built.get(item["id"])
+        # Newer JSON of the same card is a different object, and mustn't be given the card built from the older one
+        if entry is not None and entry[0] is item:
+            return entry[1]
+        return None
+
+    def _card(self, item: dict | ArchidektCard) -> ArchidektCard:
+        if type(item) is not dict:
+            return item
+        card = self._lookup(item)
+        if card is None:
+            card = ArchidektCard.fromJson(item, self._registry, self._projection)
+            self._built[item["id"]] = (item, card)
+        return card
+
+    def prune(self) -> None:
+        """Forgets the built cards whose JSON is no longer in this list
+
+        Lists sharing built cards with this one stop sharing the forgotten cards, so this is only meant for a
+        deck's `cards`, which hold every card of its categories. `Deck.applyUpdate` calls it.
+        """
+        kept = {id(x) for x in self._items if type(x) is dict}
+        for key in [x for x, (item, _) in self._built.items() if id(item) not in kept]:
+            del self._built[key]
+
+    def sibling(self, items: Iterable[dict | ArchidektCard]) -> LazyCardList:
+        """Returns another lazy list sharing this one's built cards
+
+        Arguments:
+            items: `Iterable[dict | ArchidektCard]` Card JSON from the same deck, or built cards
+
+        Returns:
+            The new `LazyCardList`
+        """
+        return LazyCardList(items, self._registry, self._built, self._projection)
+
+    def entries(self) -> List[dict | ArchidektCard]:
+        """Returns the entries without building them: JSON for cards that haven't been built, cards otherwise"""
+        entries = []
+        for item in self._items:
+            card = self._lookup(item) if type(item) is dict else None
+            entries.append(item if card is None else card)
+        return entries
+
+    def copy(self) -> LazyCardList:
+        """Returns a shallow copy with its own record of built cards
+
+        Cards built before the copy is made are shared with it, while those built afterwards, and changes such as
+        `Deck.applyUpdate` pruning the record, only affect the list they were made through. Use `sibling` for
+        lists that keep sharing.
+        """
+        return LazyCardList(
+            self._items, self._registry, dict(self._built), self._projection
+        )
+
+    @property
+    def built(self) -> int:
+        """`int` How many of the cards have been built so far"""
+        return sum(
+            1 for x in self._items if type(x) is not dict or self._lookup(x) is not None
+        )
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._card(x) for x in self._items[index]]
+        return self._card(self._items[index])
+
+    def __setitem__(self, index, value) -> None:
+        self._items[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return (self._card(x) for x in self._items)
+
+    def insert(self, index: int, value: dict | ArchidektCard) -> None:
+        self._items.insert(index, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, tuple, LazyCardList)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"LazyCardList({len(self)} cards, {self.built} built)"
+
+
+def _splitLabel(value: str | None) -> tuple:
+    """Splits a label such as "Have,#37d67a" into its name and color"""
+    label = ""
+    label_color = ""
+    if value:
+        split_label = value.split(",")
+        if len(split_label) == 2:
+            label, label_color = split_label
+        elif len(split_label) == 1:
+            if "#" in split_label[0]:
+                label_color = split_label[0]
+            else:
+                label = split_label[0]
+    return label, label_color
+
+
+def _projectedCard(
+    data: dict, registry: CardRegistry | None, projection: Projection
+) -> Card:
+    values = {}
+    if registry is None:
+        values["oracle_card"] = OracleCard.fromJson(data["oracleCard"], projection)
+    else:
+        # Oracle cards are shared by projection too, so a projected card never stands in for a full one
+        values["oracle_card"] = registry.getOracleCard(
+            (data["oracleCard"]["id"], projection),
+            lambda x: OracleCard.fromJson(x, projection),
+            data["oracleCard"],
+        )
+    if projection.loads("Card", "edition"):
+        values["edition"] = (
+            Edition.fromJson(data["edition"])
+            if registry is None
+            else registry.edition(data["edition"])
+        )
+    return projection.build(Card, _CARD_READERS, data, **values)
+
+
+# How each field that isn't always loaded is read, for `Projection.build`
+_ORACLE_CARD_READERS = {
+    "id": lambda x: x["id"],
+    "cmc": lambda x: x["cmc"],
+    "color_identity": lambda x: x["colorIdentity"],
+    "colors": lambda x: x["colors"],
+    "faces": lambda x: x["faces"],
+    "layout": lambda x: x["layout"],
+    "legalities": lambda x: Legalities.fromJson(x["legalities"]),
+    "mana_cost": lambda x: x["manaCost"],
+    "mana_production": lambda x: ManaProduction.fromJson(x["manaProduction"]),
+    "name": lambda x: x["name"],
+    "power": lambda x: x["power"],
+    "salt": lambda x: x["salt"],
+    "sub_types": lambda x: x["subTypes"],
+    "super_types": lambda x: x["superTypes"],
+    "text": lambda x: x["text"],
+    "tokens": lambda x: x["tokens"],
+    "toughness": lambda x: x["toughness"],
+    "types": lambda x: x["types"],
+    "loyalty": lambda x: x["loyalty"],
+    "default_category": lambda x: x["defaultCategory"],
+}
+
+_CARD_READERS = {
+    "id": lambda x: x["id"],
+    "artist": lambda x: x["artist"],
+    "tcg_product_id": lambda x: x["tcgProductId"],
+    "ck_foil_id": lambda x: x["ckFoilId"],
+    "ck_normal_id": lambda x: x["ckNormalId"],
+    "cm_ed": lambda x: x["cmEd"],
+    "collector_number": lambda x: x["collectorNumber"],
+    "multiverse_id": lambda x: x["multiverseid"],
+    "mtgo_foil_id": lambda x: x["mtgoFoilId"],
+    "mtgo_normal_id": lambda x: x["mtgoNormalId"],
+    "uid": lambda x: x["uid"],
+    "display_name": lambda x: x["displayName"],
+    "flavor": lambda x: x["flavor"],
+    "games": lambda x: x["games"],
+    "options": lambda x: x["options"],
+    "owned": lambda x: x["owned"],
+    "prices": lambda x: x["prices"],
+    "rarity": lambda x: x["rarity"],
+}
+
+_ARCHIDEKT_CARD_READERS = {
+    "id": lambda x: x["id"],
+    "categories": lambda x: x["categories"],
+    "companion": lambda x: x["companion"],
+    "flipped_default": lambda x: x["flippedDefault"],
+    "label": lambda x: _splitLabel(x["label"])[0],
+    "label_color": lambda x: _splitLabel(x["label"])[1],
+    "modifier": lambda x: x["modifier"],
+    "quantity": lambda x: x["quantity"],
+    "custom_cmc": lambda x: x["customCmc"],
+    "removed_categories": lambda x: x["removedCategories"],
+    "created_at": lambda x: datetime.fromisoformat(x["createdAt"]),
+    "updated_at": lambda x: datetime.fromisoformat(x["updatedAt"]),
+    "deleted_at": lambda x: (
+        datetime.fromisoformat(x["deletedAt"]) if x["deletedAt"] else None
+    ),
+}
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class Category:
     """Loose wrapper around the Archidekt Category
 
@@ -26,7 +26,8 @@ class Category:
 
         is_premier: `bool` This is a premier category
 
-        cards: `List[ArchidektCard]` The cards contained in this category
+        cards: `List[ArchidektCard]` The cards contained in this category. For lazily created decks this is a
+        `LazyCardList`.
     """
 
     id: int = field(default=-1)
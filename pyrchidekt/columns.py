@@ -0,0 +1,413 @@
+"""
+Columnar NumPy view of the cards of one or many decks
+
+This module needs NumPy, which is installed with the `numpy` extra:
+```shell
+pip install pyrchidekt[numpy]
+```
+"""
+
+from __future__ import annotations
+from .deck import Deck
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, Iterable, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "pyrchidekt.columns needs NumPy, install it with `pip install pyrchidekt[numpy]`"
+    ) from None
+
+COLORS = ("White", "Blue", "Black", "Red", "Green")
+"""`Tuple[str, ...]` The colors, in the order of their bits in `DeckFrame.colors` and `DeckFrame.color_identity`"""
+
+CARD_TYPES = (
+    "Artifact",
+    "Battle",
+    "Creature",
+    "Enchantment",
+    "Instant",
+    "Kindred",
+    "Land",
+    "Planeswalker",
+    "Sorcery",
+    "Tribal",
+)
+"""`Tuple[str, ...]` The card types, in the order of their bits in `DeckFrame.types`"""
+
+_COLOR_BITS = {x: 1 << i for i, x in enumerate(COLORS)}
+_TYPE_BITS = {x: 1 << i for i, x in enumerate(CARD_TYPES)}
+_LAND = _TYPE_BITS["Land"]
+_INCLUDED = (True, True)
+_NO_PRICES: Dict[str, float] = {}
+
+
+@dataclass(slots=True, eq=False)
+class DeckFrame:
+    """The cards of one or many decks packed into NumPy arrays, one row per card entry
+
+    Statistics over the cards can then be computed without looping over them in Python. The built-in
+    aggregations only count cards included in the deck (see `Deck.isIncluded`), weighted by their quantity,
+    and can be computed for all rows at once or for each deck separately with `per_deck`.
+
+    ```python
+    frame = DeckFrame.fromDecks(decks)
+    curve = frame.manaCurve()                   # over every deck
+    averages = frame.averageCmc(per_deck=True)  # one per deck, in the order of frame.deck_ids
+    ```
+
+    Attributes:
+        deck_ids: `np.ndarray` The IDs of the decks, in the order they were added
+
+        deck: `np.ndarray` For each row, the position of its deck in `deck_ids`
+
+        quantity: `np.ndarray` The quantity of each card
+
+        cmc: `np.ndarray` The converted mana cost of each card's oracle card
+
+        custom_cmc: `np.ndarray` The custom converted mana cost of each card, `nan` where it has none
+
+        colors: `np.ndarray` Bitmask of each card's colors, see `COLORS`
+
+        color_identity: `np.ndarray` Bitmask of each card's color identity, see `COLORS`
+
+        types: `np.ndarray` Bitmask of each card's types, see `CARD_TYPES`
+
+        in_deck: `np.ndarray` Whether each card counts towards its deck
+
+        in_price: `np.ndarray` Whether each card counts towards the price of its deck
+
+        foil: `np.ndarray` Whether each card's modifier is "Foil"
+
+        prices: `Dict[str, np.ndarray]` The price of each card by vendor, `nan` where the vendor has none
+
+        category_names: `Tuple[str, ...]` The names of every category, in the order of the columns of
+        `categories`
+
+        categories: `np.ndarray` A boolean matrix with a row per card and a column per category, set where the
+        card is in the category
+    """
+
+    deck_ids: np.ndarray
+    deck: np.ndarray
+    quantity: np.ndarray
+    cmc: np.ndarray
+    custom_cmc: np.ndarray
+    colors: np.ndarray
+    color_identity: np.ndarray
+    types: np.ndarray
+    in_deck: np.ndarray
+    in_price: np.ndarray
+    foil: np.ndarray
+    prices: Dict[str, np.ndarray]
+    category_names: Tuple[str, ...]
+    categories: np.ndarray
+
+    @staticmethod
+    def fromDeck(deck: Deck) -> DeckFrame:
+        """Creates a `DeckFrame` from the cards of a deck
+
+        Arguments:
+            deck: `Deck` The deck
+
+        Returns:
+            The `DeckFrame`
+        """
+        return DeckFrame.fromDecks([deck])
+
+    @staticmethod
+    def fromDecks(decks: Iterable[Deck]) -> DeckFrame:
+        """Creates a `DeckFrame` stacking the cards of many decks
+
+        Arguments:
+            decks: `Iterable[Deck]` The decks
+
+        Returns:
+            The `DeckFrame`
+        """
+        # One list per column, rather than a tuple per row, so that building the frame of a large corpus doesn't
+        # allocate a container per card for the garbage collector to go through
+        deck_ids = []
+        sizes = []
+        quantity = []
+        cmc = []
+        custom_cmc = []
+        colors = []
+        color_identity = []
+        types = []
+        inclusion = []
+        foil = []
+        prices = []
+        category_names: Dict[str, int] = {}
+        member_rows = []
+        member_columns = []
+        row = 0
+        for deck in decks:
+            deck_ids.append(deck.id)
+            sizes.append(len(deck.cards))
+            inclusions = deck.inclusions()
+            for card in deck.cards:
+                oracle_card = card.card.oracle_card
+                quantity.append(card.quantity)
+                cmc.append(oracle_card.cmc)
+                custom_cmc.append(card.custom_cmc)
+                colors.append(_bits(oracle_card.colors, _COLOR_BITS))
+                color_identity.append(_bits(oracle_card.color_identity, _COLOR_BITS))
+                types.append(_bits(oracle_card.types, _TYPE_BITS))
+                inclusion.append(inclusions.get(card.primary_category, _INCLUDED))
+                foil.append(card.modifier == "Foil")
+                prices.append(card.card.prices or _NO_PRICES)
+                for name in card.categories or (oracle_card.default_category,):
+                    if name:
+                        member_rows.append(row)
+                        member_columns.append(
+                            category_names.setdefault(name, len(category_names))
+                        )
+                row += 1
+
+        categories = np.zeros((row, len(category_names)), dtype=bool)
+        categories[member_rows, member_columns] = True
+
+        return DeckFrame(
+            deck_ids=np.array(deck_ids, dtype=np.int64),
+            deck=np.repeat(np.arange(len(deck_ids), dtype=np.intp), sizes),
+            quantity=np.array(quantity, dtype=np.int64),
+            cmc=np.array(cmc, dtype=float),
+            custom_cmc=np.array(custom_cmc, dtype=float),
+            colors=np.array(colors, dtype=np.uint8),
+            color_identity=np.array(color_identity, dtype=np.uint8),
+            types=np.array(types, dtype=np.uint16),
+            in_deck=np.array([x[0] for x in inclusion], dtype=bool),
+            in_price=np.array([x[1] for x in inclusion], dtype=bool),
+            foil=np.array(foil, dtype=bool),
+            prices={
+                vendor: np.array([x.get(vendor) for x in prices], dtype=float)
+                for vendor in dict.fromkeys(chain.from_iterable(prices))
+            },
+            category_names=tuple(category_names),
+            categories=categories,
+        )
+
+    @staticmethod
+    def concat(frames: Iterable[DeckFrame]) -> DeckFrame:
+        """Stacks frames into one, as if it had been created from all of their decks
+
+        Arguments:
+            frames: `Iterable[DeckFrame]` The frames to stack
+
+        Returns:
+            The stacked `DeckFrame`
+        """
+        frames = list(frames)
+        category_names = tuple(
+            dict.fromkeys(x for frame in frames for x in frame.category_names)
+        )
+        vendors = dict.fromkeys(x for frame in frames for x in frame.prices)
+        offsets = np.cumsum([0] + [len(x.deck_ids) for x in frames])
+
+        categories = np.zeros(
+            (sum(len(x) for x in frames), len(category_names)), dtype=bool
+        )
+        start = 0
+        for frame in frames:
+            columns = [category_names.index(x) for x in frame.category_names]
+            categories[start : start + len(frame), columns] = frame.categories
+            start += len(frame)
+
+        def stack(name: str, dtype) -> np.ndarray:
+            return np.concatenate(
+                [getattr(x, name) for x in frames] or [np.empty(0, dtype)]
+            ).astype(dtype, copy=False)
+
+        return DeckFrame(
+            deck_ids=stack("deck_ids", np.int64),
+            deck=np.concatenate(
+                [x.deck + offset for x, offset in zip(frames, offsets)]
+                or [np.empty(0, np.intp)]
+            ),
+            quantity=stack("quantity", np.int64),
+            cmc=stack("cmc", float),
+            custom_cmc=stack("custom_cmc", float),
+            colors=stack("colors", np.uint8),
+            color_identity=stack("color_identity", np.uint8),
+            types=stack("types", np.uint16),
+            in_deck=stack("in_deck", bool),
+            in_price=stack("in_price", bool),
+            foil=stack("foil", bool),
+            prices={
+                vendor: np.concatenate(
+                    [x.prices.get(vendor, np.full(len(x), np.nan)) for x in frames]
+                )
+                for vendor in vendors
+            },
+            category_names=category_names,
+            categories=categories,
+        )
+
+    def __len__(self) -> int:
+        return len(self.quantity)
+
+    @property
+    def effective_cmc(self) -> np.ndarray:
+        """`np.ndarray` The custom converted mana cost of each card where it has one, its `cmc` otherwise"""
+        return np.where(np.isnan(self.custom_cmc), self.cmc, self.custom_cmc)
+
+    def hasType(self, type: str) -> np.ndarray:
+        """Returns a mask of the cards with a card type
+
+        Arguments:
+            type: `str` One of `CARD_TYPES`
+
+        Returns:
+            A boolean array with an entry per row
+        """
+        return (self.types & _TYPE_BITS[type]) != 0
+
+    def inCategory(self, name: str) -> np.ndarray:
+        """Returns a mask of the cards in a category
+
+        Arguments:
+            name: `str` The name of the category
+
+        Returns:
+            A boolean array with an entry per row, all false if no card is in the category
+        """
+        if name not in self.category_names:
+            return np.zeros(len(self), dtype=bool)
+        return self.categories[:, self.category_names.index(name)]
+
+    def count(self, per_deck: bool = False) -> int | np.ndarray:
+        """Counts the cards in the deck
+
+        Arguments:
+            per_deck: `bool` Count each deck separately
+
+        Returns:
+            The number of cards, or an array with the number for each deck
+        """
+        return self._sum(self.quantity, self.in_deck, per_deck)
+
+    def manaCurve(self, max_cmc: int = 7, per_deck: bool = False) -> np.ndarray:
+        """Counts the nonland cards in the deck by converted mana cost
+
+        Custom converted mana costs are used where cards have them.
+
+        Arguments:
+            max_cmc: `int` Costs of this or more are counted together in the last bucket
+
+            per_deck: `bool` Count each deck separately
+
+        Returns:
+            An array of `max_cmc + 1` counts, or with `per_deck` an array with a row of counts per deck
+        """
+        mask = self.in_deck & ((self.types & _LAND) == 0)
+        cmc = np.nan_to_num(self.effective_cmc[mask])
+        buckets = np.clip(cmc, 0, max_cmc).astype(np.intp)
+        if not per_deck:
+            return np.bincount(
+                buckets, weights=self.quantity[mask], minlength=max_cmc + 1
+            ).astype(np.int64)
+        decks = len(self.deck_ids)
+        return (
+            np.bincount(
+                self.deck[mask] * (max_cmc + 1) + buckets,
+                weights=self.quantity[mask],
+                minlength=decks * (max_cmc + 1),
+            )
+            .astype(np.int64)
+            .reshape(decks, max_cmc + 1)
+        )
+
+    def averageCmc(self, per_deck: bool = False) -> float | np.ndarray:
+        """The average converted mana cost of the nonland cards in the deck, weighted by quantity
+
+        Arguments:
+            per_deck: `bool` Average each deck separately
+
+        Returns:
+            The average, or an array with the average of each deck. It is `nan` where there are no nonland cards.
+        """
+        mask = self.in_deck & ((self.types & _LAND) == 0)
+        cmc = np.nan_to_num(self.effective_cmc)
+        total = self._sum(self.quantity * cmc, mask, per_deck)
+        count = self._sum(self.quantity, mask, per_deck)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.divide(total, count, dtype=float)
+
+    def colorCounts(
+        self, identity: bool = False, per_deck: bool = False
+    ) -> Dict[str, int | np.ndarray]:
+        """Counts the cards in the deck of each color
+
+        Multicolored cards count towards each of their colors.
+
+        Arguments:
+            identity: `bool` Count by color identity instead of by color
+
+            per_deck: `bool` Count each deck separately
+
+        Returns:
+            The count for each of `COLORS`, or with `per_deck` an array with the count for each deck
+        """
+        bits = self.color_identity if identity else self.colors
+        return {
+            color: self._sum(
+                self.quantity, self.in_deck & ((bits & bit) != 0), per_deck
+            )
+            for color, bit in _COLOR_BITS.items()
+        }
+
+    def typeCounts(self, per_deck: bool = False) -> Dict[str, int | np.ndarray]:
+        """Counts the cards in the deck of each card type
+
+        Cards with several types count towards each of them.
+
+        Arguments:
+            per_deck: `bool` Count each deck separately
+
+        Returns:
+            The count for each of `CARD_TYPES`, or with `per_deck` an array with the count for each deck
+        """
+        return {
+            type: self._sum(
+                self.quantity, self.in_deck & ((self.types & bit) != 0), per_deck
+            )
+            for type, bit in _TYPE_BITS.items()
+        }
+
+    def priceTotals(self, per_deck: bool = False) -> Dict[str, float | np.ndarray]:
+        """Totals the price of the cards counted towards the price of the deck, by vendor
+
+        Cards a vendor has no price for add nothing to its total.
+
+        Arguments:
+            per_deck: `bool` Total each deck separately
+
+        Returns:
+            The total for each vendor, or with `per_deck` an array with the total for each deck
+        """
+        return {
+            vendor: self._sum(
+                self.quantity * np.nan_to_num(prices), self.in_price, per_deck
+            )
+            for vendor, prices in self.prices.items()
+        }
+
+    def _sum(
+        self, values: np.ndarray, mask: np.ndarray, per_deck: bool
+    ) -> int | float | np.ndarray:
+        if not per_deck:
+            return values[mask].sum().item()
+        totals = np.bincount(
+            self.deck[mask], weights=values[mask], minlength=len(self.deck_ids)
+        )
+        return totals.astype(values.dtype, copy=False)
+
+
+def _bits(names: Iterable[str] | None, bits: Dict[str, int]) -> int:
+    value = 0
+    for name in names or ():
+        value |= bits.get(name, 0)
+    return value
@@ -0,0 +1,465 @@
+"""
+Append-only corpus files of decks, memory-mapped for random access by deck id
+
+A corpus is two files:
+
+- The data file, `{path}`, starts with a header and then holds one record per stored deck version, back to back.
+  Each record is encoded like a snapshot of that single deck (see `pyrchidekt.snapshot`), so it can be decoded
+  without touching any other record.
+- The index file, `{path}.idx`, starts with a header and then holds a fixed-size entry per record: the deck id,
+  the record's offset and length in the data file, and the deck's format code.
+
+Both headers carry the same random generation, which changes whenever the corpus is compacted, so a reader never
+pairs a data file with the index of another. Storing a deck that is already in the corpus appends a new record and
+supersedes the old one, which stays in the files until `DeckCorpus.compact` rewrites them.
+
+Records are written before their index entries, so readers in other processes only ever see entries for records
+that are complete. Writers take an exclusive lock on `{path}.lock` around appends and compaction.
+
+Records are decoded with marshal, which is not secure against maliciously constructed data, so only open corpora
+from trusted sources.
+"""
+
+from __future__ import annotations
+from .deck import Deck
+from .formats import Format
+from .snapshot import _MARSHAL_VERSION, _Writer, _read
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Tuple
+import argparse
+import json
+import marshal
+import mmap
+import os
+import struct
+import tempfile
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+if TYPE_CHECKING:
+    from .registry import CardRegistry
+
+DATA_MAGIC = b"PYRCCRP\x00"
+"""`bytes` The first bytes of every corpus data file"""
+
+INDEX_MAGIC = b"PYRCIDX\x00"
+"""`bytes` The first bytes of every corpus index file"""
+
+VERSION = 1
+"""`int` The version of the corpus format written, and the only one read"""
+
+_HEADER = struct.Struct("<8sHH8s")
+_ENTRY = struct.Struct("<qQIi")
+_NO_FORMAT = -1
+_BATCH = 1000
+_OPEN_ATTEMPTS = 50
+
+
+class CorpusError(ValueError):
+    """Raised when reading something that isn't a corpus, or a corpus of an unsupported version"""
+
+
+class DeckCorpus:
+    """A corpus file of decks, opened for random access by deck id
+
+    Only the index is read into memory when the corpus is opened. The data file is memory-mapped, and a deck is
+    decoded from its record when it is asked for, so the corpus can be far larger than the memory available:
+    ```python
+    with DeckCorpus("decks.corpus", create=True) as corpus:
+        corpus.appendJson(data)
+        deck = corpus[deck_id]
+        for deck in corpus.iter(format=Format.COMMANDER):
+            ...
+    ```
+
+    Any number of processes can read the same corpus, and append to it, at the same time. A reader sees the
+    decks that were stored when it was opened, or last refreshed with `refresh`. It keeps working while another
+    process compacts the corpus, and picks up the compacted files on its next refresh.
+
+    Iterating over the corpus, like over a dictionary, yields the ids of the stored decks.
+
+    Attributes:
+        path: `Path` The data file
+
+        index_path: `Path` The index file
+
+        registry: `CardRegistry | None` If given, oracle cards and editions of the decoded decks are shared
+        through this registry, as with `Deck.fromJson`
+    """
+
+    INDEX_SUFFIX = ".idx"
+    LOCK_SUFFIX = ".lock"
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        registry: CardRegistry | None = None,
+        create: bool = False,
+    ):
+        """Opens a corpus
+
+        Arguments:
+            path: `str | os.PathLike` The data file of the corpus
+
+            registry: `CardRegistry | None` Shares oracle cards and editions between decoded decks
+
+            create: `bool` Whether to create an empty corpus if there isn't one at `path`
+
+        Raises:
+            FileNotFoundError: If there is no corpus at `path` and `create` is `False`
+
+            CorpusError: If the files aren't a corpus, or have an unsupported version
+        """
+        self.path = Path(path).expanduser()
+        self.index_path = self.path.with_name(self.path.name + self.INDEX_SUFFIX)
+        self.registry = registry
+        self._lock = Lock()
+        self._write_lock = Lock()
+        self._offsets: Dict[int, Tuple[int, int, int]] = {}
+        self._entries = 0
+        self._index_position = 0
+        self._index_inode = None
+        self._data_inode = None
+        self._map = None
+        self._view = None
+
+        if create and not self.path.exists():
+            with self._locked():
+                if not self.path.exists():
+                    self._create()
+        self._open()
+
+    def __enter__(self) -> DeckCorpus:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmaps the data file. The corpus can't be read afterwards."""
+        if self._view is not None:
+            self._view.release()
+            self._map.close()
+            self._view = None
+            self._map = None
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._offsets
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(list(self._offsets))
+
+    def __getitem__(self, id: int) -> Deck:
+        """Decodes a deck from its record
+
+        Arguments:
+            id: `int` The ID of the deck
+
+        Returns:
+            The latest stored version of the deck
+
+        Raises:
+            KeyError: If the deck isn't in the corpus
+        """
+        offset, length, _ = self._offsets[id]
+        return self._decode(self._view, offset, length)
+
+    def get(self, id: int, default: Deck | None = None) -> Deck | None:
+        """Decodes a deck from its record, if it is in the corpus
+
+        Arguments:
+            id: `int` The ID of the deck
+
+            default: `Deck | None` Returned when the deck isn't in the corpus
+
+        Returns:
+            The latest stored version of the deck, or `default`
+        """
+        entry = self._offsets.get(id)
+        if entry is None:
+            return default
+        return self._decode(self._view, entry[0], entry[1])
+
+    def iter(self, format: Format | None = None) -> Iterator[Deck]:
+        """Decodes the stored decks one at a time, in the order they were stored
+
+        Decks are filtered on the format code kept in the index, so the records of other formats aren't read at
+        all. Records are decoded straight from the mapped file, without copying them first.
+
+        Arguments:
+            format: `Format | None` Only yields decks of this format. `None` yields every deck.
+
+        Returns:
+            An iterator over the latest stored version of each deck
+        """
+        code = None if format is None else format.value
+        view = self._view
+        entries = list(self._offsets.values())
+        for offset, length, deck_format in entries:
+            if code is None or deck_format == code:
+                yield self._decode(view, offset, length)
+
+    @property
+    def superseded(self) -> int:
+        """`int` The number of records holding older versions of stored decks, which `compact` would remove"""
+        return self._entries - len(self._offsets)
+
+    def append(self, deck: Deck) -> None:
+        """Stores a deck, superseding any version of it already in the corpus
+
+        Arguments:
+            deck: `Deck` The deck. Decks created with a projection can't be stored.
+        """
+        self.extend((deck,))
+
+    def appendJson(self, data: dict) -> Deck:
+        """Builds a deck from its JSON with `Deck.fromJson` and stores it
+
+        Arguments:
+            data: `dict` The deck JSON
+
+        Returns:
+            The `Deck` that was stored
+        """
+        deck = Deck.fromJson(data, registry=self.registry)
+        self.append(deck)
+        return deck
+
+    def extend(self, decks: Iterable[Deck]) -> int:
+        """Stores many decks
+
+        The lock is held until every deck has been stored, and the index is written every thousand decks, so
+        other readers see a long ingestion in steps rather than all at the end.
+
+        Arguments:
+            decks: `Iterable[Deck]` The decks. Decks created with a projection can't be stored.
+
+        Returns:
+            The number of decks stored
+        """
+        stored = 0
+        with self._locked():
+            with open(self.path, "ab") as data, open(self.index_path, "ab") as index:
+                offset = data.seek(0, os.SEEK_END)
+                entries = bytearray()
+                for deck in decks:
+                    body = marshal.dumps(_Writer().write((deck,)), _MARSHAL_VERSION)
+                    data.write(body)
+                    code = _NO_FORMAT if deck.format is None else deck.format.value
+                    entries += _ENTRY.pack(deck.id, offset, len(body), code)
+                    offset += len(body)
+                    stored += 1
+                    if stored % _BATCH == 0:
+                        self._writeEntries(data, index, entries)
+                        entries = bytearray()
+                self._writeEntries(data, index, entries)
+        self.refresh()
+        return stored
+
+    @staticmethod
+    def _writeEntries(data, index, entries: bytearray) -> None:
+        # The records are flushed before their entries, so readers never see an entry without its record
+        data.flush()
+        index.write(entries)
+        index.flush()
+
+    def refresh(self) -> None:
+        """Picks up decks stored since the corpus was opened or last refreshed, by this or any other process
+
+        If the corpus was compacted in the meantime, the compacted files are opened instead.
+        """
+        with self._lock:
+            try:
+                index_inode = os.stat(self.index_path).st_ino
+                data_inode = os.stat(self.path).st_ino
+            except FileNotFoundError:
+                index_inode = data_inode = None
+            if index_inode != self._index_inode or data_inode != self._data_inode:
+                self._open(locked=True)
+                return
+
+            with open(self.index_path, "rb") as index:
+                index.seek(self._index_position)
+                raw = index.read()
+            if len(raw) < _ENTRY.size:
+                return
+            # Entries are only read once their records were written, so mapping the data file now covers them
+            with open(self.path, "rb") as data:
+                if os.fstat(data.fileno()).st_ino != self._data_inode:
+                    self._open(locked=True)
+                    return
+                if os.fstat(data.fileno()).st_size > len(self._map):
+                    self._mapData(data)
+            self._load(raw)
+
+    def compact(self) -> int:
+        """Rewrites the corpus with only the latest version of each deck
+
+        Records are copied as they are, without decoding them. The new files replace the old ones once they are
+        complete, and readers that still have the old files open keep reading them until they refresh.
+
+        Returns:
+            The number of bytes reclaimed
+        """
+        with self._locked():
+            self.refresh()
+            before = os.stat(self.path).st_size
+            generation = os.urandom(8)
+            view = self._view
+            data_temp = self._temporary()
+            index_temp = self._temporary()
+            try:
+                with open(data_temp, "wb") as data, open(index_temp, "wb") as index:
+                    data.write(_HEADER.pack(DATA_MAGIC, VERSION, 0, generation))
+                    index.write(_HEADER.pack(INDEX_MAGIC, VERSION, 0, generation))
+                    position = _HEADER.size
+                    entries = bytearray()
+                    for id, (offset, length, code) in self._offsets.items():
+                        data.write(view[offset : offset + length])
+                        entries += _ENTRY.pack(id, position, length, code)
+                        position += length
+                    index.write(entries)
+                os.replace(data_temp, self.path)
+                os.replace(index_temp, self.index_path)
+            except BaseException:
+                for temp in (data_temp, index_temp):
+                    try:
+                        os.unlink(temp)
+                    except FileNotFoundError:
+                        pass
+                raise
+            self._open()
+        return before - position
+
+    def _temporary(self) -> str:
+        fd, temp = tempfile.mkstemp(dir=self.path.parent, prefix=".", suffix=".tmp")
+        os.close(fd)
+        return temp
+
+    @contextmanager
+    def _locked(self):
+        with self._write_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path.with_name(self.path.name + self.LOCK_SUFFIX), "a") as f:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _create(self) -> None:
+        generation = os.urandom(8)
+        with open(self.path, "wb") as f:
+            f.write(_HEADER.pack(DATA_MAGIC, VERSION, 0, generation))
+        with open(self.index_path, "wb") as f:
+            f.write(_HEADER.pack(INDEX_MAGIC, VERSION, 0, generation))
+
+    def _open(self, locked: bool = False) -> None:
+        if not locked:
+            with self._lock:
+                return self._open(locked=True)
+
+        # Compaction replaces the data file and then the index, so the two can briefly be of different
+        # generations. The index is read before the data file is mapped, so every entry read has its record mapped.
+        for _ in range(_OPEN_ATTEMPTS):
+            with open(self.index_path, "rb") as index:
+                index_generation = self._generation(
+                    index.read(_HEADER.size), INDEX_MAGIC
+                )
+                index_inode = os.fstat(index.fileno()).st_ino
+                raw = index.read()
+            with open(self.path, "rb") as data:
+                generation = self._generation(data.read(_HEADER.size), DATA_MAGIC)
+                if generation == index_generation:
+                    self._mapData(data)
+                    break
+            time.sleep(0.01)
+        else:
+            raise CorpusError(f"The index of {self.path} doesn't match its data file")
+
+        self._index_inode = index_inode
+        self._offsets = {}
+        self._entries = 0
+        self._index_position = _HEADER.size
+        self._load(raw)
+
+    @staticmethod
+    def _generation(header: bytes, magic: bytes) -> bytes:
+        if len(header) < _HEADER.size:
+            raise CorpusError("Not a pyrchidekt corpus: the file is too short")
+        file_magic, version, _, generation = _HEADER.unpack(header)
+        if file_magic != magic:
+            raise CorpusError("Not a pyrchidekt corpus: bad magic bytes")
+        if version != VERSION:
+            raise CorpusError(
+                f"Unsupported corpus version {version}, this version of pyrchidekt reads version {VERSION}"
+            )
+        return generation
+
+    def _mapData(self, data) -> None:
+        # Readers that are still iterating keep the previous view, which stays valid until it is garbage collected
+        self._map = mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self._data_inode = os.fstat(data.fileno()).st_ino
+
+    def _load(self, raw: bytes) -> None:
+        # A partially written entry at the end is left for the next refresh
+        usable = len(raw) - len(raw) % _ENTRY.size
+        offsets = self._offsets
+        for id, offset, length, code in _ENTRY.iter_unpack(memoryview(raw)[:usable]):
+            # Moving superseded decks to the end keeps the dictionary in the order of the records
+            offsets.pop(id, None)
+            offsets[id] = (offset, length, code)
+        self._entries += usable // _ENTRY.size
+        self._index_position += usable
+
+    def _decode(self, view: memoryview, offset: int, length: int) -> Deck:
+        record = view[offset : offset + length]
+        try:
+            payload = marshal.loads(record)
+        finally:
+            record.release()
+        return _read(payload, self.registry)[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manages pyrchidekt deck corpus files")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest = commands.add_parser("ingest", help="store decks from JSON files")
+    ingest.add_argument("corpus")
+    ingest.add_argument("files", nargs="+", help="files holding the JSON of a deck")
+    compact = commands.add_parser("compact", help="remove superseded versions of decks")
+    compact.add_argument("corpus")
+    args = parser.parse_args()
+
+    if args.command == "ingest":
+        with DeckCorpus(args.corpus, create=True) as corpus:
+
+            def decks() -> Iterator[Deck]:
+                for name in args.files:
+                    with open(name, "rb") as f:
+                        yield Deck.fromJson(json.load(f))
+
+            print(f"Stored {corpus.extend(decks())} decks, {len(corpus)} in the corpus")
+    else:
+        with DeckCorpus(args.corpus) as corpus:
+            superseded = corpus.superseded
+            reclaimed = corpus.compact()
+            print(
+                f"Removed {superseded} superseded decks, reclaiming {reclaimed} bytes"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,29 @@ Loose Wrapper around Archidekt's Deck object
 """
 
 from __future__ import annotations
-from .cards import ArchidektCard
+from .cards import ArchidektCard, LazyCardList
 from .categories import Category
+from .diff import CardChange, DeckDiff, changedFields, diffCards
 from .formats import Format
+from .index import DeckIndex
+from .metrics import CARDS, HYDRATE, getMetrics
 from .owner import Owner
-from dataclasses import dataclass
+from .projection import Projection, projectable
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, List
+from time import perf_counter
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, List, Sequence, Tuple
 from warnings import warn
 
+if TYPE_CHECKING:
+    from .columns import DeckFrame
+    from .legality import LegalityReport
+    from .prices import DeckPrice
+    from .registry import CardRegistry
 
-@dataclass
+
+@projectable
+@dataclass(slots=True)
 class Deck:
     """The Deck object
 
@@ -42,7 +54,7 @@ class Deck:
 
         view_count: `int` The number of views the deck has gotten
 
-        cards: `List[ArchidektCard]` The cards in the deck
+        cards: `List[ArchidektCard]` The cards in the deck. For lazily created decks this is a `LazyCardList`.
 
         points: `int` The points for the deck
 
@@ -63,6 +75,9 @@ class Deck:
         deck_tags: `List[str]` Tags for the deck
 
         card_package: `Any` The package for the deck.
+
+    Cards can be looked up by name, oracle card, printing, type or category with `find`, `byType` and
+    `byCategory`, which go through hash indexes built on first use.
     """
 
     id: int
@@ -87,9 +102,26 @@ class Deck:
     bookmarked: bool
     deck_tags: List[str]
     card_package: Any
+    _index: DeckIndex | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _price: Tuple[tuple, DeckPrice] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _registry: CardRegistry | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _projection: Projection | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @staticmethod
-    def fromJson(data: dict) -> Deck:
+    def fromJson(
+        data: dict,
+        registry: CardRegistry | None = None,
+        lazy: bool = False,
+        include: Projection | str | Iterable[str] | None = None,
+    ) -> Deck:
         """Creates a `Deck` from a `dict`
 
         This method creates `Deck` from a JSON deserialized `dict`.
@@ -122,73 +154,558 @@ class Deck:
         }
         ```
 
-        This method will loop through all the lists and create objects from them as well.
+        This method will loop through all the lists and create objects from them as well. With `lazy`, the deck
+        is returned without building any of its cards: `Deck.cards` and each `Category.cards` are then
+        `LazyCardList`s that build each card on first use. This is much quicker when only the deck's own fields
+        or a few cards are needed, and the deck compares equal to one created eagerly.
+
+        With `include`, only some fields are loaded, either those of a named profile such as `"gameplay"` or
+        `"pricing"` or those listed as `"Model.field"`. The JSON of the other fields isn't read at all, and reading
+        them raises a `SkippedFieldError`. See `Projection`.
+
+        The time taken is reported as `HYDRATE` to the installed metrics sink, if any, see `pyrchidekt.metrics`.
 
         Arguments:
             data: `dict` The deck data
 
+            registry: `CardRegistry | None` If given, oracle cards and editions are shared through this registry
+            with every other deck built with it. See `CardRegistry`.
+
+            lazy: `bool` Build cards on first use instead of up front
+
+            include: `Projection | str | Iterable[str] | None` The fields to load, all of them if not given
+
         Returns:
             The `Deck` object
+
+        Raises:
+            ValueError: If `include` names a profile or field that doesn't exist
         """
-        try:
-            _format = Format(data["deckFormat"])
-        except ValueError as e:
-            warn(
-                message=f"{e} -> skipping deck format\n"
-                f"For new formats, please file an issue at "
-                f"https://github.com/linkian209/pyrchidekt/issues",
-                category=RuntimeWarning,
-                stacklevel=2,
-            )
-            _format = None
-
-        retval = Deck(
-            id=data["id"],
-            name=data["name"],
-            created_at=datetime.fromisoformat(data["createdAt"]),
-            updated_at=datetime.fromisoformat(data["updatedAt"]),
-            format=_format,
-            description=data["description"],
-            featured=data["featured"],
-            custom_featured=data["customFeatured"],
-            game=data["game"],
-            private=data["private"],
-            view_count=data["viewCount"],
-            cards=[ArchidektCard.fromJson(x) for x in data["cards"]],
-            points=data["points"],
-            user_input=data["userInput"],
-            owner=Owner.fromJson(data["owner"]),
-            categories=[Category.fromJson(x) for x in data["categories"]],
-            comment_root=data["commentRoot"],
-            editors=data["editors"],
-            parent_folder=data["parentFolder"],
-            bookmarked=data["bookmarked"],
-            deck_tags=data["deckTags"],
-            card_package=data["cardPackage"],
+        metrics = getMetrics()
+        if metrics is not None:
+            start = perf_counter()
+        projection = None if include is None else Projection.get(include)
+        _format = _readFormat(data)
+
+        cards = (
+            LazyCardList(data["cards"], registry, projection=projection)
+            if lazy
+            else [
+                ArchidektCard.fromJson(x, registry, projection) for x in data["cards"]
+            ]
         )
+        categories = [Category.fromJson(x) for x in data["categories"]]
+
+        if projection is not None:
+            retval = projection.build(
+                Deck,
+                _DECK_READERS,
+                data,
+                format=_format,
+                cards=cards,
+                categories=categories,
+            )
+        else:
+            retval = Deck(
+                id=data["id"],
+                name=data["name"],
+                created_at=datetime.fromisoformat(data["createdAt"]),
+                updated_at=datetime.fromisoformat(data["updatedAt"]),
+                format=_format,
+                description=data["description"],
+                featured=data["featured"],
+                custom_featured=data["customFeatured"],
+                game=data["game"],
+                private=data["private"],
+                view_count=data["viewCount"],
+                cards=cards,
+                points=data["points"],
+                user_input=data["userInput"],
+                owner=Owner.fromJson(data["owner"]),
+                categories=categories,
+                comment_root=data["commentRoot"],
+                editors=data["editors"],
+                parent_folder=data["parentFolder"],
+                bookmarked=data["bookmarked"],
+                deck_tags=data["deckTags"],
+                card_package=data["cardPackage"],
+            )
+
+        retval._registry = registry
+        retval._projection = projection
+        retval.linkCategories()
+
+        if metrics is not None:
+            metrics.timing(HYDRATE, perf_counter() - start)
+            metrics.count(CARDS, len(data["cards"]))
+
+        return retval
+
+    def diff(self, other: Deck) -> DeckDiff:
+        """Compares the cards of this deck with those of another version of it
+
+        Cards are matched by `ArchidektCard.id`. Those in both decks are compared on their quantity, categories,
+        modifier and label, see `pyrchidekt.diff`. Cards of lazily created decks are built to compare them, and
+        fields that neither deck loaded, as both were created with an `include` leaving them out, are not compared.
 
-        categories = {x.name: x for x in retval.categories}
-
-        for card in retval.cards:
-            added_to_categories = False
-            if card.categories and len(card.categories):
-                for category in card.categories:
-                    deck_category = categories.get(category)
-                    if deck_category is None:
-                        deck_category = Category(name=category)
-                        categories[deck_category.name] = deck_category
-                        retval.categories.append(deck_category)
-                    deck_category.cards.append(card)
-                added_to_categories = True
-
-            if not added_to_categories and card.card.oracle_card.default_category:
-                deck_category = categories.get(card.card.oracle_card.default_category)
+        Arguments:
+            other: `Deck` The later version of the deck
+
+        Returns:
+            The `DeckDiff` from this deck to `other`
+        """
+        return diffCards(self.cards, other.cards)
+
+    def applyUpdate(self, data: dict, registry: CardRegistry | None = None) -> DeckDiff:
+        """Updates the deck in place from newer JSON of it, only building the cards that changed
+
+        A card is built again only when the JSON has a card id the deck doesn't hold, or a different
+        `updatedAt` for one it does. Every other card is kept as it is. Fields of a kept card's printing or
+        oracle card, such as prices, are therefore not refreshed. Categories are patched in place, so a
+        `Category` object stays the same across updates, and the deck's own fields are read again. The deck ends
+        up equal to `Deck.fromJson(data)` with the `lazy` and `include` it was created with. Its indexes and
+        memoized price are dropped.
+
+        For lazily created decks, new and changed cards are kept as JSON and built on first use, as usual. For
+        decks created with `include`, cards are built with the same projection and only the deck fields it loads
+        are read. When it leaves out `ArchidektCard.updated_at`, every card is built again, and the diff only
+        reports the changes to the fields that were loaded.
+
+        Arguments:
+            data: `dict` The newer deck JSON
+
+            registry: `CardRegistry | None` Shares the oracle cards and editions of the built cards, instead of
+            the registry the deck was created with. Lazily created decks always use the registry they were
+            created with.
+
+        Returns:
+            The `DeckDiff` from the deck as it was to the updated deck
+
+        Raises:
+            ValueError: If the JSON is of another deck
+        """
+        if data["id"] != self.id:
+            raise ValueError(f"Can't update deck {self.id} from deck {data['id']}")
+
+        lazy = isinstance(self.cards, LazyCardList)
+        projection = self._projection
+        if registry is None:
+            registry = self._registry
+        previous = {}
+        for entry in self.cards.entries() if lazy else self.cards:
+            previous[entry["id"] if type(entry) is dict else entry.id] = entry
+        entries = []
+        added = []
+        changed = []
+        for item in data["cards"]:
+            entry = previous.pop(item["id"], None)
+            if entry is not None and _unchanged(entry, item):
+                entries.append(entry)
+                continue
+            card = item if lazy else ArchidektCard.fromJson(item, registry, projection)
+            entries.append(card)
+            if entry is None:
+                added.append(card)
+            else:
+                changed.append((entry, card))
+
+        # Lazy entries are built for the diff through a sibling list, so they are shared with the deck's cards
+        build = self.cards.sibling if lazy else list
+        diff = DeckDiff(list(build(added)), list(build(previous.values())))
+        for before, after in zip(
+            build([x for x, _ in changed]), build([x for _, x in changed])
+        ):
+            fields = changedFields(before, after)
+            if fields:
+                diff.changed.append(CardChange(before, after, fields))
+
+        for name, read in _DECK_READERS.items():
+            if projection is None or projection.loads("Deck", name):
+                setattr(self, name, read(data))
+        self.format = _readFormat(data)
+
+        # Categories created by `linkCategories` are left out, it creates them again if they're still used
+        categories = {x.id: x for x in self.categories if x.id != -1}
+        patched = []
+        for item in data["categories"]:
+            category = categories.get(item["id"])
+            if category is None:
+                category = Category.fromJson(item)
+            else:
+                category.name = item["name"]
+                category.included_in_deck = item["includedInDeck"]
+                category.included_in_price = item["includedInPrice"]
+                category.is_premier = item["isPremier"]
+            patched.append(category)
+        self.categories[:] = patched
+        self.cards[:] = entries
+        if lazy:
+            self.cards.prune()
+        self.linkCategories()
+        self.invalidate()
+        return diff
+
+    def linkCategories(self) -> None:
+        """Sorts the deck's cards into its categories
+
+        Every category's `cards` is rebuilt from the categories listed on each card. Cards without any go into
+        their oracle card's default category, if they have one. Categories that a card names but the deck
+        doesn't have yet are created and appended to `categories`. This is done when a deck is created, and can
+        be called again after changing the cards.
+
+        For lazily created decks, cards that haven't been built are sorted by their JSON, without building them.
+        """
+        lazy = isinstance(self.cards, LazyCardList)
+        categories = {x.name: x for x in self.categories}
+        for category in self.categories:
+            category.cards = []
+
+        for card in self.cards.entries() if lazy else self.cards:
+            self._linkCard(card, categories)
+
+        if lazy:
+            for category in self.categories:
+                category.cards = self.cards.sibling(category.cards)
+
+    def _linkCard(
+        self, card: dict | ArchidektCard, categories: Dict[str, Category]
+    ) -> None:
+        if type(card) is dict:
+            card_categories = card["categories"]
+            default_category = card["card"]["oracleCard"]["defaultCategory"]
+        else:
+            card_categories = card.categories
+            default_category = card.card.oracle_card.default_category
+
+        added_to_categories = False
+        if card_categories and len(card_categories):
+            for category in card_categories:
+                deck_category = categories.get(category)
                 if deck_category is None:
-                    deck_category = Category(
-                        name=card.card.oracle_card.default_category
-                    )
+                    deck_category = Category(name=category)
                     categories[deck_category.name] = deck_category
-                    retval.categories.append(deck_category)
+                    self.categories.append(deck_category)
                 deck_category.cards.append(card)
+            added_to_categories = True
 
-        return retval
+        if not added_to_categories and default_category:
+            deck_category = categories.get(default_category)
+            if deck_category is None:
+                deck_category = Category(name=default_category)
+                categories[deck_category.name] = deck_category
+                self.categories.append(deck_category)
+            deck_category.cards.append(card)
+
+    def columns(self) -> DeckFrame:
+        """Packs the deck's cards into NumPy arrays for vectorized statistics
+
+        This needs NumPy, see `pyrchidekt.columns`. Decks created with `include` need the fields of the
+        `"pricing"` profile.
+
+        Returns:
+            The deck's `DeckFrame`
+        """
+        from .columns import DeckFrame
+
+        return DeckFrame.fromDeck(self)
+
+    def dump(self, file: IO[bytes]) -> None:
+        """Writes the deck to a binary file as a snapshot, see `pyrchidekt.snapshot`
+
+        Arguments:
+            file: `IO[bytes]` The file, opened for writing in binary mode
+
+        Raises:
+            ValueError: If the deck was created with `include`
+        """
+        from .snapshot import dumpDecks
+
+        dumpDecks([self], file)
+
+    @staticmethod
+    def load(file: IO[bytes], registry: CardRegistry | None = None) -> Deck:
+        """Reads a deck written with `Deck.dump`
+
+        Arguments:
+            file: `IO[bytes]` The file, opened for reading in binary mode
+
+            registry: `CardRegistry | None` If given, oracle cards and editions are shared through this registry
+
+        Returns:
+            The `Deck` object
+
+        Raises:
+            SnapshotError: If the file isn't a snapshot of a single deck
+        """
+        from .snapshot import SnapshotError, loadDecks
+
+        decks = loadDecks(file, registry)
+        if len(decks) != 1:
+            raise SnapshotError(
+                f"The snapshot holds {len(decks)} decks, use loadDecks to read it"
+            )
+        return decks[0]
+
+    def legality(self, format: Format | None = None) -> LegalityReport:
+        """Checks the deck against the rules of a format, see `pyrchidekt.legality`
+
+        Decks created with `include` need the fields of the `"gameplay"` profile.
+
+        Arguments:
+            format: `Format | None` The format to check against, the deck's own `format` if not given
+
+        Returns:
+            The `LegalityReport`
+
+        Raises:
+            ValueError: If no format is given and the deck doesn't have one
+        """
+        from .legality import checkLegality
+
+        format = format or self.format
+        if format is None:
+            raise ValueError(f"Deck {self.id} has no format to check against")
+        return checkLegality([self], [format])[0][format]
+
+    def isIncluded(self, card: ArchidektCard, price: bool = False) -> bool:
+        """Whether a card counts towards the deck, or towards its price
+
+        As on Archidekt, this is decided by the card's primary category (see `ArchidektCard.primary_category`):
+        cards whose primary category is one that Archidekt excludes, such as a maybeboard, don't count.
+
+        Arguments:
+            card: `ArchidektCard` A card of this deck
+
+            price: `bool` Check `Category.included_in_price` instead of `Category.included_in_deck`
+
+        Returns:
+            Whether the card is included
+        """
+        return self.inclusions().get(card.primary_category, (True, True))[price]
+
+    def inclusions(self) -> Dict[str, Tuple[bool, bool]]:
+        """Returns whether the cards of each category count towards the deck and towards its price
+
+        Only categories read from Archidekt are listed. Categories created by `linkCategories` don't exclude
+        anything.
+
+        Returns:
+            A tuple of `Category.included_in_deck` and `Category.included_in_price` by category name
+        """
+        return {
+            x.name: (x.included_in_deck, x.included_in_price)
+            for x in self.categories
+            if x.id != -1
+        }
+
+    def find(
+        self,
+        name: str | None = None,
+        oracle_id: int | None = None,
+        uid: str | None = None,
+    ) -> List[ArchidektCard]:
+        """Finds the cards matching every given criterion
+
+        ```python
+        if deck.find(name="sol ring"):
+            print("Sol Ring is in the deck")
+        ```
+
+        The first lookup builds the deck's indexes, after which lookups take constant time. The indexes are
+        rebuilt when `cards` is replaced or changes length. Cards changed or swapped in place, without
+        changing the length, aren't noticed: call `invalidate` after doing so, or use `addCard`, `removeCard`
+        and `replaceCard`.
+
+        Arguments:
+            name: `str | None` The oracle card name, in any case
+
+            oracle_id: `int | None` The ID of the oracle card
+
+            uid: `str | None` The UID of the printing
+
+        Returns:
+            The matching cards, in deck order. With no criteria, nothing matches.
+        """
+        positions = self._getIndex().find(name, oracle_id, uid)
+        return [self.cards[x] for x in positions]
+
+    def byType(self, type: str) -> List[ArchidektCard]:
+        """Returns the cards with a type, subtype or supertype, such as "Creature", "Elf" or "Legendary"
+
+        This goes through the same indexes as `find`, so call `invalidate` after changing or swapping cards in
+        place.
+
+        Arguments:
+            type: `str` The type, in any case
+
+        Returns:
+            The matching cards, in deck order
+        """
+        positions = self._getIndex().types.get(type.casefold(), [])
+        return [self.cards[x] for x in positions]
+
+    def byCategory(self, name: str) -> List[ArchidektCard]:
+        """Returns the cards in a category
+
+        This goes through the same indexes as `find`, so call `invalidate` after changing or swapping cards in
+        place.
+
+        Arguments:
+            name: `str` The name of the category
+
+        Returns:
+            The cards in the category, in deck order
+        """
+        positions = self._getIndex().categories.get(name, [])
+        return [self.cards[x] for x in positions]
+
+    def addCard(self, card: ArchidektCard) -> None:
+        """Adds a card to the end of the deck and to its categories, keeping the indexes up to date
+
+        The memoized price is dropped.
+
+        Arguments:
+            card: `ArchidektCard` The card to add
+        """
+        index = self._index
+        current = index is not None and index.fingerprint == self._fingerprint()
+        self.cards.append(card)
+        self._linkCard(card, {x.name: x for x in self.categories})
+        if current:
+            index.add(len(self.cards) - 1, card)
+            index.fingerprint = self._fingerprint()
+        self._price = None
+
+    def removeCard(self, card: ArchidektCard) -> None:
+        """Removes a card from the deck and from its categories
+
+        Arguments:
+            card: `ArchidektCard` The card to remove. Cards are matched by identity, not equality.
+
+        Raises:
+            ValueError: If the card isn't in the deck
+        """
+        position = _position(self.cards, card)
+        if position is None:
+            raise ValueError("Card is not in the deck")
+        del self.cards[position]
+        for category in self.categories:
+            position = _position(category.cards, card)
+            if position is not None:
+                del category.cards[position]
+        self.invalidate()
+
+    def replaceCard(self, old: ArchidektCard, new: ArchidektCard) -> None:
+        """Puts a card in the place of another, in the deck and in its categories
+
+        The cards are sorted into categories again, and the indexes and the memoized price are dropped.
+
+        Arguments:
+            old: `ArchidektCard` The card to replace. Cards are matched by identity, not equality.
+
+            new: `ArchidektCard` The card to put in its place
+
+        Raises:
+            ValueError: If `old` isn't in the deck
+        """
+        position = _position(self.cards, old)
+        if position is None:
+            raise ValueError("Card is not in the deck")
+        self.cards[position] = new
+        self.linkCategories()
+        self.invalidate()
+
+    def price(self, vendors: Sequence[str] | None = None) -> DeckPrice:
+        """Prices the deck by vendor, see `pyrchidekt.prices`
+
+        The result is memoized until `cards` is replaced or changes length, or `addCard`, `removeCard` or
+        `invalidate` is called. Call `invalidate` after changing cards or categories in place.
+
+        This needs NumPy, see `pyrchidekt.columns`. Decks created with `include` need the fields of the
+        `"pricing"` profile.
+
+        Arguments:
+            vendors: `Sequence[str] | None` The vendors compared for `DeckPrice.cheapest`, see `priceDecks`
+
+        Returns:
+            The deck's `DeckPrice`
+        """
+        from .prices import priceDecks
+
+        return priceDecks([self], vendors)[0]
+
+    def invalidate(self) -> None:
+        """Drops the indexes and the memoized price, so they are rebuilt when next used"""
+        self._index = None
+        self._price = None
+
+    def _requireAllFields(self, action: str) -> None:
+        if self._projection is not None:
+            raise ValueError(
+                f"Can't {action} deck {self.id}: it was created with {self._projection!r}, so some of its "
+                f"fields weren't loaded"
+            )
+
+    def _fingerprint(self) -> tuple:
+        return id(self.cards), len(self.cards)
+
+    def _getIndex(self) -> DeckIndex:
+        fingerprint = self._fingerprint()
+        if self._index is None or self._index.fingerprint != fingerprint:
+            cards = self.cards
+            self._index = DeckIndex(
+                cards.entries() if isinstance(cards, LazyCardList) else cards,
+                fingerprint,
+            )
+        return self._index
+
+
+def _readFormat(data: dict) -> Format | None:
+    try:
+        return Format(data["deckFormat"])
+    except ValueError as e:
+        warn(
+            message=f"{e} -> skipping deck format\n"
+            f"For new formats, please file an issue at "
+            f"https://github.com/linkian209/pyrchidekt/issues",
+            category=RuntimeWarning,
+            stacklevel=3,
+        )
+        return None
+
+
+def _unchanged(entry: dict | ArchidektCard, data: dict) -> bool:
+    if type(entry) is dict:
+        return entry["updatedAt"] == data["updatedAt"]
+    # Cards whose projection left out `updated_at` can't tell, so they are built again
+    updated_at = getattr(entry, "updated_at", None)
+    return updated_at == datetime.fromisoformat(data["updatedAt"])
+
+
+def _position(cards: List[ArchidektCard], card: ArchidektCard) -> int | None:
+    entries = cards.entries() if isinstance(cards, LazyCardList) else cards
+    return next((i for i, x in enumerate(entries) if x is card), None)
+
+
+# How each field that isn't always loaded is read, for `Projection.build`
+_DECK_READERS = {
+    "id": lambda x: x["id"],
+    "name": lambda x: x["name"],
+    "created_at": lambda x: datetime.fromisoformat(x["createdAt"]),
+    "updated_at": lambda x: datetime.fromisoformat(x["updatedAt"]),
+    "description": lambda x: x["description"],
+    "featured": lambda x: x["featured"],
+    "custom_featured": lambda x: x["customFeatured"],
+    "game": lambda x: x["game"],
+    "private": lambda x: x["private"],
+    "view_count": lambda x: x["viewCount"],
+    "points": lambda x: x["points"],
+    "user_input": lambda x: x["userInput"],
+    "owner": lambda x: Owner.fromJson(x["owner"]),
+    "comment_root": lambda x: x["commentRoot"],
+    "editors": lambda x: x["editors"],
+    "parent_folder": lambda x: x["parentFolder"],
+    "bookmarked": lambda x: x["bookmarked"],
+    "deck_tags": lambda x: x["deckTags"],
+    "card_package": lambda x: x["cardPackage"],
+}
@@ -0,0 +1,380 @@
+"""
+Fast decoding of deck JSON straight from response bytes into the deck model types
+
+When msgspec is installed, decks are decoded with a schema compiled from the models: the camelCase to
+snake_case field mapping and the date and datetime parsing are done by msgspec while reading the bytes, without
+building an intermediate `dict` for every object. Without it, decoding falls back to `json.loads` and
+`Deck.fromJson`. Both give equal decks.
+"""
+
+from __future__ import annotations
+from .cards import ArchidektCard, Card, OracleCard, _splitLabel
+from .categories import Category
+from .deck import Deck
+from .edition import Edition
+from .formats import Format, Legalities
+from .mana import ManaProduction
+from .metrics import CARDS, DECODE, HYDRATE, getMetrics
+from .owner import Owner
+from datetime import date, datetime
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Dict, List
+from warnings import warn
+import json
+
+if TYPE_CHECKING:
+    from .registry import CardRegistry
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+FAST_DECODE = msgspec is not None
+"""`bool` Whether the msgspec decoder is available"""
+
+_JSON_NAMES = {
+    "multiverse_id": "multiverseid",
+    "code": "editioncode",
+    "name_": "editionname",
+    "date": "editiondate",
+    "type": "editiontype",
+    "white": "W",
+    "blue": "U",
+    "black": "B",
+    "red": "R",
+    "green": "G",
+    "colorless": "C",
+}
+
+
+def _jsonName(name: str) -> str:
+    if name in _JSON_NAMES:
+        return _JSON_NAMES[name]
+    head, *rest = name.split("_")
+    return head + "".join(x.capitalize() for x in rest)
+
+
+if FAST_DECODE:
+
+    class EditionSchema(msgspec.Struct, rename=_jsonName, gc=False):
+        code: str
+        name_: str
+        date: date
+        type: str
+        mtgo_code: Any
+
+    class ManaProductionSchema(msgspec.Struct, rename=_jsonName, gc=False):
+        white: Any = None
+        blue: Any = None
+        black: Any = None
+        red: Any = None
+        green: Any = None
+        colorless: Any = None
+
+    class OracleCardSchema(msgspec.Struct, rename=_jsonName, gc=False):
+        id: int
+        cmc: Any
+        color_identity: Any
+        colors: Any
+        faces: Any
+        layout: Any
+        legalities: Dict[str, str]
+        mana_cost: Any
+        mana_production: ManaProductionSchema
+        name: str
+        power: Any
+        salt: Any
+        sub_types: Any
+        super_types: Any
+        text: Any
+        tokens: Any
+        toughness: Any
+        types: Any
+        loyalty: Any
+        default_category: Any
+
+    class CardSchema(msgspec.Struct, rename=_jsonName, gc=False):
+        id: Any
+        artist: Any
+        tcg_product_id: Any
+        ck_foil_id: Any
+        ck_normal_id: Any
+        cm_ed: Any
+        collector_number: Any
+        multiverse_id: Any
+        mtgo_foil_id: Any
+        mtgo_normal_id: Any
+        uid: Any
+        display_name: Any
+        edition: EditionSchema
+        flavor: Any
+        games: Any
+        options: Any
+        oracle_card: OracleCardSchema
+        owned: Any
+        prices: Any
+        rarity: Any
+
+    class ArchidektCardSchema(msgspec.Struct, rename=_jsonName, gc=False):
+        id: Any
+        card: CardSchema
+        categories: Any
+        companion: Any
+        flipped_default: Any
+        label: Any
+        modifier: Any
+        quantity: Any
+        custom_cmc: Any
+        removed_categories: Any
+        created_at: datetime
+        updated_at: datetime
+        deleted_at: datetime | None
+
+    class OwnerSchema(msgspec.Struct, rename=_jsonName, gc=False):
+        id: Any
+        username: Any
+        avatar: Any
+        frame: Any
+        ck_affiliate: Any
+        tcg_affiliate: Any
+        referrer_enum: Any
+
+    class CategorySchema(msgspec.Struct, rename=_jsonName, gc=False):
+        id: Any
+        name: Any
+        included_in_deck: Any
+        included_in_price: Any
+        is_premier: Any
+
+    class DeckSchema(msgspec.Struct, rename=_jsonName, gc=False):
+        id: int
+        name: Any
+        created_at: datetime
+        updated_at: datetime
+        deck_format: Any
+        description: Any
+        featured: Any
+        custom_featured: Any
+        game: Any
+        private: Any
+        view_count: Any
+        cards: List[ArchidektCardSchema]
+        points: Any
+        user_input: Any
+        owner: OwnerSchema
+        categories: List[CategorySchema]
+        comment_root: Any
+        editors: Any
+        parent_folder: Any
+        bookmarked: Any
+        deck_tags: Any
+        card_package: Any
+
+    class DeckVersionSchema(msgspec.Struct, rename=_jsonName, gc=False):
+        id: int
+        updated_at: datetime
+
+    _deck_decoder = msgspec.json.Decoder(DeckSchema)
+    _version_decoder = msgspec.json.Decoder(DeckVersionSchema)
+
+
+def decodeDeck(
+    raw: bytes | str, registry: CardRegistry | None = None, lazy: bool = False
+) -> Deck:
+    """Creates a `Deck` straight from the raw JSON of a deck
+
+    Decoding and building the deck are reported as `DECODE` and `HYDRATE` to the installed metrics sink, if any.
+
+    Arguments:
+        raw: `bytes | str` The deck JSON, as returned by the API
+
+        registry: `CardRegistry | None` If given, oracle cards and editions are shared through this registry
+
+        lazy: `bool` Build cards on first use instead of up front, see `Deck.fromJson`. Lazy decks always go
+        through `json.loads` as they keep each card's JSON until it is needed.
+
+    Returns:
+        The `Deck` object
+    """
+    metrics = getMetrics()
+    if metrics is None:
+        if not FAST_DECODE or lazy:
+            return Deck.fromJson(json.loads(raw), registry, lazy=lazy)
+        return _deck(_deck_decoder.decode(raw), registry)
+
+    start = perf_counter()
+    if not FAST_DECODE or lazy:
+        data = json.loads(raw)
+        metrics.timing(DECODE, perf_counter() - start)
+        return Deck.fromJson(data, registry, lazy=lazy)
+    decoded = _deck_decoder.decode(raw)
+    decoded_at = perf_counter()
+    metrics.timing(DECODE, decoded_at - start)
+    deck = _deck(decoded, registry)
+    metrics.timing(HYDRATE, perf_counter() - decoded_at)
+    metrics.count(CARDS, len(deck.cards))
+    return deck
+
+
+def decodeDeckVersion(raw: bytes | str) -> tuple:
+    """Reads just the id and last update of a deck from its raw JSON
+
+    Arguments:
+        raw: `bytes | str` The deck JSON
+
+    Returns:
+        A tuple of the deck's `id` and `updated_at`
+    """
+    if not FAST_DECODE:
+        data = json.loads(raw)
+        return data["id"], datetime.fromisoformat(data["updatedAt"])
+    version = _version_decoder.decode(raw)
+    return version.id, version.updated_at
+
+
+def _deck(s: Any, registry: CardRegistry | None) -> Deck:
+    try:
+        _format = Format(s.deck_format)
+    except ValueError as e:
+        warn(
+            message=f"{e} -> skipping deck format\n"
+            f"For new formats, please file an issue at "
+            f"https://github.com/linkian209/pyrchidekt/issues",
+            category=RuntimeWarning,
+            stacklevel=3,
+        )
+        _format = None
+
+    owner = s.owner
+    deck = Deck(
+        s.id,
+        s.name,
+        s.created_at,
+        s.updated_at,
+        _format,
+        s.description,
+        s.featured,
+        s.custom_featured,
+        s.game,
+        s.private,
+        s.view_count,
+        [_archidektCard(x, registry) for x in s.cards],
+        s.points,
+        s.user_input,
+        Owner(
+            owner.id,
+            owner.username,
+            owner.avatar,
+            owner.frame,
+            owner.ck_affiliate,
+            owner.tcg_affiliate,
+            owner.referrer_enum,
+        ),
+        [
+            Category(
+                x.id, x.name, x.included_in_deck, x.included_in_price, x.is_premier
+            )
+            for x in s.categories
+        ],
+        s.comment_root,
+        s.editors,
+        s.parent_folder,
+        s.bookmarked,
+        s.deck_tags,
+        s.card_package,
+    )
+    deck._registry = registry
+    deck.linkCategories()
+    return deck
+
+
+def _archidektCard(s: Any, registry: CardRegistry | None) -> ArchidektCard:
+    label, label_color = _splitLabel(s.label)
+    return ArchidektCard(
+        s.id,
+        _card(s.card, registry),
+        s.categories,
+        s.companion,
+        s.flipped_default,
+        label,
+        label_color,
+        s.modifier,
+        s.quantity,
+        s.custom_cmc,
+        s.removed_categories,
+        s.created_at,
+        s.updated_at,
+        s.deleted_at,
+    )
+
+
+def _card(s: Any, registry: CardRegistry | None) -> Card:
+    if registry is None:
+        edition = _edition(s.edition)
+        oracle_card = _oracleCard(s.oracle_card)
+    else:
+        edition = registry.getEdition(s.edition.code, _edition, s.edition)
+        oracle_card = registry.getOracleCard(
+            s.oracle_card.id, _oracleCard, s.oracle_card
+        )
+
+    return Card(
+        s.id,
+        s.artist,
+        s.tcg_product_id,
+        s.ck_foil_id,
+        s.ck_normal_id,
+        s.cm_ed,
+        s.collector_number,
+        s.multiverse_id,
+        s.mtgo_foil_id,
+        s.mtgo_normal_id,
+        s.uid,
+        s.display_name,
+        edition,
+        s.flavor,
+        s.games,
+        s.options,
+        oracle_card,
+        s.owned,
+        s.prices,
+        s.rarity,
+    )
+
+
+def _edition(s: Any) -> Edition:
+    return Edition(s.code, s.name_, s.date, s.type, s.mtgo_code)
+
+
+def _oracleCard(s: Any) -> OracleCard:
+    production = s.mana_production
+    return OracleCard(
+        s.id,
+        s.cmc,
+        s.color_identity,
+        s.colors,
+        s.faces,
+        s.layout,
+        Legalities.fromJson(s.legalities),
+        s.mana_cost,
+        ManaProduction(
+            production.white,
+            production.blue,
+            production.black,
+            production.red,
+            production.green,
+            production.colorless,
+        ),
+        s.name,
+        s.power,
+        s.salt,
+        s.sub_types,
+        s.super_types,
+        s.text,
+        s.tokens,
+        s.toughness,
+        s.types,
+        s.loyalty,
+        s.default_category,
+    )
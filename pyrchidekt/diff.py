@@ -0,0 +1,106 @@
+"""
+Differences between two versions of a deck's cards
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, List, Tuple
+
+if TYPE_CHECKING:
+    from .cards import ArchidektCard
+
+DIFF_FIELDS = ("quantity", "categories", "modifier", "label", "label_color")
+"""`Tuple[str, ...]` The fields of `ArchidektCard` compared by `diffCards`"""
+
+
+@dataclass(slots=True)
+class CardChange:
+    """A card that is in both versions of a deck, with some of its `DIFF_FIELDS` changed
+
+    Attributes:
+        before: `ArchidektCard` The card in the earlier version
+
+        after: `ArchidektCard` The card in the later version
+
+        fields: `Tuple[str, ...]` The names of the fields that changed, in the order of `DIFF_FIELDS`
+    """
+
+    before: ArchidektCard
+    after: ArchidektCard
+    fields: Tuple[str, ...]
+
+
+@dataclass(slots=True)
+class DeckDiff:
+    """The cards added to, removed from and changed in a deck between two versions
+
+    A diff is true when anything changed.
+
+    Attributes:
+        added: `List[ArchidektCard]` Cards only in the later version, in its order
+
+        removed: `List[ArchidektCard]` Cards only in the earlier version, in its order
+
+        changed: `List[CardChange]` Cards in both versions whose quantity, categories, modifier or label changed
+    """
+
+    added: List[ArchidektCard] = field(default_factory=list)
+    removed: List[ArchidektCard] = field(default_factory=list)
+    changed: List[CardChange] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def changedFields(before: ArchidektCard, after: ArchidektCard) -> Tuple[str, ...]:
+    """Returns which of the `DIFF_FIELDS` differ between two versions of a card
+
+    Fields that neither version loaded, as both were created with a projection leaving them out, are not
+    compared. A field only one of them loaded counts as changed.
+
+    Arguments:
+        before: `ArchidektCard` The earlier version
+
+        after: `ArchidektCard` The later version
+
+    Returns:
+        The names of the fields that differ
+    """
+    return tuple(
+        x
+        for x in DIFF_FIELDS
+        if getattr(before, x, _SKIPPED) != getattr(after, x, _SKIPPED)
+    )
+
+
+def diffCards(
+    before: Iterable[ArchidektCard], after: Iterable[ArchidektCard]
+) -> DeckDiff:
+    """Compares two versions of a deck's cards
+
+    Cards are matched by `ArchidektCard.id`, which identifies a card's entry in a deck across updates.
+
+    Arguments:
+        before: `Iterable[ArchidektCard]` The cards of the earlier version
+
+        after: `Iterable[ArchidektCard]` The cards of the later version
+
+    Returns:
+        The `DeckDiff` from `before` to `after`
+    """
+    previous = {x.id: x for x in before}
+    diff = DeckDiff()
+    for card in after:
+        old = previous.pop(card.id, None)
+        if old is None:
+            diff.added.append(card)
+        elif old is not card:
+            fields = changedFields(old, card)
+            if fields:
+                diff.changed.append(CardChange(old, card, fields))
+    diff.removed = list(previous.values())
+    return diff
+
+
+# Stands in for fields skipped by a projection, which raise `SkippedFieldError`, an `AttributeError`
+_SKIPPED = object()
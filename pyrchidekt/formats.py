@@ -1,17 +1,20 @@
 """
-Enum for deck formats
+Enum for deck formats, and the compact representation of a card's legality in each of them
 """
 
 from __future__ import annotations
-from aenum import Enum
+from collections.abc import Mapping
+from enum import Enum
+from typing import Iterator
+from warnings import warn
 
 
 class Format(Enum):
     """Enumerated wrapper around the format code and legalities strings
 
-    This class combines both the numeric format codes and string legality codes that Archidekt uses
+    This class combines both the numeric format codes and string legality codes that Archidekt uses. Formats
+    can be looked up by either: `Format(3)` and `Format("commander")` are both `Format.COMMANDER`.
     """
-    _init_ = 'value string'
     STANDARD = 1, "standard"
     MODERN = 2, "modern"
     COMMANDER = 3, "commander"
@@ -38,11 +41,160 @@ class Format(Enum):
     TIMELESS = 24, "timeless"
     CANADIAN_HIGHLANDER = 25, "canlander"
 
+    def __new__(cls, value: int, string: str | None) -> Format:
+        member = object.__new__(cls)
+        member._value_ = value
+        member.string = string
+        return member
+
     def __str__(self: Format) -> str:
         return self.string 
     
     @classmethod
-    def _missing_value_(cls, value):
-        for member in cls:
-            if member.string == value:
-                return member
+    def _missing_(cls, value):
+        return FORMATS_BY_STRING.get(value)
+
+
+FORMATS_BY_STRING = {x.string: x for x in Format if x.string is not None}
+"""`Dict[str, Format]` Lookup of formats by their legality string"""
+
+_BITS = {x: 1 << x.value for x in Format}
+_BITS_BY_STRING = {x.string: _BITS[x] for x in Format if x.string is not None}
+_warned_formats = set()
+
+
+class Legalities(Mapping):
+    """Compact record of which formats a card is legal in
+
+    Rather than a dictionary per card, the legality of a card is stored as four integer bitmasks with one bit
+    per `Format`: formats the card has a legality for at all, and of those the ones it is legal, restricted or
+    banned in. Anything with a legality that is none of those is not legal. It still reads like the
+    dictionary of legality strings Archidekt sends, keyed by `Format`:
+    ```python
+    legalities[Format.COMMANDER]  # "legal"
+    legalities.isLegal(Format.VINTAGE)  # True when legal or restricted
+    ```
+
+    Attributes:
+        known: `int` Bitmask of the formats with a legality
+
+        legal: `int` Bitmask of the formats the card is legal in
+
+        restricted: `int` Bitmask of the formats the card is restricted in
+
+        banned: `int` Bitmask of the formats the card is banned in
+    """
+
+    __slots__ = ("known", "legal", "restricted", "banned")
+
+    LEGAL = "legal"
+    NOT_LEGAL = "not_legal"
+    RESTRICTED = "restricted"
+    BANNED = "banned"
+
+    def __init__(
+        self, known: int = 0, legal: int = 0, restricted: int = 0, banned: int = 0
+    ):
+        self.known = known
+        self.legal = legal
+        self.restricted = restricted
+        self.banned = banned
+
+    @staticmethod
+    def bit(format: Format) -> int:
+        """Returns the bit representing a format in the bitmasks"""
+        return _BITS[format]
+
+    @staticmethod
+    def fromJson(data: dict) -> Legalities:
+        """Creates the legalities from a `dict` of legality strings keyed by format string
+
+        An example of this is the following:
+        ```json
+        {
+            "legacy": "legal",
+            "vintage": "restricted",
+            "modern": "banned",
+            "standard": "not_legal"
+        }
+        ```
+
+        Formats this module doesn't know about are skipped, with a warning the first time each one is seen.
+
+        Arguments:
+            data: `dict` The legality of the card in each format
+
+        Returns:
+            The `Legalities` object
+        """
+        known = legal = restricted = banned = 0
+        for key, status in data.items():
+            bit = _BITS_BY_STRING.get(key)
+            if bit is None:
+                bit = _BITS_BY_STRING.get(key.lower())
+                if bit is None:
+                    _warnUnknownFormat(key)
+                    continue
+            known |= bit
+            if status == "legal":
+                legal |= bit
+            elif status == "restricted":
+                restricted |= bit
+            elif status == "banned":
+                banned |= bit
+        return Legalities(known, legal, restricted, banned)
+
+    def isLegal(self, format: Format) -> bool:
+        """Returns whether the card may be played in a format, including when it is restricted"""
+        return bool((self.legal | self.restricted) & _BITS[format])
+
+    def __getitem__(self, format: Format) -> str:
+        bit = _BITS.get(format)
+        if bit is None or not self.known & bit:
+            raise KeyError(format)
+        if self.legal & bit:
+            return self.LEGAL
+        if self.restricted & bit:
+            return self.RESTRICTED
+        if self.banned & bit:
+            return self.BANNED
+        return self.NOT_LEGAL
+
+    def __contains__(self, format: object) -> bool:
+        bit = _BITS.get(format)
+        return bit is not None and bool(self.known & bit)
+
+    def __iter__(self) -> Iterator[Format]:
+        return (x for x, bit in _BITS.items() if self.known & bit)
+
+    def __len__(self) -> int:
+        return self.known.bit_count()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Legalities):
+            return (self.known, self.legal, self.restricted, self.banned) == (
+                other.known,
+                other.legal,
+                other.restricted,
+                other.banned,
+            )
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash((self.known, self.legal, self.restricted, self.banned))
+
+    def __repr__(self) -> str:
+        return f"Legalities({ {str(x): y for x, y in self.items()} })"
+
+
+def _warnUnknownFormat(key: str) -> None:
+    if key in _warned_formats:
+        return
+    _warned_formats.add(key)
+    warn(
+        message=f"{key!r} is not a valid Format -> skipping card legality\n"
+        f"For new formats, please file an issue at "
+        f"https://github.com/linkian209/pyrchidekt/issues",
+        category=RuntimeWarning,
+        stacklevel=4,
+    )
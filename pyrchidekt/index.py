@@ -0,0 +1,117 @@
+"""
+Hash indexes over the cards of a deck
+"""
+
+from __future__ import annotations
+from .cards import ArchidektCard
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+
+class DeckIndex:
+    """Lookup tables from a deck's cards to their positions in `Deck.cards`
+
+    Cards are indexed by oracle card name (case-folded), `OracleCard.id`, `Card.uid`, each of their types,
+    subtypes and supertypes (case-folded) and their category names. The categories follow the same rules as
+    `Deck.linkCategories`: a card without any categories is filed under its oracle card's default category.
+    Cards of lazily created decks are indexed from their JSON, so building the index doesn't build them.
+
+    `Deck` builds its index on first use and keeps it in step with its cards, see `Deck.find`.
+
+    Attributes:
+        fingerprint: `Tuple[int, int]` The `id` and length of the card list the index was built from
+    """
+
+    __slots__ = ("fingerprint", "names", "oracle_ids", "uids", "types", "categories")
+
+    def __init__(
+        self, cards: Iterable[dict | ArchidektCard], fingerprint: Tuple[int, int]
+    ):
+        """Builds the index
+
+        Arguments:
+            cards: `Iterable[dict | ArchidektCard]` The cards, or for cards that haven't been built, their JSON
+
+            fingerprint: `Tuple[int, int]` Identifies the card list the index is built from
+        """
+        self.fingerprint = fingerprint
+        self.names: Dict[str, List[int]] = defaultdict(list)
+        self.oracle_ids: Dict[int, List[int]] = defaultdict(list)
+        self.uids: Dict[str, List[int]] = defaultdict(list)
+        self.types: Dict[str, List[int]] = defaultdict(list)
+        self.categories: Dict[str, List[int]] = defaultdict(list)
+
+        for position, card in enumerate(cards):
+            self.add(position, card)
+
+    def add(self, position: int, card: dict | ArchidektCard) -> None:
+        """Indexes a card
+
+        Arguments:
+            position: `int` The position of the card in the deck
+
+            card: `dict | ArchidektCard` The card, or its JSON if it hasn't been built
+        """
+        if type(card) is dict:
+            oracle_card = card["card"]["oracleCard"]
+            name = oracle_card["name"]
+            oracle_id = oracle_card["id"]
+            uid = card["card"]["uid"]
+            types = (
+                oracle_card["types"],
+                oracle_card["subTypes"],
+                oracle_card["superTypes"],
+            )
+            card_categories = card["categories"]
+            default_category = oracle_card["defaultCategory"]
+        else:
+            oracle_card = card.card.oracle_card
+            name = oracle_card.name
+            oracle_id = oracle_card.id
+            uid = card.card.uid
+            types = (oracle_card.types, oracle_card.sub_types, oracle_card.super_types)
+            card_categories = card.categories
+            default_category = oracle_card.default_category
+
+        self.names[name.casefold()].append(position)
+        self.oracle_ids[oracle_id].append(position)
+        self.uids[uid].append(position)
+        for kind in {x.casefold() for group in types if group for x in group}:
+            self.types[kind].append(position)
+        if card_categories:
+            for category in dict.fromkeys(card_categories):
+                self.categories[category].append(position)
+        elif default_category:
+            self.categories[default_category].append(position)
+
+    def find(
+        self,
+        name: str | None = None,
+        oracle_id: int | None = None,
+        uid: str | None = None,
+    ) -> List[int]:
+        """Returns the positions of the cards matching every given criterion, in deck order
+
+        Arguments:
+            name: `str | None` The oracle card name, in any case
+
+            oracle_id: `int | None` The ID of the oracle card
+
+            uid: `str | None` The UID of the printing
+
+        Returns:
+            The positions of the matching cards. With no criteria, nothing matches.
+        """
+        matches = []
+        if name is not None:
+            matches.append(self.names.get(name.casefold(), []))
+        if oracle_id is not None:
+            matches.append(self.oracle_ids.get(oracle_id, []))
+        if uid is not None:
+            matches.append(self.uids.get(uid, []))
+        if not matches:
+            return []
+        if len(matches) == 1:
+            return list(matches[0])
+        common = set(matches[0]).intersection(*matches[1:])
+        return [x for x in matches[0] if x in common]
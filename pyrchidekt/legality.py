@@ -0,0 +1,199 @@
+"""
+Checking decks against the rules of their formats
+"""
+
+from __future__ import annotations
+from .cards import ArchidektCard
+from .deck import Deck
+from .formats import Format, Legalities
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List
+
+SINGLETON_FORMATS = frozenset(
+    {
+        Format.COMMANDER,
+        Format.ONE_V_ONE_COMMANDER,
+        Format.DUEL_COMMANDER,
+        Format.BRAWL,
+        Format.OATHBREAKER,
+        Format.PAUPER_COMMANDER,
+        Format.HISTORIC_BRAWL,
+        Format.GLADIATOR,
+        Format.PREDH,
+        Format.CANADIAN_HIGHLANDER,
+    }
+)
+"""`FrozenSet[Format]` Formats allowing a single copy of each card other than basic lands"""
+
+COMMANDER_FORMATS = frozenset(
+    {
+        Format.COMMANDER,
+        Format.ONE_V_ONE_COMMANDER,
+        Format.DUEL_COMMANDER,
+        Format.BRAWL,
+        Format.OATHBREAKER,
+        Format.PAUPER_COMMANDER,
+        Format.HISTORIC_BRAWL,
+        Format.PREDH,
+    }
+)
+"""`FrozenSet[Format]` Formats where every card must be within the color identity of the deck's commanders"""
+
+_ANY_NUMBER = "A deck can have any number of cards named"
+
+
+@dataclass(slots=True)
+class LegalityReport:
+    """Whether a deck is legal in a format, and the cards that keep it from being so
+
+    Only cards that count towards the deck are checked (see `Deck.isIncluded`). Commanders are the cards in
+    the deck's premier categories.
+
+    Attributes:
+        format: `Format` The format the deck was checked against
+
+        illegal: `List[ArchidektCard]` Cards that are banned or not legal in the format
+
+        restricted: `List[ArchidektCard]` Cards restricted in the format of which the deck has more than one
+
+        duplicates: `List[ArchidektCard]` Cards of which a singleton format deck has more than one
+
+        off_identity: `List[ArchidektCard]` Cards outside the color identity of the deck's commanders
+
+        commanders: `List[ArchidektCard]` The deck's commanders, for formats that have them. A deck without any
+        isn't legal in those formats.
+    """
+
+    format: Format
+    illegal: List[ArchidektCard] = field(default_factory=list)
+    restricted: List[ArchidektCard] = field(default_factory=list)
+    duplicates: List[ArchidektCard] = field(default_factory=list)
+    off_identity: List[ArchidektCard] = field(default_factory=list)
+    commanders: List[ArchidektCard] = field(default_factory=list)
+
+    @property
+    def legal(self) -> bool:
+        """`bool` Whether the deck is legal in the format"""
+        return not (
+            self.illegal
+            or self.restricted
+            or self.duplicates
+            or self.off_identity
+            or (self.format in COMMANDER_FORMATS and not self.commanders)
+        )
+
+
+def checkLegality(
+    decks: Iterable[Deck], formats: Iterable[Format] | None = None
+) -> List[Dict[Format, LegalityReport]]:
+    """Checks many decks against one or more formats
+
+    The legality of every card is already held as bitmasks (see `Legalities`), so a deck is checked against
+    every format at once by a bitwise AND over its cards. The cards keeping it from being legal are only looked
+    for in the formats that AND rules out, and the time taken grows linearly with the number of cards.
+
+    Arguments:
+        decks: `Iterable[Deck]` The decks to check
+
+        formats: `Iterable[Format] | None` The formats to check each deck against. If not given, each deck is
+        checked against its own `Deck.format`, and decks without one are skipped.
+
+    Returns:
+        For each deck, its `LegalityReport` by format
+    """
+    formats = None if formats is None else list(formats)
+    retval = []
+    for deck in decks:
+        if formats is not None:
+            deck_formats = formats
+        elif deck.format is not None:
+            deck_formats = [deck.format]
+        else:
+            deck_formats = []
+        retval.append(_check(deck, deck_formats))
+    return retval
+
+
+def _check(deck: Deck, formats: List[Format]) -> Dict[Format, LegalityReport]:
+    inclusions = deck.inclusions()
+    cards = [
+        x for x in deck.cards if inclusions.get(x.primary_category, (True, True))[0]
+    ]
+    legalities = [x.card.oracle_card.legalities for x in cards]
+    playable = ~0
+    restricted = 0
+    for x in legalities:
+        playable &= x.legal | x.restricted
+        restricted |= x.restricted
+
+    # Bits of the formats some card isn't legal in, each card is then visited once for all of them
+    bits = {x: Legalities.bit(x) for x in formats}
+    failing = {
+        bit: []
+        for x, bit in bits.items()
+        if x.string is not None and not playable & bit
+    }
+    if failing:
+        wanted = sum(failing)
+        for card, x in zip(cards, legalities):
+            bad = wanted & ~(x.legal | x.restricted)
+            while bad:
+                bit = bad & -bad
+                failing[bit].append(card)
+                bad ^= bit
+
+    counts = None
+    identity = None
+    reports = {}
+    for format, bit in bits.items():
+        report = LegalityReport(format, illegal=failing.get(bit, []))
+        if restricted & bit or format in SINGLETON_FORMATS:
+            counts = counts or _counts(cards)
+        if restricted & bit:
+            report.restricted = [
+                card
+                for card, x in zip(cards, legalities)
+                if x.restricted & bit and counts[card.card.oracle_card.name] > 1
+            ]
+        if format in SINGLETON_FORMATS:
+            report.duplicates = [
+                card
+                for card in cards
+                if counts[card.card.oracle_card.name] > 1 and not _anyNumber(card)
+            ]
+        if format in COMMANDER_FORMATS:
+            identity = identity or _identity(deck, cards)
+            report.commanders, report.off_identity = identity
+        reports[format] = report
+    return reports
+
+
+def _counts(cards: List[ArchidektCard]) -> Counter:
+    counts = Counter()
+    for card in cards:
+        counts[card.card.oracle_card.name] += card.quantity
+    return counts
+
+
+def _anyNumber(card: ArchidektCard) -> bool:
+    oracle_card = card.card.oracle_card
+    return "Basic" in (oracle_card.super_types or ()) or _ANY_NUMBER in (
+        oracle_card.text or ""
+    )
+
+
+def _identity(deck: Deck, cards: List[ArchidektCard]) -> tuple:
+    premier = {x.name for x in deck.categories if x.is_premier}
+    commanders = [x for x in cards if premier.intersection(x.categories or ())]
+    if not commanders:
+        return [], []
+    identity = set()
+    for commander in commanders:
+        identity.update(commander.card.oracle_card.color_identity or ())
+    off_identity = [
+        x
+        for x in cards
+        if not identity.issuperset(x.card.oracle_card.color_identity or ())
+    ]
+    return commanders, off_identity
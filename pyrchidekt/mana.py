@@ -1,12 +1,15 @@
 """
-Mana Production wrapper
+Mana Production wrapper and mana cost parsing
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+import re
 
 
-@dataclass
+@dataclass(slots=True)
 class ManaProduction:
     """Mana Production Wrapping
 
@@ -26,12 +29,12 @@ class ManaProduction:
         colorless: `int` The amount of colorless mana created
     """
 
-    white: int
-    blue: int
-    black: int
-    red: int
-    green: int
-    colorless: int
+    white: int = field(default=None)
+    blue: int = field(default=None)
+    black: int = field(default=None)
+    red: int = field(default=None)
+    green: int = field(default=None)
+    colorless: int = field(default=None)
 
     @staticmethod
     def fromJson(data: dict) -> ManaProduction:
@@ -59,3 +62,147 @@ class ManaProduction:
         return ManaProduction(
             data["W"], data["U"], data["B"], data["R"], data["G"], data["C"]
         )
+
+
+COLORS = ("White", "Blue", "Black", "Red", "Green")
+"""`Tuple[str, ...]` The colors, in the order of the pip fields of `ManaCost`"""
+
+_SYMBOL = re.compile(r"\{([^}]*)\}")
+_COLOR_SYMBOLS = {"W": "white", "U": "blue", "B": "black", "R": "red", "G": "green"}
+
+
+@dataclass(frozen=True, slots=True)
+class ManaCost:
+    """A parsed mana cost, such as `{2}{W}{U}`
+
+    Colored pips are counted the way devotion counts them: a hybrid symbol such as `{W/U}` is a pip of each of
+    its colors, and Phyrexian (`{W/P}`) and two-generic hybrid (`{2/W}`) symbols are pips of their color.
+
+    Attributes:
+        symbols: `Tuple[str, ...]` The symbols of the cost, without braces, such as `("2", "W", "U")`
+
+        mana_value: `float` The mana value of the cost. X counts as 0, `{2/W}` as 2 and half mana, `{½}` or a
+        half pip such as `{HW}`, as 0.5.
+
+        generic: `int` The generic mana in the cost, leaving out half generic mana
+
+        x: `int` The number of X, Y and Z symbols
+
+        colorless: `int` The number of `{C}` symbols
+
+        snow: `int` The number of `{S}` symbols
+
+        hybrid: `int` The number of hybrid symbols, including two-generic hybrid
+
+        phyrexian: `int` The number of Phyrexian symbols
+
+        white: `int` The number of white pips
+
+        blue: `int` The number of blue pips
+
+        black: `int` The number of black pips
+
+        red: `int` The number of red pips
+
+        green: `int` The number of green pips
+    """
+
+    symbols: Tuple[str, ...] = field(default=())
+    mana_value: float = field(default=0)
+    generic: int = field(default=0)
+    x: int = field(default=0)
+    colorless: int = field(default=0)
+    snow: int = field(default=0)
+    hybrid: int = field(default=0)
+    phyrexian: int = field(default=0)
+    white: int = field(default=0)
+    blue: int = field(default=0)
+    black: int = field(default=0)
+    red: int = field(default=0)
+    green: int = field(default=0)
+
+    @property
+    def pips(self) -> Dict[str, int]:
+        """`Dict[str, int]` The number of pips of each of `COLORS`"""
+        return dict(
+            zip(COLORS, (self.white, self.blue, self.black, self.red, self.green))
+        )
+
+
+@lru_cache(maxsize=16384)
+def parseManaCost(cost: str | None) -> ManaCost:
+    """Parses the mana cost of one face of a card
+
+    Results are cached by string, so the objects returned are shared and must not be changed. Use
+    `parseManaCost.cache_info()` to see how well the cache is doing.
+
+    Arguments:
+        cost: `str | None` The mana cost, such as `{X}{G/P}{2/U}`
+
+    Returns:
+        The `ManaCost`. An empty or missing cost gives an empty one.
+    """
+    counts = dict.fromkeys(
+        ("generic", "x", "colorless", "snow", "hybrid", "phyrexian"), 0
+    )
+    counts.update(dict.fromkeys(_COLOR_SYMBOLS.values(), 0))
+    symbols = tuple(_SYMBOL.findall(cost or ""))
+    mana_value = 0
+    for symbol in symbols:
+        if symbol.isdigit():
+            counts["generic"] += int(symbol)
+            mana_value += int(symbol)
+            continue
+        if symbol in ("X", "Y", "Z"):
+            counts["x"] += 1
+            continue
+        if symbol == "½":
+            mana_value += 0.5
+            continue
+        if symbol == "C":
+            counts["colorless"] += 1
+        elif symbol == "S":
+            counts["snow"] += 1
+
+        parts = symbol.split("/")
+        if "P" in parts:
+            counts["phyrexian"] += 1
+            parts.remove("P")
+        if len(parts) > 1:
+            counts["hybrid"] += 1
+        value = 1
+        for part in parts:
+            if part.startswith("H") and part[1:] in _COLOR_SYMBOLS:
+                part = part[1:]
+                value = 0.5
+            if part in _COLOR_SYMBOLS:
+                counts[_COLOR_SYMBOLS[part]] += 1
+            elif part.isdigit():
+                value = max(value, int(part))
+        mana_value += value
+
+    return ManaCost(symbols=symbols, mana_value=mana_value, **counts)
+
+
+def parseManaCosts(
+    cost: str | None, faces: List[Any] | None = None
+) -> Tuple[ManaCost, ...]:
+    """Parses the mana costs of every face of a card
+
+    Arguments:
+        cost: `str | None` The card's mana cost. Costs of several faces are separated by `//`.
+
+        faces: `List[Any] | None` The faces of the card, see `OracleCard.faces`. Faces that carry their own
+        mana cost are used instead of splitting `cost`.
+
+    Returns:
+        The `ManaCost` of each face, front face first
+    """
+    face_costs = [
+        x.get("manaCost", x.get("mana_cost"))
+        for x in faces or ()
+        if isinstance(x, dict)
+    ]
+    if face_costs and any(x is not None for x in face_costs):
+        return tuple(parseManaCost(x) for x in face_costs)
+    return tuple(parseManaCost(x.strip()) for x in (cost or "").split("//"))
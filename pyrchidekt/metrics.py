@@ -0,0 +1,181 @@
+"""
+Instrumentation of the time spent fetching, decoding and building decks
+
+Nothing is measured until a sink is installed with `setMetrics`, so the hot paths only pay for one check of
+whether there is one. Any object with `timing` and `count` methods can be a sink, see `Metrics`.
+"""
+
+from __future__ import annotations
+from array import array
+from math import ceil
+from threading import Lock
+from typing import Dict, Protocol
+
+CONNECT = "connect"
+"""`str` Timing from sending a request until the response headers arrive, including connection setup"""
+
+TRANSFER = "transfer"
+"""`str` Timing of reading the response body"""
+
+DECODE = "decode"
+"""`str` Timing of parsing JSON text into Python objects, or into msgspec structs with the fast decoder"""
+
+HYDRATE = "hydrate"
+"""`str` Timing of building a `Deck` and its cards from decoded JSON"""
+
+BYTES = "bytes"
+"""`str` Count of response body bytes"""
+
+CARDS = "cards"
+"""`str` Count of card entries in built decks"""
+
+RETRIES = "retries"
+"""`str` Count of connection retries before a response"""
+
+ERRORS = "errors"
+"""`str` Count of unsuccessful responses"""
+
+CACHE_HITS = "cache_hits"
+"""`str` Count of deck JSON found in a `DiskCache`"""
+
+CACHE_MISSES = "cache_misses"
+"""`str` Count of deck JSON not found in a `DiskCache`"""
+
+DECK_CACHE_HITS = "deck_cache_hits"
+"""`str` Count of decks found in a `DeckCache`"""
+
+DECK_CACHE_MISSES = "deck_cache_misses"
+"""`str` Count of decks not found in a `DeckCache`"""
+
+
+class Metrics(Protocol):
+    """What a metrics sink implements
+
+    Both methods may be called from several threads at once, and they are called on the hot path, so they
+    should return quickly, for instance by handing the values to a queue or an in-memory aggregate such as
+    `MetricsRecorder`.
+    """
+
+    def timing(self, name: str, seconds: float) -> None:
+        """Records how long a phase took
+
+        Arguments:
+            name: `str` The phase, such as `CONNECT` or `HYDRATE`
+
+            seconds: `float` How long it took
+        """
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Adds to a counter
+
+        Arguments:
+            name: `str` The counter, such as `BYTES` or `CACHE_HITS`
+
+            value: `int` How much to add
+        """
+
+
+class MetricsRecorder:
+    """A `Metrics` sink aggregating everything in memory
+
+    Every timing is kept, packed as doubles, so that exact percentiles can be taken. Reset it now and then when
+    recording for a long time.
+
+    ```python
+    recorder = MetricsRecorder()
+    setMetrics(recorder)
+    deck = getDeckById(1)
+    print(recorder.percentile(HYDRATE, 99), recorder.counters[BYTES])
+    ```
+
+    Attributes:
+        timings: `Dict[str, array]` The recorded timings of each phase, in seconds and in the order recorded
+
+        counters: `Dict[str, int]` The total of each counter
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, array] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def timing(self, name: str, seconds: float) -> None:
+        with self._lock:
+            timings = self.timings.get(name)
+            if timings is None:
+                timings = self.timings[name] = array("d")
+            timings.append(seconds)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def percentile(self, name: str, percent: float) -> float | None:
+        """Returns a percentile of the timings of a phase, using the nearest rank
+
+        Arguments:
+            name: `str` The phase
+
+            percent: `float` The percentile, from 0 to 100
+
+        Returns:
+            The timing in seconds, or `None` if the phase has none
+        """
+        with self._lock:
+            timings = sorted(self.timings.get(name, ()))
+        if not timings:
+            return None
+        return timings[max(ceil(percent / 100 * len(timings)) - 1, 0)]
+
+    def summary(self, percents: tuple = (50, 90, 99)) -> Dict[str, Dict[str, float]]:
+        """Summarizes the timings of every phase
+
+        Arguments:
+            percents: `tuple` The percentiles to include
+
+        Returns:
+            For each phase, its `count`, `total`, `mean`, `max` and each percentile as `p50` and so on, in seconds
+        """
+        with self._lock:
+            timings = {x: sorted(y) for x, y in self.timings.items()}
+        retval = {}
+        for name, values in timings.items():
+            total = sum(values)
+            retval[name] = {
+                "count": len(values),
+                "total": total,
+                "mean": total / len(values),
+                "max": values[-1],
+            }
+            for percent in percents:
+                rank = max(ceil(percent / 100 * len(values)) - 1, 0)
+                retval[name][f"p{percent:g}"] = values[rank]
+        return retval
+
+    def reset(self) -> None:
+        """Forgets everything recorded"""
+        with self._lock:
+            self.timings.clear()
+            self.counters.clear()
+
+
+_metrics: Metrics | None = None
+
+
+def getMetrics() -> Metrics | None:
+    """Returns the installed metrics sink
+
+    Returns:
+        The sink, or `None` when nothing is being measured
+    """
+    return _metrics
+
+
+def setMetrics(metrics: Metrics | None) -> None:
+    """Installs the sink that every client and `Deck.fromJson` report to
+
+    Arguments:
+        metrics: `Metrics | None` The sink, or `None` to stop measuring
+    """
+    global _metrics
+    _metrics = metrics
@@ -0,0 +1,472 @@
+"""
+Local stand-in for the Archidekt deck endpoint, for testing and load testing clients without touching the real site
+
+The server answers `/api/decks/{id}/` the way the API does. It can add latency, errors, `Retry-After` headers
+and bandwidth limits. It runs on asyncio, so thousands of concurrent connections cost it little and the client
+under test stays the bottleneck. Point a client at it through its base URL:
+
+```python
+with MockArchidekt(latency=Latency("lognormal", 0.05, 0.5), error_rates={429: 0.01}) as server:
+    with ArchidektClient(base_url=server.base_url) as client:
+        deck = client.getDeckById(1)
+```
+
+It can also be run on its own, see `python -m pyrchidekt.mockserver --help`.
+"""
+
+from __future__ import annotations
+from .synthetic import CardPool, generateDeck
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Deque, Dict, Mapping
+import argparse
+import asyncio
+import json
+import random
+import re
+
+DECK_PATH = re.compile(rb"^/api/decks/(-?\d+)/$")
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+"""`FrozenSet[int]` Statuses answered with a `Retry-After` header"""
+
+_REASONS = {
+    200: "OK",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+_ERROR_BODIES = {
+    404: b'{"detail": "Not found."}',
+    429: b'{"detail": "Request was throttled."}',
+}
+
+
+@dataclass
+class Latency:
+    """A distribution of the time the server waits before answering
+
+    Attributes:
+        distribution: `str` One of "constant", "uniform", "normal", "exponential" or "lognormal"
+
+        mean: `float` The typical latency in seconds: the value of "constant", the mean of "uniform", "normal"
+        and "exponential" and the median of "lognormal"
+
+        spread: `float` The half-width of "uniform", the standard deviation of "normal" and the sigma of
+        "lognormal". Unused by the others.
+    """
+
+    distribution: str = field(default="constant")
+    mean: float = field(default=0.0)
+    spread: float = field(default=0.0)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draws one latency, never negative
+
+        Arguments:
+            rng: `random.Random` The random source
+
+        Returns:
+            The latency in seconds
+        """
+        match self.distribution:
+            case "constant":
+                value = self.mean
+            case "uniform":
+                value = rng.uniform(self.mean - self.spread, self.mean + self.spread)
+            case "normal":
+                value = rng.gauss(self.mean, self.spread)
+            case "exponential":
+                value = rng.expovariate(1 / self.mean) if self.mean > 0 else 0.0
+            case "lognormal":
+                value = self.mean * rng.lognormvariate(0, self.spread)
+            case _:
+                raise ValueError(f"Unknown latency distribution {self.distribution!r}")
+        return max(value, 0.0)
+
+    @staticmethod
+    def parse(value: str) -> Latency:
+        """Reads a latency written as `distribution:mean[:spread]` or just a number of seconds
+
+        Arguments:
+            value: `str` The latency, such as `"0.05"` or `"lognormal:0.05:0.5"`
+
+        Returns:
+            The `Latency`
+        """
+        parts = value.split(":")
+        if len(parts) == 1:
+            return Latency("constant", float(parts[0]))
+        return Latency(parts[0], *(float(x) for x in parts[1:]))
+
+
+class MockArchidekt:
+    """A local server answering `/api/decks/{id}/` with generated, recorded or fixed decks
+
+    Decks come from, in order of preference, `body` (the same bytes for every id), `decks` (recorded decks by
+    id, or a directory of `{id}.json` files) or, when neither is given, `generateDeck`. Generated and loaded
+    decks are kept in memory, up to `cache_size` of them. Decks that aren't in memory are generated or read in
+    a worker thread, so the event loop keeps answering other requests meanwhile. Negative ids, and ids missing
+    from `decks`, answer 404.
+
+    Before answering, each request waits for a sample of `latency`. It then fails with the status of
+    `deck_errors` for its deck, if any, or with a status drawn from `error_rates`. 429 and 503 responses carry a
+    `Retry-After` header. With `bandwidth`, each response body is sent at that many bytes per second.
+
+    Attributes:
+        body: `bytes | None` The body served for every deck, if set
+
+        latency: `Latency` How long to wait before answering
+
+        error_rates: `Dict[int, float]` The probability of answering with each error status, such as
+        `{429: 0.05, 503: 0.01}`
+
+        deck_errors: `Dict[int, int]` Statuses that specific deck ids always answer with
+
+        retry_after: `int` The seconds sent in `Retry-After` headers
+
+        bandwidth: `int | None` The bytes per second each response is sent at, or `None` for no limit
+
+        requests: `Deque[str]` The paths of the last `max_requests` requests received, in order
+
+        statuses: `Counter` How many responses were sent with each status
+    """
+
+    def __init__(
+        self,
+        decks: Mapping[int, bytes | dict] | str | Path | None = None,
+        body: bytes | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Latency | float = 0.0,
+        error_rates: Mapping[int, float] | None = None,
+        retry_after: int = 1,
+        bandwidth: int | None = None,
+        cards: int = 100,
+        seed: int = 0,
+        cache_size: int = 1024,
+        backlog: int = 4096,
+        max_requests: int | None = 10_000,
+    ):
+        """Creates the server, without starting it
+
+        Arguments:
+            decks: `Mapping[int, bytes | dict] | str | Path | None` Recorded decks by id, as JSON or raw bytes,
+            or a directory of `{id}.json` files
+
+            body: `bytes | None` A body to serve for every deck instead
+
+            host: `str` The interface to listen on
+
+            port: `int` The port to listen on, 0 for any free port
+
+            latency: `Latency | float` How long to wait before answering, a number being a constant latency
+
+            error_rates: `Mapping[int, float] | None` The probability of answering with each error status
+
+            retry_after: `int` The seconds sent in `Retry-After` headers
+
+            bandwidth: `int | None` The bytes per second each response is sent at
+
+            cards: `int` How many cards generated decks have
+
+            seed: `int` Seeds the latencies, errors and card pool of generated decks
+
+            cache_size: `int` How many generated or loaded decks to keep in memory
+
+            backlog: `int` The queue of connections waiting to be accepted
+
+            max_requests: `int | None` How many request paths to keep in `requests`, `None` for all of them
+        """
+        self.body = body
+        self.latency = (
+            latency if isinstance(latency, Latency) else Latency(mean=latency)
+        )
+        self.error_rates = dict(error_rates or {})
+        self.deck_errors: Dict[int, int] = {}
+        self.retry_after = retry_after
+        self.bandwidth = bandwidth
+        self.requests: Deque[str] = deque(maxlen=max_requests)
+        self.statuses: Counter = Counter()
+        self.host = host
+        self.port = port
+        self._decks = decks
+        self._directory = Path(decks) if isinstance(decks, (str, Path)) else None
+        self._cards = cards
+        self._pool: CardPool | None = None
+        self._pool_lock = Lock()
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._cache: OrderedDict[int, bytes] = OrderedDict()
+        self._cache_size = cache_size
+        self._backlog = backlog
+        self._server: asyncio.AbstractServer | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """`str` The API root to give clients, such as `http://127.0.0.1:8000/api/`"""
+        return f"http://{self.host}:{self.port}/api/"
+
+    async def serve(self) -> None:
+        """Starts listening on the running event loop, without blocking"""
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, backlog=self._backlog
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serveForever(self) -> None:
+        """Listens on the running event loop until cancelled"""
+        if self._server is None:
+            await self.serve()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start(self) -> MockArchidekt:
+        """Runs the server on its own event loop in a background thread
+
+        Returns:
+            The server, once it is listening
+
+        Raises:
+            OSError: If the server can't listen, such as when the port is taken
+        """
+        ready = Event()
+        failures = []
+
+        def run() -> None:
+            loop = self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.serve())
+            except BaseException as e:
+                failures.append(e)
+                loop.close()
+                return
+            finally:
+                ready.set()
+            self._loop.run_forever()
+            self._server.close()
+            # Connections kept alive by clients are still being served, they are dropped
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True)
+            )
+            self._loop.close()
+
+        self._thread = Thread(target=run, name="pyrchidekt-mockserver", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failures:
+            self._thread.join()
+            self._loop = None
+            raise failures[0]
+        return self
+
+    def stop(self) -> None:
+        """Stops a server started with `start`"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+    def __enter__(self) -> MockArchidekt:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def deck(self, id: int) -> bytes | None:
+        """Returns the body served for a deck
+
+        Arguments:
+            id: `int` The ID of the deck
+
+        Returns:
+            The deck JSON, or `None` if the server doesn't have the deck
+        """
+        if id < 0:
+            return None
+        if self.body is not None:
+            return self.body
+        cached = self._cached(id)
+        if cached is not None:
+            return cached
+        return self._remember(id, self._load(id))
+
+    async def _deck(self, id: int) -> bytes | None:
+        if id < 0 or self.body is not None:
+            return self.deck(id)
+        cached = self._cached(id)
+        if cached is not None:
+            return cached
+        loop = asyncio.get_running_loop()
+        return self._remember(id, await loop.run_in_executor(None, self._load, id))
+
+    def _cached(self, id: int) -> bytes | None:
+        cached = self._cache.get(id)
+        if cached is not None:
+            self._cache.move_to_end(id)
+        return cached
+
+    def _load(self, id: int) -> bytes | None:
+        # Runs in worker threads, so it only reads the server's state, apart from creating the card pool
+        if self._directory is not None:
+            path = self._directory / f"{id}.json"
+            body = path.read_bytes() if path.is_file() else None
+        elif self._decks is not None:
+            body = self._decks.get(id)
+            if isinstance(body, dict):
+                body = json.dumps(body).encode()
+        else:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = CardPool(seed=self._seed)
+            body = json.dumps(generateDeck(id, self._cards, pool=self._pool)).encode()
+        return body
+
+    def _remember(self, id: int, body: bytes | None) -> bytes | None:
+        if body is not None:
+            self._cache[id] = body
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return body
+
+    def _status(self, id: int) -> int:
+        if id in self.deck_errors:
+            return self.deck_errors[id]
+        roll = self._rng.random()
+        for status, rate in self.error_rates.items():
+            if roll < rate:
+                return status
+            roll -= rate
+        return 200
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, _, headers = head.partition(b"\r\n")
+                method, path, version = request_line.split(b" ", 2)
+                length = re.search(rb"(?im)^content-length:\s*(\d+)", headers)
+                if length:
+                    await reader.readexactly(int(length.group(1)))
+                self.requests.append(path.decode("latin-1"))
+
+                delay = self.latency.sample(self._rng)
+                if delay:
+                    await asyncio.sleep(delay)
+
+                match = DECK_PATH.match(path) if method in (b"GET", b"HEAD") else None
+                id = int(match.group(1)) if match else -1
+                status = self._status(id) if match else 404
+                body = await self._deck(id) if status == 200 else None
+                if body is None:
+                    status = 404 if status == 200 else status
+                    body = _ERROR_BODIES.get(status, b'{"detail": "Server error."}')
+                self.statuses[status] += 1
+
+                close = version == b"HTTP/1.0" or re.search(
+                    rb"(?im)^connection:\s*close", headers
+                )
+                response = [
+                    f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}",
+                    "Content-Type: application/json",
+                    f"Content-Length: {len(body)}",
+                ]
+                if status in RETRY_AFTER_STATUSES:
+                    response.append(f"Retry-After: {self.retry_after}")
+                if close:
+                    response.append("Connection: close")
+                writer.write(("\r\n".join(response) + "\r\n\r\n").encode())
+                if method != b"HEAD":
+                    await self._send(writer, body)
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _send(self, writer: asyncio.StreamWriter, body: bytes) -> None:
+        if not self.bandwidth:
+            writer.write(body)
+            return
+        # Sends a slice of the body every 50 ms so the rate holds however large the response is
+        chunk = max(self.bandwidth // 20, 1)
+        for start in range(0, len(body), chunk):
+            writer.write(body[start : start + chunk])
+            await writer.drain()
+            await asyncio.sleep(chunk / self.bandwidth)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Serves Archidekt-shaped decks locally for testing clients"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--decks",
+        help="a directory of recorded {id}.json decks, decks are generated otherwise",
+    )
+    parser.add_argument(
+        "--cards", type=int, default=100, help="cards per generated deck"
+    )
+    parser.add_argument(
+        "--latency",
+        type=Latency.parse,
+        default=Latency(),
+        help="seconds, or distribution:mean[:spread] such as lognormal:0.05:0.5",
+    )
+    parser.add_argument(
+        "--error-rate",
+        action="append",
+        default=[],
+        metavar="STATUS=RATE",
+        help="answer with STATUS at this rate, such as 429=0.05. Can be repeated.",
+    )
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--bandwidth", type=int, help="bytes per second per response")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    error_rates = {}
+    for entry in args.error_rate:
+        status, _, rate = entry.partition("=")
+        error_rates[int(status)] = float(rate)
+    server = MockArchidekt(
+        decks=args.decks,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_rates=error_rates,
+        retry_after=args.retry_after,
+        bandwidth=args.bandwidth,
+        cards=args.cards,
+        seed=args.seed,
+    )
+
+    async def run() -> None:
+        await server.serve()
+        print(f"Serving decks at {server.base_url}")
+        await server.serveForever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
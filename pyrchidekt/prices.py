@@ -0,0 +1,141 @@
+"""
+Vendor prices of decks, counting only the cards that count towards each deck's price
+
+Like `pyrchidekt.columns`, this module needs NumPy.
+"""
+
+from __future__ import annotations
+from .columns import DeckFrame, np
+from .deck import Deck
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence
+
+CHEAPEST_VENDORS = ("ck", "tcg")
+"""`Tuple[str, ...]` The vendors compared for `DeckPrice.cheapest` by default, the ones pricing in US dollars"""
+
+FOIL_SUFFIX = "foil"
+"""`str` Added to a vendor's key in `Card.prices` for its foil price"""
+
+
+@dataclass(slots=True)
+class DeckPrice:
+    """The price of a deck at each vendor
+
+    Each card is priced once, whatever number of categories it is in, and only if its primary category counts
+    towards the price of the deck (see `Deck.isIncluded`), so a maybeboard isn't priced. Cards with the "Foil"
+    modifier are priced at the vendor's foil price. A price of 0 means the vendor doesn't sell the card.
+
+    Attributes:
+        totals: `Dict[str, float]` The price of the deck at each vendor, such as "ck" or "tcg"
+
+        missing: `Dict[str, int]` How many of the priced cards each vendor has no price for. They add nothing to
+        the vendor's total.
+
+        cheapest: `float` The price of buying each card from whichever of the compared vendors sells it cheapest
+
+        cheapest_vendor: `str | None` The compared vendor with the lowest total, out of those with a price for
+        every card
+    """
+
+    totals: Dict[str, float] = field(default_factory=dict)
+    missing: Dict[str, int] = field(default_factory=dict)
+    cheapest: float = field(default=0.0)
+    cheapest_vendor: str | None = field(default=None)
+
+
+def priceDecks(
+    decks: Iterable[Deck], vendors: Sequence[str] | None = None
+) -> List[DeckPrice]:
+    """Prices many decks at once
+
+    Decks with a memoized price (see `Deck.price`) aren't priced again. The others are packed into a single
+    `DeckFrame` and priced together, and their prices are memoized.
+
+    Arguments:
+        decks: `Iterable[Deck]` The decks to price
+
+        vendors: `Sequence[str] | None` The vendors compared for `DeckPrice.cheapest`, `CHEAPEST_VENDORS` if not
+        given. Prices are compared as they are, so these should share a currency.
+
+    Returns:
+        The price of each deck, in the order of `decks`
+    """
+    decks = list(decks)
+    vendors = tuple(vendors or CHEAPEST_VENDORS)
+    keys = [(x._fingerprint(), vendors) for x in decks]
+    prices: List[DeckPrice | None] = [
+        deck._price[1] if deck._price is not None and deck._price[0] == key else None
+        for deck, key in zip(decks, keys)
+    ]
+    stale = [i for i, x in enumerate(prices) if x is None]
+    if stale:
+        frame = DeckFrame.fromDecks(decks[i] for i in stale)
+        for i, price in zip(stale, priceFrame(frame, vendors)):
+            decks[i]._price = (keys[i], price)
+            prices[i] = price
+    return prices
+
+
+def priceFrame(
+    frame: DeckFrame, vendors: Sequence[str] | None = None
+) -> List[DeckPrice]:
+    """Prices every deck of a `DeckFrame`
+
+    Arguments:
+        frame: `DeckFrame` The decks
+
+        vendors: `Sequence[str] | None` The vendors compared for `DeckPrice.cheapest`, `CHEAPEST_VENDORS` if not
+        given
+
+    Returns:
+        The price of each deck, in the order of `DeckFrame.deck_ids`
+    """
+    vendors = vendors or CHEAPEST_VENDORS
+    decks = len(frame.deck_ids)
+    mask = frame.in_price
+    deck = frame.deck[mask]
+    quantity = frame.quantity[mask]
+
+    unit_prices = {}
+    totals = {}
+    missing = {}
+    for vendor, price in frame.prices.items():
+        if vendor.endswith(FOIL_SUFFIX):
+            continue
+        foil = frame.prices.get(vendor + FOIL_SUFFIX)
+        if foil is not None:
+            price = np.where(frame.foil, foil, price)
+        price = price[mask]
+        price = np.where(price > 0, price, np.nan)
+        unit_prices[vendor] = price
+        available = ~np.isnan(price)
+        totals[vendor] = np.bincount(
+            deck, weights=np.where(available, quantity * price, 0), minlength=decks
+        )
+        missing[vendor] = np.bincount(
+            deck, weights=quantity * ~available, minlength=decks
+        )
+
+    compared = [x for x in vendors if x in unit_prices]
+    if compared:
+        best = np.fmin.reduce([unit_prices[x] for x in compared], axis=0)
+        cheapest = np.bincount(
+            deck, weights=quantity * np.nan_to_num(best), minlength=decks
+        )
+    else:
+        cheapest = np.zeros(decks)
+
+    retval = []
+    for i in range(decks):
+        deck_totals = {x: round(float(y[i]), 2) for x, y in totals.items()}
+        deck_missing = {x: int(y[i]) for x, y in missing.items()}
+        complete = [x for x in compared if not deck_missing[x]]
+        retval.append(
+            DeckPrice(
+                totals=deck_totals,
+                missing=deck_missing,
+                cheapest=round(float(cheapest[i]), 2),
+                cheapest_vendor=min(complete, key=deck_totals.get, default=None),
+            )
+        )
+    return retval
@@ -0,0 +1,270 @@
+"""
+Field projection, to create decks with only the fields a program needs
+"""
+
+from __future__ import annotations
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Mapping
+
+MODELS = ("Deck", "ArchidektCard", "Card", "OracleCard")
+"""`Tuple[str, ...]` The models whose fields can be left out"""
+
+REQUIRED = {
+    "Deck": frozenset({"id", "name", "format", "cards", "categories"}),
+    "ArchidektCard": frozenset({"id", "card", "categories", "quantity"}),
+    "Card": frozenset({"id", "uid", "oracle_card"}),
+    "OracleCard": frozenset(
+        {"id", "name", "default_category", "types", "sub_types", "super_types"}
+    ),
+}
+"""`Dict[str, FrozenSet[str]]` The fields of each model that are always loaded, including those `Deck.find`,
+`Deck.byType` and `Deck.byCategory` index"""
+
+
+class SkippedFieldError(AttributeError):
+    """Raised when reading a field that was left out by the projection its object was created with"""
+
+
+class Projection:
+    """The fields of each model that `Deck.fromJson` loads
+
+    Fields are named as `"Model.field"`, such as `"Card.prices"` or `"OracleCard.mana_cost"`, for the models in
+    `MODELS`. Apart from the fields in `REQUIRED`, which are always loaded, only the named fields are loaded:
+    the JSON of every other field isn't read at all, so nothing is parsed or copied for it. Reading a field that
+    wasn't loaded raises a `SkippedFieldError` naming it. Categories and the objects of loaded fields, such as
+    `Card.edition`, are always loaded whole.
+
+    ```python
+    deck = Deck.fromJson(data, include={"Card.prices", "ArchidektCard.modifier"})
+    deck = Deck.fromJson(data, include="gameplay")
+    ```
+
+    Attributes:
+        name: `str | None` The name of the profile, for the profiles in `PROFILES`
+
+        fields: `Dict[str, FrozenSet[str]]` The loaded fields of each model, including the required ones
+    """
+
+    __slots__ = ("name", "fields", "_plans", "_hash")
+
+    def __init__(self, include: Iterable[str], name: str | None = None):
+        """Creates the projection
+
+        Arguments:
+            include: `Iterable[str]` The fields to load, as `"Model.field"`
+
+            name: `str | None` A name for the projection
+
+        Raises:
+            ValueError: If a field isn't a field of one of `MODELS`
+        """
+        loaded = {x: set(y) for x, y in REQUIRED.items()}
+        for entry in include:
+            model, _, field = entry.partition(".")
+            if model not in loaded or field not in _fieldNames(model):
+                raise ValueError(
+                    f"{entry!r} is not a field of any of {', '.join(MODELS)}"
+                )
+            loaded[model].add(field)
+        self.name = name
+        self.fields: Dict[str, FrozenSet[str]] = {
+            x: frozenset(y) for x, y in loaded.items()
+        }
+        self._plans: Dict[type, tuple] = {}
+        self._hash = hash(tuple(sorted(self.fields.items())))
+
+    @staticmethod
+    def get(include: Projection | str | Iterable[str]) -> Projection:
+        """Returns the projection for what was passed as `include`
+
+        Arguments:
+            include: `Projection | str | Iterable[str]` A projection, the name of one of `PROFILES` or the fields
+            to load
+
+        Returns:
+            The `Projection`
+
+        Raises:
+            ValueError: If the profile or a field doesn't exist
+        """
+        if isinstance(include, Projection):
+            return include
+        if isinstance(include, str):
+            if include not in PROFILES:
+                raise ValueError(
+                    f"{include!r} is not a profile, expected one of {', '.join(PROFILES)}"
+                )
+            if include not in _profiles:
+                _profiles[include] = Projection(PROFILES[include], include)
+            return _profiles[include]
+        return Projection(include)
+
+    def loads(self, model: str, field: str) -> bool:
+        """Returns whether a field of a model is loaded"""
+        return field in self.fields[model]
+
+    def build(
+        self,
+        cls: type,
+        readers: Mapping[str, Callable[[dict], Any]],
+        data: dict,
+        **values: Any,
+    ) -> Any:
+        """Creates an object of a model with only its loaded fields set
+
+        Arguments:
+            cls: `type` The model
+
+            readers: `Mapping[str, Callable[[dict], Any]]` Reads each field from the model's JSON
+
+            data: `dict` The model's JSON
+
+            values: `Any` Values for loaded fields that aren't read with `readers`
+
+        Returns:
+            The object
+        """
+        plan = self._plans.get(cls)
+        if plan is None:
+            plan = self._plans[cls] = self._plan(cls, readers)
+        loaded, defaults = plan
+        retval = object.__new__(cls)
+        for name, reader in loaded:
+            setattr(retval, name, reader(data))
+        for name, value in values.items():
+            setattr(retval, name, value)
+        for name, default in defaults:
+            setattr(retval, name, default())
+        return retval
+
+    def _plan(self, cls: type, readers: Mapping[str, Callable[[dict], Any]]) -> tuple:
+        included = self.fields[cls.__name__]
+        loaded = tuple((x, y) for x, y in readers.items() if x in included)
+        # Fields that aren't created from the JSON, such as caches, are set to their defaults
+        defaults = tuple(
+            (
+                x.name,
+                (
+                    x.default_factory
+                    if x.default_factory is not MISSING
+                    else (lambda default=x.default: default)
+                ),
+            )
+            for x in fields(cls)
+            if not x.init
+        )
+        return loaded, defaults
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Projection):
+            return self.fields == other.fields
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        if self.name is not None:
+            return f"Projection({self.name!r})"
+        return f"Projection({sorted(f'{x}.{y}' for x, z in self.fields.items() for y in z)})"
+
+
+def projectable(cls: type) -> type:
+    """Makes a model dataclass tell apart fields left out by a projection
+
+    Reading a field that wasn't set raises a `SkippedFieldError`. `repr` shows such fields as `<skipped>`, and
+    objects compare equal when their loaded fields are equal and they skipped the same ones.
+    """
+    names = tuple(x.name for x in fields(cls) if x.repr)
+    compared = tuple(x.name for x in fields(cls) if x.compare)
+    field_names = frozenset(x.name for x in fields(cls))
+    generated_repr = cls.__repr__
+    generated_eq = cls.__eq__
+
+    def __getattr__(self, name: str) -> Any:
+        if name in field_names:
+            raise SkippedFieldError(
+                f"{cls.__name__}.{name} was not loaded, as it was left out by the projection the "
+                f"{cls.__name__} was created with. Include {cls.__name__ + '.' + name!r} to load it."
+            )
+        raise AttributeError(f"{cls.__name__!r} object has no attribute {name!r}")
+
+    def __repr__(self) -> str:
+        try:
+            return generated_repr(self)
+        except SkippedFieldError:
+            values = ", ".join(f"{x}={getattr(self, x, _SKIPPED)!r}" for x in names)
+            return f"{cls.__qualname__}({values})"
+
+    def __eq__(self, other: object) -> Any:
+        try:
+            return generated_eq(self, other)
+        except SkippedFieldError:
+            if other.__class__ is not self.__class__:
+                return NotImplemented
+            return all(
+                getattr(self, x, _SKIPPED) == getattr(other, x, _SKIPPED)
+                for x in compared
+            )
+
+    cls.__getattr__ = __getattr__
+    cls.__repr__ = __repr__
+    cls.__eq__ = __eq__
+    _models[cls.__name__] = cls
+    return cls
+
+
+class _Skipped:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<skipped>"
+
+
+_SKIPPED = _Skipped()
+
+
+def _fieldNames(model: str) -> FrozenSet[str]:
+    return frozenset(x.name for x in fields(_models[model]) if x.init)
+
+
+_models: Dict[str, type] = {}
+
+PROFILES = {
+    "gameplay": (
+        "OracleCard.cmc",
+        "OracleCard.color_identity",
+        "OracleCard.colors",
+        "OracleCard.faces",
+        "OracleCard.layout",
+        "OracleCard.legalities",
+        "OracleCard.mana_cost",
+        "OracleCard.mana_production",
+        "OracleCard.power",
+        "OracleCard.text",
+        "OracleCard.toughness",
+        "OracleCard.loyalty",
+        "ArchidektCard.companion",
+        "ArchidektCard.custom_cmc",
+    ),
+    "pricing": (
+        "Card.prices",
+        "Card.rarity",
+        "Card.edition",
+        "ArchidektCard.modifier",
+        "ArchidektCard.custom_cmc",
+        "OracleCard.cmc",
+        "OracleCard.colors",
+        "OracleCard.color_identity",
+    ),
+}
+"""`Dict[str, Tuple[str, ...]]` The fields loaded by each named profile: "gameplay" loads what playing the cards
+needs (costs, types, rules text, legality) and "pricing" what pricing them with `Deck.price` or `DeckFrame`
+needs
+
+Decks of either profile support `Deck.find`, `Deck.byType`, `Deck.byCategory`, `Deck.diff` and
+`Deck.applyUpdate`. Those of "gameplay" also support `Deck.legality` and those of "pricing" `Deck.price` and
+`Deck.columns`. Decks created with any projection can't be written with `Deck.dump`, stored in a `DeckStore`
+or `DeckCorpus` or put in a `DeckCache`."""
+
+_profiles: Dict[str, Projection] = {}
@@ -0,0 +1,135 @@
+"""
+Interning registry sharing `OracleCard` and `Edition` objects between decks
+"""
+
+from __future__ import annotations
+from .cache import CacheStats
+from .cards import OracleCard
+from .edition import Edition
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable
+
+
+class CardRegistry:
+    """Opt-in registry of parsed oracle cards and editions
+
+    The same oracle card (Sol Ring, Command Tower, ...) and the same edition show up in a great many decks. When
+    a registry is passed to `Deck.fromJson`, `Card.fromJson` asks it for each card's `OracleCard` and `Edition`,
+    which are then parsed only the first time they are seen and shared by reference from then on. Oracle cards
+    are keyed by `OracleCard.id` and editions by their code.
+
+    Because the objects are shared between every deck that was built with the registry, they must be treated
+    as read-only. Each table holds at most `max_size` objects; the least recently used ones are forgotten
+    first. Forgotten objects stay valid in the decks that use them, they just won't be shared with new ones.
+
+    ```python
+    registry = CardRegistry()
+    decks = [Deck.fromJson(x, registry=registry) for x in corpus]
+    print(f"{registry.oracle_stats.hit_rate:.0%} of oracle cards were shared")
+    ```
+
+    Attributes:
+        max_size: `int` The maximum number of oracle cards, and separately of editions, held
+
+        oracle_stats: `CacheStats` Hit, miss and eviction counters for oracle cards
+
+        edition_stats: `CacheStats` Hit, miss and eviction counters for editions
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        self.max_size = max_size
+        self.oracle_stats = CacheStats()
+        self.edition_stats = CacheStats()
+        self._oracle_cards: OrderedDict[int, OracleCard] = OrderedDict()
+        self._editions: OrderedDict[str, Edition] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._oracle_cards) + len(self._editions)
+
+    def oracleCard(self, data: dict) -> OracleCard:
+        """Returns the shared `OracleCard` for a dictionary, parsing it if it hasn't been seen
+
+        Arguments:
+            data: `dict` The oracle card JSON
+
+        Returns:
+            The shared `OracleCard`
+        """
+        return self.getOracleCard(data["id"], OracleCard.fromJson, data)
+
+    def edition(self, data: dict) -> Edition:
+        """Returns the shared `Edition` for a dictionary, parsing it if it hasn't been seen
+
+        Arguments:
+            data: `dict` The edition JSON
+
+        Returns:
+            The shared `Edition`
+        """
+        return self.getEdition(data["editioncode"], Edition.fromJson, data)
+
+    def getOracleCard(
+        self, id: int, build: Callable[[Any], OracleCard], data: Any
+    ) -> OracleCard:
+        """Returns the shared `OracleCard` with an id, building it from `data` if it hasn't been seen
+
+        Arguments:
+            id: `int` The ID of the oracle card
+
+            build: `Callable[[Any], OracleCard]` Builds the oracle card from `data`
+
+            data: `Any` The decoded oracle card, in whatever form `build` takes
+
+        Returns:
+            The shared `OracleCard`
+        """
+        return self._intern(self._oracle_cards, self.oracle_stats, id, build, data)
+
+    def getEdition(
+        self, code: str, build: Callable[[Any], Edition], data: Any
+    ) -> Edition:
+        """Returns the shared `Edition` with a code, building it from `data` if it hasn't been seen
+
+        Arguments:
+            code: `str` The code of the edition
+
+            build: `Callable[[Any], Edition]` Builds the edition from `data`
+
+            data: `Any` The decoded edition, in whatever form `build` takes
+
+        Returns:
+            The shared `Edition`
+        """
+        return self._intern(self._editions, self.edition_stats, code, build, data)
+
+    def clear(self) -> None:
+        """Forgets every held object"""
+        with self._lock:
+            self._oracle_cards.clear()
+            self._editions.clear()
+
+    def _intern(
+        self,
+        table: OrderedDict,
+        stats: CacheStats,
+        key: Any,
+        parse: Callable[[Any], Any],
+        data: Any,
+    ) -> Any:
+        with self._lock:
+            value = table.get(key)
+            if value is not None:
+                table.move_to_end(key)
+                stats.hits += 1
+                return value
+            stats.misses += 1
+
+        value = parse(data)
+        with self._lock:
+            value = table.setdefault(key, value)
+            while len(table) > self.max_size:
+                table.popitem(last=False)
+                stats.evictions += 1
+        return value
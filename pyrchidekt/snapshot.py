@@ -0,0 +1,395 @@
+"""
+Compact binary snapshots of built decks, to reload them much faster than from JSON
+
+A snapshot is a small header followed by a `marshal` body:
+
+- The header is the magic bytes `PYRCHDK\\0`, the format version, flags (unused, 0) and the length of the body.
+- The body holds three tables: editions, oracle cards and decks. Each edition and oracle card is written once,
+  however many cards of however many decks use it, and cards refer to them by their position in the tables.
+- Strings are deduplicated too. Each distinct string, such as a card name, type, category or edition code, is
+  written once, with later uses referring back to it through marshal's reference table, so reloaded decks also
+  share those strings.
+- Legalities are stored as their four bitmasks, and dates and datetimes as ISO strings.
+
+marshal is not secure against maliciously constructed data, so, as with pickle, only load snapshots from
+trusted sources.
+"""
+
+from __future__ import annotations
+from .cards import ArchidektCard, Card, OracleCard
+from .categories import Category
+from .deck import Deck
+from .edition import Edition
+from .formats import Format, Legalities
+from .mana import ManaProduction
+from .owner import Owner
+from datetime import date, datetime
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, List
+import marshal
+import struct
+
+if TYPE_CHECKING:
+    from .registry import CardRegistry
+
+MAGIC = b"PYRCHDK\x00"
+"""`bytes` The first bytes of every snapshot"""
+
+VERSION = 1
+"""`int` The version of the snapshot format written, and the only one read"""
+
+_HEADER = struct.Struct("<8sHHQ")
+_MARSHAL_VERSION = 4
+
+
+class SnapshotError(ValueError):
+    """Raised when reading something that isn't a snapshot, or a snapshot of an unsupported version"""
+
+
+def dumpDecks(decks: Iterable[Deck], file: IO[bytes]) -> None:
+    """Writes decks to a binary file as one snapshot
+
+    Lazily created decks have all their cards built first. Decks created with a projection can't be written, as
+    the fields it skipped weren't loaded.
+
+    Arguments:
+        decks: `Iterable[Deck]` The decks to write
+
+        file: `IO[bytes]` The file, opened for writing in binary mode
+
+    Raises:
+        ValueError: If a deck was created with a projection. Nothing is written then.
+    """
+    writer = _Writer()
+    body = marshal.dumps(writer.write(decks), _MARSHAL_VERSION)
+    file.write(_HEADER.pack(MAGIC, VERSION, 0, len(body)))
+    file.write(body)
+
+
+def loadDecks(file: IO[bytes], registry: CardRegistry | None = None) -> List[Deck]:
+    """Reads the decks of a snapshot written with `dumpDecks`
+
+    Arguments:
+        file: `IO[bytes]` The file, opened for reading in binary mode
+
+        registry: `CardRegistry | None` If given, oracle cards and editions are shared through this registry,
+        as with `Deck.fromJson`. Otherwise the decks of the snapshot share them among themselves.
+
+    Returns:
+        The decks, in the order they were written
+
+    Raises:
+        SnapshotError: If the file isn't a snapshot, is truncated or has an unsupported version
+    """
+    header = file.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise SnapshotError("Not a pyrchidekt snapshot: the file is too short")
+    magic, version, _, length = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise SnapshotError("Not a pyrchidekt snapshot: bad magic bytes")
+    if version != VERSION:
+        raise SnapshotError(
+            f"Unsupported snapshot version {version}, this version of pyrchidekt reads version {VERSION}"
+        )
+    body = file.read(length)
+    if len(body) < length:
+        raise SnapshotError("Truncated snapshot")
+    return _read(marshal.loads(body), registry)
+
+
+class _Writer:
+    def __init__(self):
+        self.editions: List[tuple] = []
+        self.oracle_cards: List[tuple] = []
+        self._edition_index: Dict[Any, List[tuple]] = {}
+        self._oracle_index: Dict[int, List[tuple]] = {}
+        self._strings: Dict[str, str] = {}
+
+    def write(self, decks: Iterable[Deck]) -> tuple:
+        written = [self._deck(x) for x in decks]
+        return self.editions, self.oracle_cards, written
+
+    def _string(self, value: Any) -> Any:
+        # Equal strings become the same object, which marshal then writes once
+        if type(value) is str:
+            return self._strings.setdefault(value, value)
+        return value
+
+    def _stringsOf(self, values: Any) -> Any:
+        if type(values) is list:
+            return [self._string(x) for x in values]
+        return values
+
+    def _deck(self, deck: Deck) -> tuple:
+        deck._requireAllFields("write")
+        owner = deck.owner
+        return (
+            deck.id,
+            deck.name,
+            deck.created_at.isoformat(),
+            deck.updated_at.isoformat(),
+            None if deck.format is None else deck.format.value,
+            deck.description,
+            deck.featured,
+            deck.custom_featured,
+            deck.game,
+            deck.private,
+            deck.view_count,
+            [self._card(x) for x in deck.cards],
+            deck.points,
+            deck.user_input,
+            (
+                owner.id,
+                owner.username,
+                owner.avatar,
+                owner.frame,
+                owner.ck_affiliate,
+                owner.tcg_affiliate,
+                owner.referrer_enum,
+            ),
+            [
+                (
+                    x.id,
+                    self._string(x.name),
+                    x.included_in_deck,
+                    x.included_in_price,
+                    x.is_premier,
+                )
+                for x in deck.categories
+            ],
+            deck.comment_root,
+            deck.editors,
+            deck.parent_folder,
+            deck.bookmarked,
+            self._stringsOf(deck.deck_tags),
+            deck.card_package,
+        )
+
+    def _card(self, card: ArchidektCard) -> tuple:
+        inner = card.card
+        return (
+            card.id,
+            self._stringsOf(card.categories),
+            card.companion,
+            card.flipped_default,
+            self._string(card.label),
+            self._string(card.label_color),
+            self._string(card.modifier),
+            card.quantity,
+            card.custom_cmc,
+            card.removed_categories,
+            card.created_at.isoformat(),
+            card.updated_at.isoformat(),
+            None if card.deleted_at is None else card.deleted_at.isoformat(),
+            inner.id,
+            inner.artist,
+            inner.tcg_product_id,
+            inner.ck_foil_id,
+            inner.ck_normal_id,
+            self._string(inner.cm_ed),
+            inner.collector_number,
+            inner.multiverse_id,
+            inner.mtgo_foil_id,
+            inner.mtgo_normal_id,
+            inner.uid,
+            inner.display_name,
+            self._edition(inner.edition),
+            inner.flavor,
+            inner.games,
+            self._stringsOf(inner.options),
+            self._oracleCard(inner.oracle_card),
+            inner.owned,
+            {self._string(x): y for x, y in inner.prices.items()},
+            self._string(inner.rarity),
+        )
+
+    def _edition(self, edition: Edition) -> int:
+        return self._index(
+            self._edition_index, edition.code, edition, self.editions, self._editionRow
+        )
+
+    def _oracleCard(self, oracle_card: OracleCard) -> int:
+        return self._index(
+            self._oracle_index,
+            oracle_card.id,
+            oracle_card,
+            self.oracle_cards,
+            self._oracleCardRow,
+        )
+
+    @staticmethod
+    def _index(index: dict, key: Any, value: Any, table: list, row) -> int:
+        # Objects are shared by key, unless two different ones have the same key
+        entries = index.setdefault(key, [])
+        for existing, position in entries:
+            if existing is value or existing == value:
+                return position
+        table.append(row(value))
+        entries.append((value, len(table) - 1))
+        return len(table) - 1
+
+    def _editionRow(self, edition: Edition) -> tuple:
+        return (
+            self._string(edition.code),
+            self._string(edition.name),
+            None if edition.date is None else edition.date.isoformat(),
+            self._string(edition.type),
+            self._string(edition.mtgo_code),
+        )
+
+    def _oracleCardRow(self, oracle_card: OracleCard) -> tuple:
+        legalities = oracle_card.legalities
+        production = oracle_card.mana_production
+        return (
+            oracle_card.id,
+            oracle_card.cmc,
+            self._stringsOf(oracle_card.color_identity),
+            self._stringsOf(oracle_card.colors),
+            oracle_card.faces,
+            self._string(oracle_card.layout),
+            (
+                legalities.known,
+                legalities.legal,
+                legalities.restricted,
+                legalities.banned,
+            ),
+            oracle_card.mana_cost,
+            (
+                production.white,
+                production.blue,
+                production.black,
+                production.red,
+                production.green,
+                production.colorless,
+            ),
+            oracle_card.name,
+            oracle_card.power,
+            oracle_card.salt,
+            self._stringsOf(oracle_card.sub_types),
+            self._stringsOf(oracle_card.super_types),
+            oracle_card.text,
+            oracle_card.tokens,
+            oracle_card.toughness,
+            self._stringsOf(oracle_card.types),
+            oracle_card.loyalty,
+            self._string(oracle_card.default_category),
+        )
+
+
+def _read(payload: tuple, registry: CardRegistry | None) -> List[Deck]:
+    edition_rows, oracle_rows, deck_rows = payload
+    if registry is None:
+        editions = [_edition(x) for x in edition_rows]
+        oracle_cards = [_oracleCard(x) for x in oracle_rows]
+    else:
+        editions = [registry.getEdition(x[0], _edition, x) for x in edition_rows]
+        oracle_cards = [
+            registry.getOracleCard(x[0], _oracleCard, x) for x in oracle_rows
+        ]
+    return [_deck(x, editions, oracle_cards) for x in deck_rows]
+
+
+def _edition(row: tuple) -> Edition:
+    code, name, day, type, mtgo_code = row
+    return Edition(
+        code, name, None if day is None else date.fromisoformat(day), type, mtgo_code
+    )
+
+
+def _oracleCard(row: tuple) -> OracleCard:
+    row = list(row)
+    row[6] = Legalities(*row[6])
+    row[8] = ManaProduction(*row[8])
+    return OracleCard(*row)
+
+
+def _deck(row: tuple, editions: List[Edition], oracle_cards: List[OracleCard]) -> Deck:
+    (
+        id,
+        name,
+        created_at,
+        updated_at,
+        format,
+        description,
+        featured,
+        custom_featured,
+        game,
+        private,
+        view_count,
+        card_rows,
+        points,
+        user_input,
+        owner,
+        category_rows,
+        comment_root,
+        editors,
+        parent_folder,
+        bookmarked,
+        deck_tags,
+        card_package,
+    ) = row
+    fromisoformat = datetime.fromisoformat
+    cards = []
+    append = cards.append
+    for (
+        card_id,
+        categories,
+        companion,
+        flipped_default,
+        label,
+        label_color,
+        modifier,
+        quantity,
+        custom_cmc,
+        removed_categories,
+        card_created_at,
+        card_updated_at,
+        deleted_at,
+        *inner,
+    ) in card_rows:
+        inner[12] = editions[inner[12]]
+        inner[16] = oracle_cards[inner[16]]
+        append(
+            ArchidektCard(
+                card_id,
+                Card(*inner),
+                categories,
+                companion,
+                flipped_default,
+                label,
+                label_color,
+                modifier,
+                quantity,
+                custom_cmc,
+                removed_categories,
+                fromisoformat(card_created_at),
+                fromisoformat(card_updated_at),
+                None if deleted_at is None else fromisoformat(deleted_at),
+            )
+        )
+
+    deck = Deck(
+        id,
+        name,
+        fromisoformat(created_at),
+        fromisoformat(updated_at),
+        None if format is None else Format(format),
+        description,
+        featured,
+        custom_featured,
+        game,
+        private,
+        view_count,
+        cards,
+        points,
+        user_input,
+        Owner(*owner),
+        [Category(*x) for x in category_rows],
+        comment_root,
+        editors,
+        parent_folder,
+        bookmarked,
+        deck_tags,
+        card_package,
+    )
+    deck.linkCategories()
+    return deck
@@ -0,0 +1,900 @@
+"""
+Local SQLite database of decks, with indexes for the usual questions asked of a fetched corpus
+
+Decks are split over six tables: `decks`, `owners`, `deck_cards`, `oracle_cards`, `editions` and `categories`.
+Oracle cards and editions are stored once however many decks use them, and the cards and categories of a deck are
+stored in its order, so a deck read back is equal to the one stored. Values without a column type of their own,
+such as lists of types or prices, are stored as JSON text, and dates and datetimes as ISO strings. Datetimes are
+converted to UTC first, and those without a time zone are taken to be in UTC already.
+
+Oracle card names, formats, owners and `updated_at` are indexed, so questions like "commander decks containing Sol
+Ring updated this year" don't scan every deck:
+```python
+with DeckStore("decks.sqlite") as store:
+    store.extend(decks)
+    rows = store.find(format=Format.COMMANDER, card="Sol Ring", updated_after=datetime(2024, 1, 1, tzinfo=UTC))
+```
+"""
+
+from __future__ import annotations
+from .cards import ArchidektCard, Card, OracleCard
+from .categories import Category
+from .deck import Deck
+from .edition import Edition
+from .formats import Format, Legalities
+from .mana import ManaProduction
+from .owner import Owner
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Tuple
+import json
+import os
+import sqlite3
+
+if TYPE_CHECKING:
+    from .registry import CardRegistry
+
+SCHEMA_VERSION = 1
+"""`int` The version of the database schema created, and the only one opened"""
+
+_SCHEMA = """
+CREATE TABLE owners (
+    id INTEGER PRIMARY KEY,
+    username TEXT COLLATE NOCASE,
+    avatar TEXT,
+    frame TEXT,
+    ck_affiliate TEXT,
+    tcg_affiliate TEXT,
+    referrer_enum TEXT
+);
+CREATE TABLE editions (
+    code TEXT PRIMARY KEY,
+    name TEXT,
+    date TEXT,
+    type TEXT,
+    mtgo_code TEXT
+);
+CREATE TABLE oracle_cards (
+    id INTEGER PRIMARY KEY,
+    name TEXT COLLATE NOCASE,
+    cmc,
+    color_identity TEXT,
+    colors TEXT,
+    faces TEXT,
+    layout TEXT,
+    legalities_known INTEGER,
+    legalities_legal INTEGER,
+    legalities_restricted INTEGER,
+    legalities_banned INTEGER,
+    mana_cost TEXT,
+    produces_white INTEGER,
+    produces_blue INTEGER,
+    produces_black INTEGER,
+    produces_red INTEGER,
+    produces_green INTEGER,
+    produces_colorless INTEGER,
+    power TEXT,
+    salt REAL,
+    sub_types TEXT,
+    super_types TEXT,
+    text TEXT,
+    tokens TEXT,
+    toughness TEXT,
+    types TEXT,
+    loyalty TEXT,
+    default_category TEXT
+);
+CREATE TABLE decks (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    format INTEGER,
+    description TEXT,
+    featured TEXT,
+    custom_featured TEXT,
+    game TEXT,
+    private INTEGER,
+    view_count INTEGER,
+    points INTEGER,
+    user_input INTEGER,
+    owner_id INTEGER REFERENCES owners (id),
+    comment_root INTEGER,
+    editors TEXT,
+    parent_folder INTEGER,
+    bookmarked INTEGER,
+    deck_tags TEXT,
+    card_package TEXT
+);
+CREATE TABLE categories (
+    deck_id INTEGER REFERENCES decks (id),
+    position INTEGER,
+    id INTEGER,
+    name TEXT,
+    included_in_deck INTEGER,
+    included_in_price INTEGER,
+    is_premier INTEGER,
+    PRIMARY KEY (deck_id, position)
+) WITHOUT ROWID;
+CREATE TABLE deck_cards (
+    deck_id INTEGER REFERENCES decks (id),
+    position INTEGER,
+    id INTEGER,
+    categories TEXT,
+    companion INTEGER,
+    flipped_default INTEGER,
+    label TEXT,
+    label_color TEXT,
+    modifier TEXT,
+    quantity INTEGER,
+    custom_cmc TEXT,
+    removed_categories TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    deleted_at TEXT,
+    card_id INTEGER,
+    artist TEXT,
+    tcg_product_id INTEGER,
+    ck_foil_id INTEGER,
+    ck_normal_id INTEGER,
+    cm_ed TEXT,
+    collector_number,
+    multiverse_id INTEGER,
+    mtgo_foil_id INTEGER,
+    mtgo_normal_id INTEGER,
+    uid TEXT,
+    display_name TEXT,
+    edition_code TEXT REFERENCES editions (code),
+    flavor TEXT,
+    games TEXT,
+    options TEXT,
+    oracle_id INTEGER REFERENCES oracle_cards (id),
+    owned INTEGER,
+    prices TEXT,
+    rarity TEXT,
+    PRIMARY KEY (deck_id, position)
+) WITHOUT ROWID;
+CREATE INDEX oracle_cards_name ON oracle_cards (name);
+CREATE INDEX deck_cards_oracle_id ON deck_cards (oracle_id, deck_id);
+CREATE INDEX decks_format ON decks (format, updated_at);
+CREATE INDEX decks_owner_id ON decks (owner_id, updated_at);
+CREATE INDEX decks_updated_at ON decks (updated_at);
+CREATE INDEX owners_username ON owners (username);
+"""
+
+_OWNER_COLUMNS = 7
+_EDITION_COLUMNS = 5
+_ORACLE_CARD_COLUMNS = 28
+_DECK_COLUMNS = 20
+_CATEGORY_COLUMNS = 7
+_DECK_CARD_COLUMNS = 35
+
+# SQLite limits the number of parameters of a statement
+_CHUNK = 500
+
+
+def _insert(verb: str, table: str, columns: int) -> str:
+    return f"{verb} INTO {table} VALUES ({', '.join('?' * columns)})"
+
+
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _toJson(value: Any) -> str | None:
+    # Most list values are empty, and skipping the encoder for them is a good part of the ingestion time
+    if value is None:
+        return None
+    if not value and type(value) is list:
+        return "[]"
+    return _encode(value)
+
+
+def _fromJson(value: str | None) -> Any:
+    return None if value is None else json.loads(value)
+
+
+def _toDatetime(value: datetime | None) -> str | None:
+    # In one time zone and at a fixed precision, the strings sort in chronological order
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _toBound(name: str, value: datetime) -> str:
+    if value.tzinfo is None:
+        raise ValueError(
+            f"{name} must be timezone-aware, such as datetime(2024, 1, 1, tzinfo=timezone.utc)"
+        )
+    return _toDatetime(value)
+
+
+def _fromBool(value: int | None) -> bool | None:
+    return None if value is None else bool(value)
+
+
+def _fromDatetime(value: str | None) -> datetime | None:
+    return None if value is None else datetime.fromisoformat(value)
+
+
+class StoreError(ValueError):
+    """Raised when opening a database created by an unsupported version of the store"""
+
+
+@dataclass(slots=True)
+class DeckRow:
+    """Lightweight view of a stored deck, read from the `decks` and `owners` tables alone
+
+    Attributes:
+        id: `int` The ID of the deck
+
+        name: `str` The name of the deck
+
+        format: `Format | None` The format of the deck
+
+        owner_id: `int` The ID of the deck's owner
+
+        owner_username: `str` The username of the deck's owner
+
+        created_at: `datetime` When the deck was created
+
+        updated_at: `datetime` When the deck was last updated
+
+        view_count: `int` How many times the deck was viewed
+    """
+
+    id: int
+    name: str
+    format: Format | None
+    owner_id: int
+    owner_username: str
+    created_at: datetime
+    updated_at: datetime
+    view_count: int
+
+
+class DeckStore:
+    """SQLite database of decks
+
+    Decks are stored in batches, each in one transaction. Storing a deck that is already in the database replaces
+    it, along with its cards and categories. Queries return `DeckRow` views, which only read the `decks` and
+    `owners` tables, or fully built decks.
+
+    The database can be read by other processes while it is written, as it is opened in write-ahead log mode.
+
+    Attributes:
+        path: `str` The database file, or `":memory:"`
+
+        registry: `CardRegistry | None` If given, oracle cards and editions of the decks read back are shared
+        through this registry, as with `Deck.fromJson`
+    """
+
+    def __init__(
+        self, path: str | os.PathLike = ":memory:", registry: CardRegistry | None = None
+    ):
+        """Opens the database, creating its tables if it is new
+
+        Arguments:
+            path: `str | os.PathLike` The database file. The default keeps the database in memory.
+
+            registry: `CardRegistry | None` Shares oracle cards and editions between decks read back
+
+        Raises:
+            StoreError: If the database was created by an unsupported version of the store
+        """
+        self.path = os.fspath(path)
+        self.registry = registry
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version == 0:
+            with self._connection:
+                self._connection.executescript(_SCHEMA)
+                self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        elif version != SCHEMA_VERSION:
+            self._connection.close()
+            raise StoreError(
+                f"Unsupported store schema version {version}, this version of pyrchidekt opens version "
+                f"{SCHEMA_VERSION}"
+            )
+        # The oracle cards and editions last written by this store. Later decks only write theirs again if they
+        # differ, which is mostly an identity check when decks share them through a registry.
+        self._oracle_cards: Dict[int, OracleCard] = {}
+        self._editions: Dict[str, Edition] = {}
+
+    def __enter__(self) -> DeckStore:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database"""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT count(*) FROM decks").fetchone()[0]
+
+    def __contains__(self, id: object) -> bool:
+        query = "SELECT 1 FROM decks WHERE id = ?"
+        return self._connection.execute(query, (id,)).fetchone() is not None
+
+    def add(self, deck: Deck) -> None:
+        """Stores a deck, replacing any version of it already in the database
+
+        Arguments:
+            deck: `Deck` The deck. Decks created with a projection can't be stored.
+        """
+        self.extend((deck,))
+
+    def addJson(self, data: dict) -> Deck:
+        """Builds a deck from its JSON with `Deck.fromJson` and stores it
+
+        Arguments:
+            data: `dict` The deck JSON
+
+        Returns:
+            The `Deck` that was stored
+        """
+        deck = Deck.fromJson(data, registry=self.registry)
+        self.add(deck)
+        return deck
+
+    def extend(self, decks: Iterable[Deck], batch_size: int = 500) -> int:
+        """Stores many decks, a batch at a time
+
+        When a deck is passed more than once, the last version of it is the one stored.
+
+        Arguments:
+            decks: `Iterable[Deck]` The decks. Decks created with a projection can't be stored.
+
+            batch_size: `int` How many decks are stored in each transaction
+
+        Returns:
+            The number of decks stored
+        """
+        stored = 0
+        batch = []
+        for deck in decks:
+            batch.append(deck)
+            if len(batch) == batch_size:
+                self._write(batch)
+                stored += len(batch)
+                batch = []
+        if batch:
+            self._write(batch)
+            stored += len(batch)
+        return stored
+
+    def _write(self, decks: List[Deck]) -> None:
+        # Only the last version of each deck is written, in the order of the last versions so later data wins
+        latest = {}
+        for deck in decks:
+            latest.pop(deck.id, None)
+            latest[deck.id] = deck
+        decks = list(latest.values())
+        owners = {}
+        editions = {}
+        oracle_cards = {}
+        deck_rows = []
+        category_rows = []
+        card_rows = []
+        written_oracle_cards = self._oracle_cards
+        written_editions = self._editions
+        for deck in decks:
+            deck._requireAllFields("store")
+            owners[deck.owner.id] = self._ownerRow(deck.owner)
+            deck_rows.append(self._deckRow(deck))
+            category_rows.extend(
+                (
+                    deck.id,
+                    position,
+                    x.id,
+                    x.name,
+                    x.included_in_deck,
+                    x.included_in_price,
+                    x.is_premier,
+                )
+                for position, x in enumerate(deck.categories)
+            )
+            for position, card in enumerate(deck.cards):
+                card_rows.append(self._cardRow(deck.id, position, card))
+                inner = card.card
+                # The latest data of an oracle card or edition wins, including within a batch
+                oracle_card = inner.oracle_card
+                written = oracle_cards.get(oracle_card.id)
+                if written is None:
+                    written = written_oracle_cards.get(oracle_card.id)
+                if written is not oracle_card and written != oracle_card:
+                    oracle_cards[oracle_card.id] = oracle_card
+                edition = inner.edition
+                written = editions.get(edition.code)
+                if written is None:
+                    written = written_editions.get(edition.code)
+                if written is not edition and written != edition:
+                    editions[edition.code] = edition
+
+        ids = [(x.id,) for x in decks]
+        with self._connection as connection:
+            connection.executemany("DELETE FROM deck_cards WHERE deck_id = ?", ids)
+            connection.executemany("DELETE FROM categories WHERE deck_id = ?", ids)
+            connection.executemany(
+                _insert("INSERT OR REPLACE", "owners", _OWNER_COLUMNS), owners.values()
+            )
+            connection.executemany(
+                _insert("INSERT OR REPLACE", "editions", _EDITION_COLUMNS),
+                [self._editionRow(x) for x in editions.values()],
+            )
+            connection.executemany(
+                _insert("INSERT OR REPLACE", "oracle_cards", _ORACLE_CARD_COLUMNS),
+                [self._oracleCardRow(x) for x in oracle_cards.values()],
+            )
+            connection.executemany(
+                _insert("INSERT OR REPLACE", "decks", _DECK_COLUMNS), deck_rows
+            )
+            connection.executemany(
+                _insert("INSERT", "categories", _CATEGORY_COLUMNS), category_rows
+            )
+            connection.executemany(
+                _insert("INSERT", "deck_cards", _DECK_CARD_COLUMNS), card_rows
+            )
+        written_oracle_cards.update(oracle_cards)
+        written_editions.update(editions)
+
+    @staticmethod
+    def _ownerRow(owner: Owner) -> tuple:
+        return (
+            owner.id,
+            owner.username,
+            owner.avatar,
+            _toJson(owner.frame),
+            owner.ck_affiliate,
+            owner.tcg_affiliate,
+            _toJson(owner.referrer_enum),
+        )
+
+    @staticmethod
+    def _editionRow(edition: Edition) -> tuple:
+        return (
+            edition.code,
+            edition.name,
+            None if edition.date is None else edition.date.isoformat(),
+            edition.type,
+            _toJson(edition.mtgo_code),
+        )
+
+    @staticmethod
+    def _oracleCardRow(oracle_card: OracleCard) -> tuple:
+        legalities = oracle_card.legalities
+        production = oracle_card.mana_production
+        return (
+            oracle_card.id,
+            oracle_card.name,
+            oracle_card.cmc,
+            _toJson(oracle_card.color_identity),
+            _toJson(oracle_card.colors),
+            _toJson(oracle_card.faces),
+            oracle_card.layout,
+            legalities.known,
+            legalities.legal,
+            legalities.restricted,
+            legalities.banned,
+            oracle_card.mana_cost,
+            production.white,
+            production.blue,
+            production.black,
+            production.red,
+            production.green,
+            production.colorless,
+            oracle_card.power,
+            oracle_card.salt,
+            _toJson(oracle_card.sub_types),
+            _toJson(oracle_card.super_types),
+            oracle_card.text,
+            _toJson(oracle_card.tokens),
+            oracle_card.toughness,
+            _toJson(oracle_card.types),
+            oracle_card.loyalty,
+            oracle_card.default_category,
+        )
+
+    @staticmethod
+    def _deckRow(deck: Deck) -> tuple:
+        return (
+            deck.id,
+            deck.name,
+            _toDatetime(deck.created_at),
+            _toDatetime(deck.updated_at),
+            None if deck.format is None else deck.format.value,
+            deck.description,
+            deck.featured,
+            deck.custom_featured,
+            _toJson(deck.game),
+            deck.private,
+            deck.view_count,
+            deck.points,
+            deck.user_input,
+            deck.owner.id,
+            deck.comment_root,
+            _toJson(deck.editors),
+            deck.parent_folder,
+            deck.bookmarked,
+            _toJson(deck.deck_tags),
+            _toJson(deck.card_package),
+        )
+
+    @staticmethod
+    def _cardRow(deck_id: int, position: int, card: ArchidektCard) -> tuple:
+        inner = card.card
+        return (
+            deck_id,
+            position,
+            card.id,
+            _toJson(card.categories),
+            card.companion,
+            card.flipped_default,
+            card.label,
+            card.label_color,
+            card.modifier,
+            card.quantity,
+            _toJson(card.custom_cmc),
+            _toJson(card.removed_categories),
+            _toDatetime(card.created_at),
+            _toDatetime(card.updated_at),
+            _toDatetime(card.deleted_at),
+            inner.id,
+            inner.artist,
+            inner.tcg_product_id,
+            inner.ck_foil_id,
+            inner.ck_normal_id,
+            inner.cm_ed,
+            inner.collector_number,
+            inner.multiverse_id,
+            inner.mtgo_foil_id,
+            inner.mtgo_normal_id,
+            inner.uid,
+            _toJson(inner.display_name),
+            inner.edition.code,
+            inner.flavor,
+            _toJson(inner.games),
+            _toJson(inner.options),
+            inner.oracle_card.id,
+            inner.owned,
+            _toJson(inner.prices),
+            inner.rarity,
+        )
+
+    def find(
+        self,
+        format: Format | None = None,
+        card: str | None = None,
+        owner: int | str | None = None,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
+        limit: int | None = None,
+    ) -> List[DeckRow]:
+        """Finds stored decks, most recently updated first
+
+        Arguments:
+            format: `Format | None` Only decks of this format
+
+            card: `str | None` Only decks with a card of this oracle name, compared case-insensitively
+
+            owner: `int | str | None` Only decks of the owner with this ID, or this username
+
+            updated_after: `datetime | None` Only decks updated after this. It must be timezone-aware.
+
+            updated_before: `datetime | None` Only decks updated before this. It must be timezone-aware.
+
+            limit: `int | None` The maximum number of decks returned
+
+        Returns:
+            A `DeckRow` for each deck found
+
+        Raises:
+            ValueError: If `updated_after` or `updated_before` has no time zone
+        """
+        where, parameters = self._where(
+            format, card, owner, updated_after, updated_before, limit
+        )
+        query = (
+            "SELECT decks.id, decks.name, decks.format, decks.owner_id, owners.username, decks.created_at, "
+            "decks.updated_at, decks.view_count FROM decks LEFT JOIN owners ON owners.id = decks.owner_id "
+            + where
+        )
+        return [
+            DeckRow(
+                id,
+                name,
+                None if code is None else Format(code),
+                owner_id,
+                username,
+                _fromDatetime(created_at),
+                _fromDatetime(updated_at),
+                view_count,
+            )
+            for id, name, code, owner_id, username, created_at, updated_at, view_count in self._connection.execute(
+                query, parameters
+            )
+        ]
+
+    def decks(
+        self,
+        format: Format | None = None,
+        card: str | None = None,
+        owner: int | str | None = None,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Deck]:
+        """Finds stored decks like `find`, and builds them one at a time
+
+        Arguments:
+            format: `Format | None` Only decks of this format
+
+            card: `str | None` Only decks with a card of this oracle name, compared case-insensitively
+
+            owner: `int | str | None` Only decks of the owner with this ID, or this username
+
+            updated_after: `datetime | None` Only decks updated after this. It must be timezone-aware.
+
+            updated_before: `datetime | None` Only decks updated before this. It must be timezone-aware.
+
+            limit: `int | None` The maximum number of decks returned
+
+        Returns:
+            An iterator over the decks found, most recently updated first
+
+        Raises:
+            ValueError: If `updated_after` or `updated_before` has no time zone
+        """
+        where, parameters = self._where(
+            format, card, owner, updated_after, updated_before, limit
+        )
+        rows = self._connection.execute(
+            "SELECT decks.*, owners.* FROM decks LEFT JOIN owners ON owners.id = decks.owner_id "
+            + where,
+            parameters,
+        ).fetchall()
+        return self._decks(rows)
+
+    def _decks(self, rows: List[tuple]) -> Iterator[Deck]:
+        editions: Dict[str, Edition] = {}
+        oracle_cards: Dict[int, OracleCard] = {}
+        for row in rows:
+            yield self._deck(row, editions, oracle_cards)
+
+    def getDeck(self, id: int) -> Deck | None:
+        """Builds a stored deck
+
+        Arguments:
+            id: `int` The ID of the deck
+
+        Returns:
+            The `Deck`, or `None` if it isn't stored
+        """
+        row = self._connection.execute(
+            "SELECT decks.*, owners.* FROM decks LEFT JOIN owners ON owners.id = decks.owner_id WHERE decks.id = ?",
+            (id,),
+        ).fetchone()
+        return None if row is None else self._deck(row, {}, {})
+
+    def delete(self, id: int) -> None:
+        """Removes a deck, with its cards and categories, if it is stored
+
+        Oracle cards, editions and owners are kept, as other decks may use them.
+
+        Arguments:
+            id: `int` The ID of the deck
+        """
+        with self._connection as connection:
+            connection.execute("DELETE FROM deck_cards WHERE deck_id = ?", (id,))
+            connection.execute("DELETE FROM categories WHERE deck_id = ?", (id,))
+            connection.execute("DELETE FROM decks WHERE id = ?", (id,))
+
+    @staticmethod
+    def _where(
+        format: Format | None,
+        card: str | None,
+        owner: int | str | None,
+        updated_after: datetime | None,
+        updated_before: datetime | None,
+        limit: int | None,
+    ) -> Tuple[str, list]:
+        clauses = []
+        parameters = []
+        if format is not None:
+            clauses.append("decks.format = ?")
+            parameters.append(format.value)
+        if card is not None:
+            clauses.append(
+                "decks.id IN (SELECT deck_cards.deck_id FROM oracle_cards JOIN deck_cards "
+                "ON deck_cards.oracle_id = oracle_cards.id WHERE oracle_cards.name = ?)"
+            )
+            parameters.append(card)
+        if isinstance(owner, str):
+            clauses.append(
+                "decks.owner_id IN (SELECT id FROM owners WHERE username = ?)"
+            )
+            parameters.append(owner)
+        elif owner is not None:
+            clauses.append("decks.owner_id = ?")
+            parameters.append(owner)
+        if updated_after is not None:
+            clauses.append("decks.updated_at > ?")
+            parameters.append(_toBound("updated_after", updated_after))
+        if updated_before is not None:
+            clauses.append("decks.updated_at < ?")
+            parameters.append(_toBound("updated_before", updated_before))
+
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        where += "ORDER BY decks.updated_at DESC, decks.id"
+        if limit is not None:
+            where += " LIMIT ?"
+            parameters.append(limit)
+        return where, parameters
+
+    def _deck(
+        self,
+        row: tuple,
+        editions: Dict[str, Edition],
+        oracle_cards: Dict[int, OracleCard],
+    ) -> Deck:
+        deck_id = row[0]
+        card_rows = self._connection.execute(
+            "SELECT * FROM deck_cards WHERE deck_id = ? ORDER BY position", (deck_id,)
+        ).fetchall()
+        self._fetch(
+            "editions",
+            "code",
+            {x[27] for x in card_rows} - editions.keys(),
+            editions,
+            self._edition,
+            self.registry.getEdition if self.registry is not None else None,
+        )
+        self._fetch(
+            "oracle_cards",
+            "id",
+            {x[31] for x in card_rows} - oracle_cards.keys(),
+            oracle_cards,
+            self._oracleCard,
+            self.registry.getOracleCard if self.registry is not None else None,
+        )
+
+        cards = [self._card(x, editions, oracle_cards) for x in card_rows]
+        categories = [
+            Category(x[2], x[3], _fromBool(x[4]), _fromBool(x[5]), _fromBool(x[6]))
+            for x in self._connection.execute(
+                "SELECT * FROM categories WHERE deck_id = ? ORDER BY position",
+                (deck_id,),
+            )
+        ]
+        owner = row[_DECK_COLUMNS:]
+        deck = Deck(
+            deck_id,
+            row[1],
+            _fromDatetime(row[2]),
+            _fromDatetime(row[3]),
+            None if row[4] is None else Format(row[4]),
+            row[5],
+            row[6],
+            row[7],
+            _fromJson(row[8]),
+            _fromBool(row[9]),
+            row[10],
+            cards,
+            row[11],
+            row[12],
+            Owner(
+                owner[0],
+                owner[1],
+                owner[2],
+                _fromJson(owner[3]),
+                owner[4],
+                owner[5],
+                _fromJson(owner[6]),
+            ),
+            categories,
+            row[14],
+            _fromJson(row[15]),
+            row[16],
+            _fromBool(row[17]),
+            _fromJson(row[18]),
+            _fromJson(row[19]),
+        )
+        deck.linkCategories()
+        return deck
+
+    def _fetch(
+        self, table: str, key: str, missing: set, into: dict, build, shared
+    ) -> None:
+        missing = list(missing)
+        for start in range(0, len(missing), _CHUNK):
+            chunk = missing[start : start + _CHUNK]
+            query = (
+                f"SELECT * FROM {table} WHERE {key} IN ({', '.join('?' * len(chunk))})"
+            )
+            for row in self._connection.execute(query, chunk):
+                into[row[0]] = (
+                    build(row) if shared is None else shared(row[0], build, row)
+                )
+
+    @staticmethod
+    def _edition(row: tuple) -> Edition:
+        code, name, day, type, mtgo_code = row
+        return Edition(
+            code,
+            name,
+            None if day is None else date.fromisoformat(day),
+            type,
+            _fromJson(mtgo_code),
+        )
+
+    @staticmethod
+    def _oracleCard(row: tuple) -> OracleCard:
+        return OracleCard(
+            row[0],
+            row[2],
+            _fromJson(row[3]),
+            _fromJson(row[4]),
+            _fromJson(row[5]),
+            row[6],
+            Legalities(row[7], row[8], row[9], row[10]),
+            row[11],
+            ManaProduction(*row[12:18]),
+            row[1],
+            row[18],
+            row[19],
+            _fromJson(row[20]),
+            _fromJson(row[21]),
+            row[22],
+            _fromJson(row[23]),
+            row[24],
+            _fromJson(row[25]),
+            row[26],
+            row[27],
+        )
+
+    @staticmethod
+    def _card(
+        row: tuple, editions: Dict[str, Edition], oracle_cards: Dict[int, OracleCard]
+    ) -> ArchidektCard:
+        return ArchidektCard(
+            row[2],
+            Card(
+                row[15],
+                row[16],
+                row[17],
+                row[18],
+                row[19],
+                row[20],
+                row[21],
+                row[22],
+                row[23],
+                row[24],
+                row[25],
+                _fromJson(row[26]),
+                editions[row[27]],
+                row[28],
+                _fromJson(row[29]),
+                _fromJson(row[30]),
+                oracle_cards[row[31]],
+                row[32],
+                _fromJson(row[33]),
+                row[34],
+            ),
+            _fromJson(row[3]),
+            _fromBool(row[4]),
+            _fromBool(row[5]),
+            row[6],
+            row[7],
+            row[8],
+            row[9],
+            _fromJson(row[10]),
+            _fromJson(row[11]),
+            _fromDatetime(row[12]),
+            _fromDatetime(row[13]),
+            _fromDatetime(row[14]),
+        )
@@ -0,0 +1,168 @@
+"""
+Streaming parser yielding the cards of a deck while its JSON is still being read
+"""
+
+from __future__ import annotations
+from .cards import ArchidektCard
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, Iterator
+import codecs
+import json
+import re
+
+if TYPE_CHECKING:
+    from .registry import CardRegistry
+
+_WHITESPACE = " \t\n\r"
+_SCALAR_END = re.compile(r"[ \t\n\r,\]}]")
+
+
+class DeckStream:
+    """Reads a deck's JSON incrementally, yielding each `ArchidektCard` as soon as its JSON has been read
+
+    Only the card being parsed and a chunk of input are held at a time, so memory stays roughly constant no
+    matter how many cards the deck has. The deck's other fields are put in `metadata` as they are read, with
+    their JSON names. Archidekt sends most of them before the cards, but `owner` and `categories` only after, so
+    those are only there once every card has been yielded. The stream is an iterator: iterating it again
+    continues where the last loop stopped.
+
+    ```python
+    with open("cube.json", "rb") as f:
+        stream = DeckStream(f)
+        for card in stream:
+            print(stream.metadata["name"], card.card.oracle_card.name)
+    ```
+
+    Attributes:
+        metadata: `Dict[str, Any]` The deck's fields other than `cards`, as far as they have been read
+    """
+
+    def __init__(
+        self,
+        source: IO | Iterable[bytes | str],
+        registry: CardRegistry | None = None,
+        chunk_size: int = 65536,
+    ):
+        """Creates the stream. Nothing is read until it is iterated.
+
+        Arguments:
+            source: `IO | Iterable[bytes | str]` A binary or text file, or an iterable of chunks such as
+            `requests.Response.iter_content()`
+
+            registry: `CardRegistry | None` An optional registry to share oracle cards and editions through
+
+            chunk_size: `int` How much to read from a file at once
+        """
+        if hasattr(source, "read"):
+            read = source.read
+            self._chunks = iter(lambda: read(chunk_size), read(0))
+        else:
+            self._chunks = iter(source)
+        self.metadata: Dict[str, Any] = {}
+        self._registry = registry
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._iterator: Iterator[ArchidektCard] | None = None
+
+    def __iter__(self) -> Iterator[ArchidektCard]:
+        if self._iterator is None:
+            self._iterator = self._cards()
+        return self._iterator
+
+    def finish(self) -> Dict[str, Any]:
+        """Reads the rest of the deck, skipping any cards that haven't been yielded yet
+
+        Returns:
+            The complete `metadata`
+        """
+        for _ in self:
+            pass
+        return self.metadata
+
+    def _cards(self) -> Iterator[ArchidektCard]:
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == "cards":
+                self._expect("[")
+                if self._peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        yield ArchidektCard.fromJson(self._value(), self._registry)
+                        if self._expect(",]") == "]":
+                            break
+            else:
+                self.metadata[key] = self._value()
+            if self._expect(",}") == "}":
+                return
+
+    def _read(self) -> bool:
+        if self._eof:
+            return False
+        if self._pos:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        for chunk in self._chunks:
+            if isinstance(chunk, bytes):
+                chunk = self._decoder.decode(chunk)
+            if chunk:
+                self._buffer += chunk
+                return True
+        self._eof = True
+        self._buffer += self._decoder.decode(b"", final=True)
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer):
+                if self._buffer[self._pos] not in _WHITESPACE:
+                    return self._buffer[self._pos]
+                self._pos += 1
+            if not self._read():
+                raise ValueError("Unexpected end of deck JSON")
+
+    def _expect(self, allowed: str) -> str:
+        char = self._peek()
+        if char not in allowed:
+            raise ValueError(
+                f"Expected one of {allowed!r} in deck JSON but found {char!r}"
+            )
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        if self._peek() not in '{["':
+            # Numbers and literals only end at a delimiter, as a prefix such as "1." or "2e" may be cut short
+            while _SCALAR_END.search(self._buffer, self._pos) is None and self._read():
+                pass
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise
+                continue
+            self._pos = end
+            return value
+
+
+def streamDeck(
+    source: IO | Iterable[bytes | str], registry: CardRegistry | None = None
+) -> DeckStream:
+    """Returns a `DeckStream` over a file or an iterable of chunks of deck JSON
+
+    Arguments:
+        source: `IO | Iterable[bytes | str]` Where to read the deck JSON from
+
+        registry: `CardRegistry | None` An optional registry to share oracle cards and editions through
+
+    Returns:
+        The `DeckStream`
+    """
+    return DeckStream(source, registry)
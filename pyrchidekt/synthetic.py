@@ -0,0 +1,404 @@
+"""
+Deterministic generator of synthetic Archidekt-shaped deck JSON
+
+Everything is derived from a seed, so the same arguments always produce the same decks. Cards are drawn from a
+shared pool of oracle cards with a skewed popularity, so like real decks, a few staples show up in most decks.
+"""
+
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from typing import Dict, List
+import random
+import uuid
+
+COLORS = [("W", "White"), ("U", "Blue"), ("B", "Black"), ("R", "Red"), ("G", "Green")]
+LEGALITY_KEYS = [
+    "standard", "modern", "commander", "legacy", "vintage", "pauper", "oldschool", "future", "penny", "1v1",
+    "duel", "brawl", "oathbreaker", "pioneer", "historic", "paupercommander", "alchemy", "explorer",
+    "historicbrawl", "gladiator", "premodern", "predh", "timeless", "canlander",
+]  # fmt: skip
+TYPES = [
+    (["Creature"], 40),
+    (["Instant"], 12),
+    (["Sorcery"], 10),
+    (["Artifact"], 10),
+    (["Enchantment"], 9),
+    (["Land"], 12),
+    (["Planeswalker"], 2),
+    (["Artifact", "Creature"], 3),
+    (["Enchantment", "Creature"], 2),
+]
+SUB_TYPES = [
+    "Human",
+    "Elf",
+    "Goblin",
+    "Wizard",
+    "Soldier",
+    "Zombie",
+    "Dragon",
+    "Elemental",
+    "Warrior",
+]
+CATEGORIES = [
+    ("Ramp", True, True, 10),
+    ("Draw", True, True, 9),
+    ("Removal", True, True, 9),
+    ("Creature", True, True, 25),
+    ("Land", True, True, 30),
+    ("Protection", True, True, 4),
+    ("Wincon", True, True, 3),
+    ("Maybeboard", False, False, 6),
+    ("Sideboard", False, True, 4),
+]
+LABELS = ["", "", "", ",#656565", "Have,#37d67a", "Need,#f47373", "Proxy,#2ccce4"]
+SYLLABLES = [
+    "ar",
+    "bel",
+    "cor",
+    "dra",
+    "eth",
+    "fal",
+    "gor",
+    "hyl",
+    "ith",
+    "jor",
+    "kal",
+    "lum",
+    "mor",
+    "nyx",
+]
+EPOCH = datetime(2019, 1, 1, tzinfo=timezone.utc)
+
+
+def _timestamp(rng: random.Random, start: datetime = EPOCH) -> datetime:
+    return start + timedelta(
+        seconds=rng.randrange(0, 4 * 365 * 86400), microseconds=rng.randrange(10**6)
+    )
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _name(rng: random.Random) -> str:
+    words = [
+        "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+        for _ in range(rng.randint(1, 3))
+    ]
+    return " ".join(x.capitalize() for x in words)
+
+
+class CardPool:
+    """A fixed set of synthetic oracle cards and editions that decks draw from
+
+    Attributes:
+        oracle_cards: `List[dict]` The oracle card JSON, most popular first
+
+        editions: `List[dict]` The edition JSON
+    """
+
+    def __init__(self, size: int = 5000, editions: int = 200, seed: int = 0):
+        rng = random.Random(seed)
+        self.editions = [self._edition(rng, i) for i in range(editions)]
+        self.oracle_cards = [self._oracleCard(rng, i) for i in range(size)]
+        self._cum_weights = list(accumulate(1.0 / (i + 1) for i in range(size)))
+
+    @staticmethod
+    def _edition(rng: random.Random, i: int) -> dict:
+        code = "".join(
+            rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(3)
+        ) + str(i)
+        return {
+            "editioncode": code,
+            "editionname": _name(rng),
+            "editiondate": (EPOCH - timedelta(days=rng.randrange(0, 30 * 365)))
+            .date()
+            .isoformat(),
+            "editiontype": rng.choice(
+                ["expansion", "core", "commander", "masters", "starter"]
+            ),
+            "mtgoCode": code if rng.random() < 0.6 else None,
+        }
+
+    @staticmethod
+    def _oracleCard(rng: random.Random, i: int) -> dict:
+        types = rng.choices([x[0] for x in TYPES], weights=[x[1] for x in TYPES])[0]
+        land = "Land" in types
+        colors = (
+            []
+            if land
+            else rng.sample(
+                COLORS, k=rng.choices([0, 1, 2, 3], weights=[10, 60, 25, 5])[0]
+            )
+        )
+        cmc = (
+            0
+            if land
+            else rng.choices(range(9), weights=[2, 14, 20, 20, 16, 11, 8, 5, 4])[0]
+        )
+        pips = "".join("{" + x[0] + "}" for x in colors)
+        generic = max(cmc - len(colors), 0)
+        mana_cost = "" if land else ("{" + str(generic) + "}" if generic else "") + pips
+        produces = {x[0]: None for x in COLORS} | {"C": None}
+        if land or (("Artifact" in types) and rng.random() < 0.3):
+            for symbol in rng.sample(
+                [x[0] for x in COLORS] + ["C"], k=rng.randint(1, 2)
+            ):
+                produces[symbol] = 1
+        legalities = {}
+        for key in LEGALITY_KEYS:
+            roll = rng.random()
+            legalities[key] = (
+                "legal"
+                if roll < 0.62
+                else (
+                    "not_legal"
+                    if roll < 0.97
+                    else "banned" if roll < 0.995 else "restricted"
+                )
+            )
+        creature = "Creature" in types
+        return {
+            "id": 1000 + i,
+            "cmc": cmc,
+            "colorIdentity": [x[1] for x in colors],
+            "colors": [x[1] for x in colors],
+            "faces": [],
+            "layout": "normal",
+            "legalities": legalities,
+            "manaCost": mana_cost,
+            "manaProduction": produces,
+            "name": f"{_name(rng)} {i}",
+            "power": str(rng.randint(0, 8)) if creature else "",
+            "salt": round(rng.random() * 2, 2) if rng.random() < 0.7 else None,
+            "subTypes": rng.sample(SUB_TYPES, k=rng.randint(1, 2)) if creature else [],
+            "superTypes": ["Legendary"] if rng.random() < 0.15 else [],
+            "text": " ".join(_name(rng) for _ in range(rng.randint(5, 30))),
+            "tokens": [str(rng.randint(30000, 40000))] if rng.random() < 0.1 else [],
+            "toughness": str(rng.randint(1, 8)) if creature else "",
+            "types": types,
+            "loyalty": str(rng.randint(3, 6)) if "Planeswalker" in types else None,
+            "defaultCategory": None,
+        }
+
+    def printing(self, rng: random.Random, index: int) -> dict:
+        """Returns the JSON of one printing of an oracle card, with its own edition and prices
+
+        Arguments:
+            rng: `random.Random` The random source
+
+            index: `int` The index of the oracle card in the pool
+
+        Returns:
+            The `Card` JSON
+        """
+        oracle = self.oracle_cards[index]
+        edition = self.editions[(index * 7 + rng.randrange(3)) % len(self.editions)]
+        base = round(rng.lognormvariate(0, 1.3), 2)
+        return {
+            "id": 100000 + index * 4 + rng.randrange(4),
+            "artist": _name(rng),
+            "tcgProductId": rng.randrange(1, 600000),
+            "ckFoilId": rng.randrange(0, 300000),
+            "ckNormalId": rng.randrange(1, 300000),
+            "cmEd": edition["editionname"].lower(),
+            "collectorNumber": str(rng.randrange(1, 400)),
+            "multiverseid": rng.randrange(0, 600000),
+            "mtgoFoilId": 0,
+            "mtgoNormalId": 0,
+            "uid": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            "displayName": None,
+            "edition": edition,
+            "flavor": _name(rng) if rng.random() < 0.4 else "",
+            "games": [],
+            "options": ["Normal", "Foil"],
+            "oracleCard": oracle,
+            "owned": 0,
+            "prices": {
+                "ck": round(base * 1.1, 2),
+                "ckfoil": round(base * 2.4, 2),
+                "cm": round(base * 0.8, 2),
+                "cmfoil": round(base * 1.9, 2),
+                "mtgo": round(base * 0.1, 2),
+                "mtgofoil": round(base * 0.2, 2),
+                "tcg": base,
+                "tcgfoil": round(base * 2.2, 2),
+            },
+            "rarity": rng.choice(["common", "uncommon", "rare", "mythic"]),
+        }
+
+    def sample(self, rng: random.Random, count: int) -> List[int]:
+        """Returns `count` pool indexes, favoring popular cards
+
+        Indexes are distinct while the pool allows it. Larger requests, like collection-sized decks, use every
+        card in the pool and repeat popular ones for the rest.
+        """
+        size = len(self.oracle_cards)
+        chosen: Dict[int, None] = {}
+        for _ in range(20):
+            if len(chosen) >= min(count, size):
+                break
+            for index in rng.choices(
+                range(size), cum_weights=self._cum_weights, k=count - len(chosen)
+            ):
+                chosen[index] = None
+        for index in range(size):
+            if len(chosen) >= min(count, size):
+                break
+            chosen[index] = None
+        extra = rng.choices(
+            range(size), cum_weights=self._cum_weights, k=count - len(chosen)
+        )
+        return list(chosen)[:count] + extra
+
+
+_default_pool: CardPool | None = None
+
+
+def defaultPool() -> CardPool:
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = CardPool()
+    return _default_pool
+
+
+def generateDeck(
+    id: int, cards: int = 100, seed: int | None = None, pool: CardPool | None = None
+) -> dict:
+    """Generates the JSON of one deck
+
+    Arguments:
+        id: `int` The ID of the deck, also the default seed
+
+        cards: `int` How many card entries the deck has
+
+        seed: `int | None` The random seed. Defaults to `id`.
+
+        pool: `CardPool | None` The cards to draw from. Defaults to a shared pool of 5,000 cards.
+
+    Returns:
+        The deck JSON, as `Deck.fromJson` expects it
+    """
+    rng = random.Random(id if seed is None else seed)
+    pool = pool or defaultPool()
+    created = _timestamp(rng)
+    updated = created + timedelta(
+        days=rng.randrange(0, 200), seconds=rng.randrange(86400)
+    )
+    categories = [
+        {
+            "id": 40000000 + id * 16 + i,
+            "name": name,
+            "includedInDeck": deck,
+            "includedInPrice": price,
+            "isPremier": False,
+        }
+        for i, (name, deck, price, _) in enumerate(CATEGORIES)
+    ]
+    categories.insert(
+        0,
+        {
+            "id": 40000000 + id * 16 + 15,
+            "name": "Commander",
+            "includedInDeck": True,
+            "includedInPrice": True,
+            "isPremier": True,
+        },
+    )
+    weights = [x[3] for x in CATEGORIES]
+
+    entries = []
+    for n, index in enumerate(pool.sample(rng, cards)):
+        card = pool.printing(rng, index)
+        types = card["oracleCard"]["types"]
+        if n == 0:
+            names = ["Commander"]
+        elif "Land" in types and rng.random() < 0.9:
+            names = ["Land"]
+        elif "Creature" in types and rng.random() < 0.7:
+            names = ["Creature"] + (["Ramp"] if rng.random() < 0.1 else [])
+        else:
+            names = list(
+                dict.fromkeys(
+                    rng.choices(
+                        [x[0] for x in CATEGORIES], weights=weights, k=rng.randint(1, 2)
+                    )
+                )
+            )
+        added = _timestamp(rng, created)
+        entries.append(
+            {
+                "id": 1400000000 + id * 20000 + n,
+                "categories": names,
+                "companion": False,
+                "flippedDefault": False,
+                "label": rng.choice(LABELS),
+                "modifier": "Foil" if rng.random() < 0.1 else "Normal",
+                "quantity": (
+                    rng.randint(2, 12) if "Land" in types and rng.random() < 0.2 else 1
+                ),
+                "customCmc": None,
+                "removedCategories": None,
+                "createdAt": _iso(added),
+                "updatedAt": _iso(
+                    added + timedelta(seconds=rng.randrange(0, 86400 * 30))
+                ),
+                "deletedAt": None,
+                "card": card,
+            }
+        )
+
+    return {
+        "id": id,
+        "name": f"Deck #{id}",
+        "createdAt": _iso(created),
+        "updatedAt": _iso(updated),
+        "deckFormat": rng.choices(
+            [3, 1, 2, 4, 6, 14, 15], weights=[70, 8, 8, 4, 4, 3, 3]
+        )[0],
+        "description": '{"ops":[]}',
+        "featured": "",
+        "customFeatured": "",
+        "game": None,
+        "private": False,
+        "viewCount": rng.randrange(0, 5000),
+        "cards": entries,
+        "points": rng.randrange(0, 50),
+        "userInput": 0,
+        "owner": {
+            "id": 10000 + id % 997,
+            "username": f"User #{id % 997}",
+            "avatar": "",
+            "frame": None,
+            "ckAffiliate": "",
+            "tcgAffiliate": "",
+            "referrerEnum": None,
+        },
+        "categories": categories,
+        "commentRoot": 5000000 + id,
+        "editors": [],
+        "parentFolder": 100000 + id % 997,
+        "bookmarked": False,
+        "deckTags": [],
+        "cardPackage": None,
+    }
+
+
+def generateCorpus(
+    decks: int, cards: int = 100, pool: CardPool | None = None
+) -> List[dict]:
+    """Generates the JSON of many decks sharing one card pool
+
+    Arguments:
+        decks: `int` The number of decks
+
+        cards: `int` How many card entries each deck has
+
+        pool: `CardPool | None` The cards to draw from
+
+    Returns:
+        A list of deck JSON, with ids `0..decks-1`
+    """
+    pool = pool or defaultPool()
+    return [generateDeck(i, cards, pool=pool) for i in range(decks)]
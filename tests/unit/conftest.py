@@ -0,0 +1,12 @@
+from __future__ import annotations
+from pyrchidekt.mockserver import MockArchidekt
+import pytest
+
+
+@pytest.fixture
+def deckServer():
+    """A local server answering `/api/decks/{id}/` with the bundled deck. Negative ids answer 404."""
+    with open("tests/unit/resources/deck.json", "rb") as f:
+        server = MockArchidekt(body=f.read())
+    with server:
+        yield server
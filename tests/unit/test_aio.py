@@ -0,0 +1,29 @@
+from __future__ import annotations
+from pyrchidekt.aio import AsyncArchidektClient
+from pyrchidekt.api import DeckFetchError, DeckNotFoundError
+import asyncio
+
+
+async def _collect(base_url: str, ids: list, concurrency: int) -> list:
+    async with AsyncArchidektClient(base_url=base_url) as client:
+        return [x async for x in client.get_decks(ids, concurrency=concurrency)]
+
+
+class TestAsyncArchidektClient:
+    def testGetDeck(self, deckServer):
+        async def run():
+            async with AsyncArchidektClient(base_url=deckServer.base_url) as client:
+                return await client.get_deck(1)
+
+        assert(asyncio.run(run()).id == 12345)
+
+    def testGetDecksReportsErrorsPerDeck(self, deckServer):
+        deckServer.deck_errors[3] = 500
+        results = asyncio.run(_collect(deckServer.base_url, [1, -2, 3, 4], 2))
+
+        assert(sorted(x.id for x in results) == [-2, 1, 3, 4])
+        by_id = {x.id: x for x in results}
+        assert(by_id[1].ok and by_id[4].ok)
+        assert(isinstance(by_id[-2].error, DeckNotFoundError))
+        assert(type(by_id[3].error) is DeckFetchError)
+        assert(by_id[3].error.status_code == 500)
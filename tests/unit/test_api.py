@@ -0,0 +1,62 @@
+from __future__ import annotations
+from pyrchidekt.api import (
+    ArchidektClient,
+    DeckNotFoundError,
+    getDeckById,
+    getDefaultClient,
+    setDefaultClient,
+)
+from concurrent.futures import ThreadPoolExecutor
+from pyrchidekt.deck import Deck
+import pyrchidekt.api
+import pytest
+
+
+class TestArchidektClient:
+    def testGetDeckById(self, deckServer):
+        with ArchidektClient(base_url=deckServer.base_url) as client:
+            deck = client.getDeckById(123456)
+        assert isinstance(deck, Deck)
+        assert list(deckServer.requests) == ["/api/decks/123456/"]
+
+    def testMissingDeckRaises(self, deckServer):
+        with ArchidektClient(base_url=deckServer.base_url) as client:
+            with pytest.raises(RuntimeError):
+                client.getDeckById(-1)
+
+    def testModuleFunctionUsesDefaultClient(self, deckServer):
+        previous = getDefaultClient()
+        setDefaultClient(ArchidektClient(base_url=deckServer.base_url))
+        try:
+            assert getDeckById(1).id == 12345
+        finally:
+            setDefaultClient(previous)
+
+    def testDefaultClientCreatedOnce(self, monkeypatch):
+        monkeypatch.setattr(pyrchidekt.api, "_default_client", None)
+        with ThreadPoolExecutor(16) as pool:
+            clients = list(pool.map(lambda _: getDefaultClient(), range(64)))
+
+        assert(all(x is clients[0] for x in clients))
+        clients[0].close()
+
+
+class TestGetDecksByIds:
+    def testOrderedKeepsInputOrder(self, deckServer):
+        deckServer.deck_errors[2] = 503
+        with ArchidektClient(base_url=deckServer.base_url) as client:
+            results = list(client.getDecksByIds([5, 2, -1, 7, 1], max_workers=2))
+
+        assert([x.id for x in results] == [5, 2, -1, 7, 1])
+        assert([x.ok for x in results] == [True, False, False, True, True])
+        assert(results[1].error.status_code == 503)
+        assert(isinstance(results[2].error, DeckNotFoundError))
+
+    def testAsCompletedYieldsEveryDeck(self, deckServer):
+        with ArchidektClient(base_url=deckServer.base_url) as client:
+            results = list(
+                client.getDecksByIds(range(20), max_workers=4, ordered=False)
+            )
+
+        assert(sorted(x.id for x in results) == list(range(20)))
+        assert(all(x.deck.id == 12345 for x in results))
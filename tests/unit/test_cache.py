@@ -0,0 +1,119 @@
+from __future__ import annotations
+from datetime import datetime, timezone
+from pyrchidekt.api import ArchidektClient
+from pyrchidekt.cache import DeckCache, DiskCache
+from pyrchidekt.deck import Deck
+import copy
+import json
+import os
+import pytest
+import time
+
+
+@pytest.fixture
+def data() -> dict:
+    with open("tests/unit/resources/deck.json", "r") as f:
+        return json.load(f)
+
+
+class TestDiskCache:
+    def testRoundTrip(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        assert(cache.get(1) is None)
+        cache.set(1, b'{"id": 1}')
+        assert(cache.get(1) == b'{"id": 1}')
+        assert((cache.stats.hits, cache.stats.misses) == (1, 1))
+        assert(not [x for x in os.listdir(tmp_path) if x.endswith(".tmp")])
+
+    def testExpiredEntriesMiss(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        cache.set(1, b"{}")
+        old = time.time() - 120
+        os.utime(tmp_path / "1.json", (old, old))
+
+        assert(cache.get(1) is None)
+        assert(cache.stats.expirations == 1)
+        assert(not (tmp_path / "1.json").exists())
+
+    def testEvictsLeastRecentlyUsed(self, tmp_path):
+        cache = DiskCache(tmp_path, max_size=250)
+        for id in range(3):
+            cache.set(id, b"x" * 100)
+            then = time.time() - 100 + id
+            os.utime(tmp_path / f"{id}.json", (then, then))
+            if id == 1:
+                cache.get(0)
+
+        assert(cache.get(0) is not None)
+        assert(cache.get(1) is None)
+        assert(cache.get(2) is not None)
+        assert(cache.stats.evictions == 1)
+
+    def testClientUsesCache(self, deckServer, tmp_path):
+        cache = DiskCache(tmp_path)
+        with ArchidektClient(base_url=deckServer.base_url, cache=cache) as client:
+            first = client.getDeckById(1)
+            second = client.getDeckById(1)
+
+        assert(first == second)
+        assert(len(deckServer.requests) == 1)
+        assert(cache.stats.hits == 1)
+
+
+class TestDeckCache:
+    def testCopyOnRead(self, data):
+        cache = DeckCache()
+        deck = Deck.fromJson(data)
+        cache.put(deck)
+
+        copy = cache.get(deck.id, deck.updated_at)
+        assert(copy == deck and copy is not deck)
+        copy.cards.clear()
+        copy.categories[0].cards.clear()
+        assert(cache.get(deck.id) == deck)
+
+    def testCopyOnReadLazy(self, data):
+        cache = DeckCache()
+        deck = Deck.fromJson(copy.deepcopy(data), lazy=True)
+        built = deck.cards[0]
+        cache.put(deck)
+        updated = copy.deepcopy(data)
+        for card in updated["cards"]:
+            card["quantity"] += 1
+            card["updatedAt"] = "2030-01-01T00:00:00.000000Z"
+
+        changed = cache.get(deck.id)
+        changed.applyUpdate(updated)
+        assert(changed.cards[0] is not built)
+        assert(changed.categories[0].cards[0] is changed.cards[0])
+        again = cache.get(deck.id)
+        assert(again.cards[0] is built)
+        assert(again.categories[0].cards[0] is built)
+        assert(again == Deck.fromJson(data))
+
+    def testStaleVersionMisses(self, data):
+        cache = DeckCache()
+        deck = Deck.fromJson(data)
+        cache.put(deck)
+
+        assert(cache.get(deck.id, datetime(2030, 1, 1, tzinfo=timezone.utc)) is None)
+        cache.invalidate(deck.id)
+        assert(cache.get(deck.id) is None)
+        assert((cache.stats.hits, cache.stats.misses) == (0, 2))
+
+    def testEvictsByCardCount(self, data):
+        cache = DeckCache(max_cards=3)
+        for id in range(3):
+            data["id"] = id
+            cache.put(Deck.fromJson(data))
+
+        assert(0 not in cache and 1 not in cache and 2 in cache)
+        assert(cache.stats.evictions == 2)
+
+    def testClientReusesUnchangedDeck(self, deckServer):
+        deck_cache = DeckCache()
+        with ArchidektClient(base_url=deckServer.base_url, deck_cache=deck_cache) as client:
+            client.getDeckById(1)
+            client.getDeckById(1)
+
+        assert(deck_cache.stats.hits == 1)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+import json
+import pytest
+
+np = pytest.importorskip("numpy")
+from pyrchidekt.columns import DeckFrame
+
+
+@pytest.fixture
+def data() -> dict:
+    with open("tests/unit/resources/deck.json", "r") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def deck(data: dict) -> Deck:
+    return Deck.fromJson(data)
+
+
+class TestDeckFrame:
+    def testColumns(self, deck: Deck):
+        frame = deck.columns()
+
+        assert(len(frame) == 2)
+        assert(frame.quantity.tolist() == [1, 1])
+        assert(frame.cmc.tolist() == [1.0, 4.0])
+        assert(np.isnan(frame.custom_cmc).all())
+        assert(frame.color_identity.tolist() == [0b10, 0b11])
+        assert(frame.hasType("Creature").tolist() == [False, True])
+        assert(frame.inCategory("Commander").tolist() == [False, True])
+        assert(frame.inCategory("Ramp").tolist() == [False, False])
+
+    def testAggregations(self, deck: Deck):
+        frame = deck.columns()
+
+        assert(frame.count() == 2)
+        assert(frame.manaCurve(max_cmc=3).tolist() == [0, 1, 0, 1])
+        assert(frame.averageCmc() == 2.5)
+        assert(frame.colorCounts()["Blue"] == 2)
+        assert(frame.typeCounts()["Sorcery"] == 1)
+        assert(frame.priceTotals()["ck"] == pytest.approx(6.48))
+
+    def testExcludedCategoriesAreNotCounted(self, deck: Deck):
+        commander = next(x for x in deck.categories if x.name == "Commander")
+        commander.included_in_deck = False
+        frame = deck.columns()
+
+        assert(frame.count() == 1)
+        assert(frame.priceTotals()["ck"] == pytest.approx(6.48))
+        assert(deck.isIncluded(deck.cards[1]) is False)
+        assert(deck.isIncluded(deck.cards[1], price=True) is True)
+
+    def testStackedDecks(self, deck: Deck, data: dict):
+        other = Deck.fromJson(data)
+        other.id = 7
+        other.cards[1].custom_cmc = 2
+        stacked = DeckFrame.fromDecks([deck, other])
+
+        assert(stacked.deck_ids.tolist() == [deck.id, 7])
+        assert(stacked.count(per_deck=True).tolist() == [2, 2])
+        assert(stacked.averageCmc(per_deck=True).tolist() == [2.5, 1.5])
+        assert(stacked.manaCurve(max_cmc=4, per_deck=True).tolist() == [[0, 1, 0, 0, 1], [0, 1, 1, 0, 0]])
+
+        concatenated = DeckFrame.concat([deck.columns(), other.columns()])
+        assert(concatenated.deck.tolist() == stacked.deck.tolist())
+        assert(concatenated.priceTotals(per_deck=True)["tcg"].tolist() == stacked.priceTotals(per_deck=True)["tcg"].tolist())
+        assert(concatenated.category_names == stacked.category_names)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from pyrchidekt.corpus import CorpusError, DeckCorpus
+from pyrchidekt.deck import Deck
+from pyrchidekt.formats import Format
+from pyrchidekt.synthetic import generateCorpus
+import copy
+import json
+import pytest
+
+
+@pytest.fixture
+def data() -> dict:
+    with open("tests/unit/resources/deck.json", "r") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def corpus(tmp_path) -> DeckCorpus:
+    with DeckCorpus(tmp_path / "decks.corpus", create=True) as corpus:
+        corpus.extend(Deck.fromJson(x) for x in generateCorpus(30, 20))
+        yield corpus
+
+
+def _names(path: str, ids: list) -> list:
+    with DeckCorpus(path) as corpus:
+        return [corpus[x].name for x in ids]
+
+
+class TestCorpus:
+    def testRandomAccess(self, corpus: DeckCorpus, data: dict):
+        deck = corpus.appendJson(data)
+
+        assert len(corpus) == 31
+        assert deck.id in corpus
+        assert corpus[deck.id] == deck
+        assert corpus.get(-1) is None
+        with pytest.raises(KeyError):
+            corpus[-1]
+
+    def testIterByFormat(self, corpus: DeckCorpus):
+        decks = list(corpus.iter())
+        commander = list(corpus.iter(format=Format.COMMANDER))
+
+        assert [x.id for x in decks] == list(corpus)
+        assert commander == [x for x in decks if x.format is Format.COMMANDER]
+
+    def testSupersedeAndCompact(self, corpus: DeckCorpus, data: dict):
+        corpus.appendJson(data)
+        updated = copy.deepcopy(data)
+        updated["name"] = "Updated"
+        corpus.appendJson(updated)
+        ids = list(corpus)
+
+        assert corpus.superseded == 1
+        assert corpus[data["id"]].name == "Updated"
+        assert corpus.compact() > 0
+        assert corpus.superseded == 0
+        assert list(corpus) == ids
+        assert corpus[data["id"]].name == "Updated"
+
+    def testReadersSeeAppendsAndCompaction(self, corpus: DeckCorpus, data: dict):
+        reader = DeckCorpus(corpus.path)
+        decks = reader.iter()
+        first = next(decks)
+        corpus.appendJson(data)
+        corpus.compact()
+
+        assert data["id"] not in reader
+        reader.refresh()
+        assert reader[data["id"]] == corpus[data["id"]]
+        assert [first] + list(decks) == list(corpus.iter())[:30]
+        reader.close()
+
+    def testConcurrentProcesses(self, corpus: DeckCorpus):
+        ids = list(corpus)
+        with ProcessPoolExecutor(2) as pool:
+            names = list(
+                pool.map(_names, [str(corpus.path)] * 2, [ids[::2], ids[1::2]])
+            )
+
+        assert names == [
+            [corpus[x].name for x in ids[::2]],
+            [corpus[x].name for x in ids[1::2]],
+        ]
+
+    def testInvalidCorpus(self, tmp_path):
+        path = tmp_path / "decks.corpus"
+        with pytest.raises(FileNotFoundError):
+            DeckCorpus(path)
+        path.write_bytes(b"not a corpus")
+        (tmp_path / "decks.corpus.idx").write_bytes(b"not an index either")
+        with pytest.raises(CorpusError):
+            DeckCorpus(path)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+from pyrchidekt import decode
+from pyrchidekt.deck import Deck
+from pyrchidekt.decode import decodeDeck, decodeDeckVersion
+from pyrchidekt.registry import CardRegistry
+import json
+import pytest
+
+
+@pytest.fixture
+def raw() -> bytes:
+    with open("tests/unit/resources/deck.json", "rb") as f:
+        return f.read()
+
+
+class TestDecodeDeck:
+    @pytest.mark.parametrize("fast", [True, False])
+    def testMatchesFromJson(self, raw, fast, monkeypatch):
+        if fast and not decode.FAST_DECODE:
+            pytest.skip("msgspec is not installed")
+        monkeypatch.setattr(decode, "FAST_DECODE", fast)
+        expected = Deck.fromJson(json.loads(raw))
+
+        assert(decodeDeck(raw) == expected)
+        assert(decodeDeck(raw, CardRegistry()) == expected)
+        assert(decodeDeckVersion(raw) == (expected.id, expected.updated_at))
+
+    def testLabelsAreSplit(self, raw):
+        deck = decodeDeck(raw)
+        assert([(x.label, x.label_color) for x in deck.cards] == [("", "#656565"), ("Have", "#37d67a")])
@@ -0,0 +1,126 @@
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.diff import CardChange, DeckDiff
+from pyrchidekt.projection import SkippedFieldError
+from pyrchidekt.registry import CardRegistry
+from pyrchidekt.synthetic import generateDeck
+import copy
+import pytest
+
+
+@pytest.fixture
+def data() -> dict:
+    return generateDeck(1, 30)
+
+
+def _update(data: dict) -> dict:
+    """Edits a copy of the deck: the commander gets another quantity and its category is renamed, a card is
+    removed and another added"""
+    updated = copy.deepcopy(data)
+    updated["name"] = "Updated"
+    updated["cards"][0]["quantity"] += 1
+    updated["cards"][0]["updatedAt"] = "2024-01-01T00:00:00.000000Z"
+    del updated["cards"][1]
+    added = copy.deepcopy(data["cards"][2])
+    added["id"] = 1
+    added["categories"] = ["Sideboard"]
+    updated["cards"].append(added)
+    updated["categories"][0]["name"] = "Renamed"
+    for card in updated["cards"]:
+        card["categories"] = [
+            "Renamed" if x == data["categories"][0]["name"] else x
+            for x in card["categories"]
+        ]
+    return updated
+
+
+class TestDiff:
+    def testNoChanges(self, data: dict):
+        diff = Deck.fromJson(data).diff(Deck.fromJson(data))
+
+        assert not diff
+        assert diff == DeckDiff()
+
+    def testDiff(self, data: dict):
+        deck = Deck.fromJson(data)
+        updated = Deck.fromJson(_update(data))
+        diff = deck.diff(updated)
+
+        assert diff
+        assert [x.id for x in diff.added] == [1]
+        assert diff.removed == [deck.cards[1]]
+        assert diff.changed[0] == CardChange(
+            deck.cards[0], updated.cards[0], ("quantity", "categories")
+        )
+
+    def testApplyUpdate(self, data: dict):
+        deck = Deck.fromJson(data)
+        kept = deck.cards[2]
+        category = deck.categories[0]
+        updated = _update(data)
+        expected = deck.diff(Deck.fromJson(updated))
+        diff = deck.applyUpdate(updated)
+
+        assert deck == Deck.fromJson(updated)
+        assert diff == expected
+        assert deck.cards[1] is kept
+        assert deck.categories[0] is category
+        assert category.name == "Renamed"
+        assert deck.byCategory("Sideboard") == [deck.cards[-1]]
+        assert deck.name == "Updated"
+        assert not deck.applyUpdate(updated)
+
+    def testApplyUpdateLazy(self, data: dict):
+        deck = Deck.fromJson(data, lazy=True)
+        updated = _update(data)
+        diff = deck.applyUpdate(updated)
+
+        assert deck.cards.built == 2
+        assert deck.cards[0] is diff.changed[0].after
+        assert deck == Deck.fromJson(updated)
+        assert diff == Deck.fromJson(data).diff(Deck.fromJson(updated))
+
+    def testApplyUpdateLazyRepeatedly(self, data: dict):
+        deck = Deck.fromJson(copy.deepcopy(data), lazy=True)
+        for version in range(1, 8):
+            # Every card changes, and the previous JSON is freed each round
+            updated = copy.deepcopy(data)
+            for card in updated["cards"]:
+                card["quantity"] = version
+                card["updatedAt"] = f"2030-01-0{version}T00:00:00.000000Z"
+            deck.applyUpdate(updated)
+            del updated
+
+            assert [x.quantity for x in deck.cards] == [version] * len(deck.cards)
+            assert all(x.quantity == version for y in deck.categories for x in y.cards)
+            assert all(deck.find(uid=x.card.uid)[0] is x for x in deck.cards)
+            assert len(deck.cards._built) == len(deck.cards)
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    @pytest.mark.parametrize(
+        "include", ["gameplay", {"ArchidektCard.updated_at", "Deck.updated_at"}]
+    )
+    def testApplyUpdateProjected(self, data: dict, lazy: bool, include):
+        registry = CardRegistry()
+        deck = Deck.fromJson(data, registry, lazy=lazy, include=include)
+        updated = _update(data)
+        expected = Deck.fromJson(updated, registry, lazy=lazy, include=include)
+        diff = deck.applyUpdate(updated)
+
+        assert deck == expected
+        assert diff == Deck.fromJson(data, include=include).diff(
+            Deck.fromJson(updated, include=include)
+        )
+        assert [x.fields for x in diff.changed] == [("quantity", "categories")]
+        assert deck.name == "Updated"
+        assert deck.cards[-1].card.oracle_card is expected.cards[-1].card.oracle_card
+        with pytest.raises(SkippedFieldError):
+            deck.cards[-1].label
+        with pytest.raises(SkippedFieldError):
+            deck.description
+
+    def testApplyUpdateOtherDeck(self, data: dict):
+        other = copy.deepcopy(data)
+        other["id"] += 1
+        with pytest.raises(ValueError):
+            Deck.fromJson(data).applyUpdate(other)
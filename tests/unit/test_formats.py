@@ -0,0 +1,33 @@
+from __future__ import annotations
+from pyrchidekt.formats import Format, Legalities
+import pytest
+import warnings
+
+
+class TestFormat:
+    def testLookupByString(self):
+        assert(Format("commander") is Format.COMMANDER)
+        assert(Format("1v1") is Format.ONE_V_ONE_COMMANDER)
+        assert(Format(3) is Format.COMMANDER)
+
+
+class TestLegalities:
+    def testReadsLikeDict(self):
+        data = {"legacy": "legal", "vintage": "restricted", "modern": "banned", "pauper": "not_legal"}
+        legalities = Legalities.fromJson(data)
+
+        assert(legalities == {Format(x): y for x, y in data.items()})
+        assert(legalities[Format.VINTAGE] == "restricted")
+        assert(legalities.isLegal(Format.VINTAGE) and not legalities.isLegal(Format.MODERN))
+        assert(Format.STANDARD not in legalities)
+        with pytest.raises(KeyError):
+            legalities[Format.STANDARD]
+
+    def testUnknownFormatWarnsOnce(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            for _ in range(3):
+                legalities = Legalities.fromJson({"notaformat": "legal", "legacy": "legal"})
+
+        assert(len(caught) == 1)
+        assert(len(legalities) == 1)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+import pyrchidekt
+import pytest
+import subprocess
+import sys
+
+
+class TestLazyImports:
+    def testExportsResolve(self):
+        from pyrchidekt.deck import Deck
+
+        assert(pyrchidekt.Deck is Deck)
+        for name in pyrchidekt.__all__:
+            assert(getattr(pyrchidekt, name) is not None)
+        assert("getDeckById" in dir(pyrchidekt))
+        with pytest.raises(AttributeError):
+            pyrchidekt.notAnExport
+
+    def testParsingDoesNotImportRequests(self):
+        code = (
+            "import json, sys\n"
+            "from pyrchidekt import Deck, Format\n"
+            "with open('tests/unit/resources/deck.json') as f:\n"
+            "    Deck.fromJson(json.load(f))\n"
+            "print(sorted(x for x in ('requests', 'urllib3', 'aenum') if x in sys.modules))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert(output.strip() == "[]")
+
+    def testClientDoesNotImportDecoder(self):
+        code = (
+            "import sys\n"
+            "import pyrchidekt.api, pyrchidekt.aio\n"
+            "print(sorted(x for x in ('msgspec', 'pyrchidekt.decode') if x in sys.modules))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert(output.strip() == "[]")
@@ -0,0 +1,73 @@
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.formats import Format
+from pyrchidekt.legality import checkLegality
+import json
+import pytest
+
+
+@pytest.fixture
+def data() -> dict:
+    with open("tests/unit/resources/deck.json", "r") as f:
+        return json.load(f)
+
+
+def names(cards: list) -> list:
+    return [x.card.oracle_card.name for x in cards]
+
+
+class TestLegality:
+    def testDeckIsLegalInItsFormat(self, data: dict):
+        report = Deck.fromJson(data).legality()
+
+        assert(report.format == Format.COMMANDER)
+        assert(report.legal)
+        assert(names(report.commanders) == ["Hylda of the Icy Crown"])
+
+    def testIllegalCardsAreListed(self, data: dict):
+        report = Deck.fromJson(data).legality(Format.PAUPER)
+
+        assert(not report.legal)
+        assert(names(report.illegal) == ["Hylda of the Icy Crown"])
+
+    def testSingletonAndColorIdentity(self, data: dict):
+        data["cards"][0]["quantity"] = 2
+        data["cards"][0]["card"]["oracleCard"]["colorIdentity"] = ["Black"]
+        report = Deck.fromJson(data).legality()
+
+        assert(names(report.duplicates) == ["Broken Dam"])
+        assert(names(report.off_identity) == ["Broken Dam"])
+        assert(not report.legal)
+
+    def testRestrictedCards(self, data: dict):
+        data["cards"][0]["quantity"] = 2
+        data["cards"][0]["card"]["oracleCard"]["legalities"]["vintage"] = "restricted"
+        report = Deck.fromJson(data).legality(Format.VINTAGE)
+
+        assert(report.illegal == [])
+        assert(names(report.restricted) == ["Broken Dam"])
+
+    def testExcludedCardsAreNotChecked(self, data: dict):
+        data["categories"][0]["includedInDeck"] = False
+        report = Deck.fromJson(data).legality(Format.PAUPER)
+
+        assert(names(report.illegal) == ["Hylda of the Icy Crown"])
+        data["categories"][1]["includedInDeck"] = False
+        assert(Deck.fromJson(data).legality(Format.PAUPER).illegal == [])
+
+    def testBatch(self, data: dict):
+        decks = [Deck.fromJson(data), Deck.fromJson(data)]
+        decks[1].format = None
+
+        own = checkLegality(decks)
+        assert([list(x) for x in own] == [[Format.COMMANDER], []])
+
+        reports = checkLegality(decks, [Format.LEGACY, Format.PAUPER])
+        assert([[x.legal for x in y.values()] for y in reports] == [[True, False]] * 2)
+
+    def testDeckWithoutFormatNeedsOne(self, data: dict):
+        deck = Deck.fromJson(data)
+        deck.format = None
+
+        with pytest.raises(ValueError):
+            deck.legality()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+from pyrchidekt.analytics import colorSources, devotion, pipCounts, sourceRatios
+from pyrchidekt.deck import Deck
+from pyrchidekt.mana import parseManaCost, parseManaCosts
+import json
+import pytest
+
+
+@pytest.fixture
+def data() -> dict:
+    with open("tests/unit/resources/deck.json", "r") as f:
+        return json.load(f)
+
+
+class TestParseManaCost:
+    def testPlainCost(self):
+        cost = parseManaCost("{2}{W}{U}")
+
+        assert(cost.symbols == ("2", "W", "U"))
+        assert(cost.mana_value == 4 and cost.generic == 2)
+        assert(cost.pips == {"White": 1, "Blue": 1, "Black": 0, "Red": 0, "Green": 0})
+
+    def testSpecialSymbols(self):
+        cost = parseManaCost("{X}{G/P}{2/U}{W/B}{S}{C}")
+
+        assert(cost.x == 1 and cost.snow == 1 and cost.colorless == 1)
+        assert(cost.phyrexian == 1 and cost.hybrid == 2)
+        assert(cost.mana_value == 6)
+        assert((cost.white, cost.blue, cost.black, cost.green) == (1, 1, 1, 1))
+
+    def testHalfMana(self):
+        assert(parseManaCost("{½}").mana_value == 0.5)
+        assert(parseManaCost("{½}").generic == 0)
+        assert(parseManaCost("{1}{½}{HR}").mana_value == 2)
+        assert(parseManaCost("{HR}").red == 1)
+
+    def testCostsAreCached(self):
+        assert(parseManaCost("{1}{R}") is parseManaCost("{1}{R}"))
+        assert(parseManaCost(None) == parseManaCost(""))
+
+    def testFaces(self):
+        front, back = parseManaCosts("{1}{U} // {2}{B}")
+        assert((front.blue, back.black) == (1, 1))
+
+        faces = [{"manaCost": "{G}"}, {"manaCost": ""}]
+        assert([x.mana_value for x in parseManaCosts("{G} // ", faces)] == [1, 0])
+
+
+class TestManaAnalytics:
+    def testPipsAndDevotion(self, data: dict):
+        deck = Deck.fromJson(data)
+
+        assert(pipCounts(deck)["Blue"] == 2)
+        assert(devotion(deck)["Blue"] == 1)
+
+    def testSourceRatios(self, data: dict):
+        data["cards"][0]["card"]["oracleCard"]["manaProduction"]["U"] = 1
+        deck = Deck.fromJson(data)
+
+        assert(colorSources(deck)["Blue"] == 1)
+        assert(sourceRatios(deck) == {"White": 0.0, "Blue": 0.5, "Black": None, "Red": None, "Green": None})
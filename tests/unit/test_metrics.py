@@ -0,0 +1,62 @@
+from __future__ import annotations
+from pyrchidekt.api import ArchidektClient, DeckNotFoundError
+from pyrchidekt.cache import DiskCache
+from pyrchidekt.deck import Deck
+from pyrchidekt.metrics import MetricsRecorder, getMetrics, setMetrics
+import json
+import pytest
+
+
+@pytest.fixture
+def recorder():
+    recorder = MetricsRecorder()
+    setMetrics(recorder)
+    yield recorder
+    setMetrics(None)
+
+
+class TestMetricsRecorder:
+    def testPercentilesAndSummary(self):
+        recorder = MetricsRecorder()
+        for x in range(1, 101):
+            recorder.timing("hydrate", x / 1000)
+        recorder.count("bytes", 10)
+        recorder.count("bytes", 5)
+
+        assert(recorder.percentile("hydrate", 50) == 0.05)
+        assert(recorder.percentile("hydrate", 99) == 0.099)
+        assert(recorder.percentile("missing", 50) is None)
+        assert(recorder.counters == {"bytes": 15})
+        summary = recorder.summary()["hydrate"]
+        assert(summary["count"] == 100 and summary["max"] == 0.1 and summary["p90"] == 0.09)
+
+        recorder.reset()
+        assert(recorder.timings == {} and recorder.counters == {})
+
+    def testDisabledByDefault(self):
+        assert(getMetrics() is None)
+
+
+class TestInstrumentation:
+    def testFromJsonReportsHydrate(self, recorder):
+        with open("tests/unit/resources/deck.json", "r") as f:
+            data = json.load(f)
+        Deck.fromJson(data)
+
+        assert(len(recorder.timings["hydrate"]) == 1)
+        assert(recorder.counters["cards"] == len(data["cards"]))
+
+    def testClientReportsEveryPhase(self, deckServer, recorder, tmp_path):
+        with ArchidektClient(base_url=deckServer.base_url, cache=DiskCache(tmp_path)) as client:
+            client.getDeckById(1)
+            client.getDeckById(1)
+            with pytest.raises(DeckNotFoundError):
+                client.getDeckById(-1)
+
+        assert(set(recorder.timings) == {"connect", "transfer", "decode", "hydrate"})
+        assert(len(recorder.timings["connect"]) == 2)
+        assert(len(recorder.timings["hydrate"]) == 2)
+        assert(recorder.counters["bytes"] == len(deckServer.body))
+        assert(recorder.counters["cache_hits"] == 1)
+        assert(recorder.counters["cache_misses"] == 2)
+        assert(recorder.counters["errors"] == 1)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+from pyrchidekt.api import ArchidektClient, DeckFetchError
+from pyrchidekt.deck import Deck
+from pyrchidekt.mockserver import Latency, MockArchidekt
+from time import perf_counter
+import asyncio
+import json
+import pytest
+import random
+import requests
+
+
+async def _get(port: int, id: int) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET /api/decks/{id}/ HTTP/1.1\r\nConnection: close\r\n\r\n".encode())
+    response = await reader.read()
+    writer.close()
+    return response
+
+
+class TestMockArchidekt:
+    def testServesGeneratedDecks(self):
+        with MockArchidekt(cards=60) as server:
+            with ArchidektClient(base_url=server.base_url) as client:
+                deck = client.getDeckById(7)
+                assert(client.getDeckById(7) == deck)
+                with pytest.raises(DeckFetchError):
+                    client.getDeckById(-7)
+
+        assert(deck.id == 7 and len(deck.cards) == 60)
+        assert(list(server.requests) == ["/api/decks/7/"] * 2 + ["/api/decks/-7/"])
+        assert(server.statuses == {200: 2, 404: 1})
+
+    def testServesRecordedDecks(self, tmp_path):
+        with open("tests/unit/resources/deck.json", "rb") as f:
+            body = f.read()
+        (tmp_path / "12345.json").write_bytes(body)
+        with MockArchidekt(decks=tmp_path) as server:
+            with ArchidektClient(base_url=server.base_url) as client:
+                assert(client.getDeckById(12345) == Deck.fromJson(json.loads(body)))
+                with pytest.raises(DeckFetchError):
+                    client.getDeckById(1)
+        with MockArchidekt(decks={3: json.loads(body)}) as server:
+            assert(requests.get(server.base_url + "decks/3/").json()["id"] == 12345)
+
+    def testErrorsAndRetryAfter(self):
+        with MockArchidekt(body=b"{}", error_rates={429: 0.5, 503: 0.5}, retry_after=7) as server:
+            server.deck_errors[2] = 500
+            responses = [requests.get(server.base_url + "decks/1/") for _ in range(20)]
+            assert(requests.get(server.base_url + "decks/2/").status_code == 500)
+
+        assert({x.status_code for x in responses} == {429, 503})
+        assert(all(x.headers["Retry-After"] == "7" for x in responses))
+
+    def testLatencyAndBandwidth(self):
+        rng = random.Random(0)
+        assert(Latency.parse("0.25").sample(rng) == 0.25)
+        assert(Latency.parse("normal:0:1") == Latency("normal", 0.0, 1.0))
+        assert(all(x >= 0 for x in (Latency("normal", 0, 1).sample(rng) for _ in range(100))))
+        with pytest.raises(ValueError):
+            Latency("bimodal").sample(rng)
+
+        with MockArchidekt(body=b"x" * 20000, latency=0.05, bandwidth=100000) as server:
+            start = perf_counter()
+            requests.get(server.base_url + "decks/1/")
+            assert(perf_counter() - start >= 0.2)
+
+    def testPortInUse(self):
+        with MockArchidekt(body=b"{}") as server:
+            with pytest.raises(OSError):
+                MockArchidekt(port=server.port).start()
+
+    def testRequestsBounded(self):
+        with MockArchidekt(body=b"{}", max_requests=2) as server:
+            for id in range(5):
+                requests.get(server.base_url + f"decks/{id}/")
+
+        assert(list(server.requests) == ["/api/decks/3/", "/api/decks/4/"])
+        assert(server.statuses == {200: 5})
+
+    def testManyConcurrentConnections(self):
+        async def run(port: int) -> list:
+            return await asyncio.gather(*(_get(port, x) for x in range(500)))
+
+        with MockArchidekt(body=b"{}", latency=0.1) as server:
+            start = perf_counter()
+            responses = asyncio.run(run(server.port))
+            elapsed = perf_counter() - start
+
+        assert(all(x.startswith(b"HTTP/1.1 200 OK") for x in responses))
+        assert(elapsed < 2)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+import json
+import pytest
+
+pytest.importorskip("numpy")
+from pyrchidekt.prices import priceDecks
+
+
+@pytest.fixture
+def data() -> dict:
+    with open("tests/unit/resources/deck.json", "r") as f:
+        return json.load(f)
+
+
+class TestDeckPrice:
+    def testTotalsByVendor(self, data: dict):
+        price = Deck.fromJson(data).price()
+
+        assert(price.totals == {"ck": 6.48, "cm": 2.5, "mtgo": 0.0, "tcg": 6.97})
+        assert(price.missing == {"ck": 0, "cm": 1, "mtgo": 2, "tcg": 0})
+        assert(price.cheapest == 6.48)
+        assert(price.cheapest_vendor == "ck")
+
+    def testCheapestMixesVendors(self, data: dict):
+        data["cards"][0]["card"]["prices"]["tcg"] = 1.0
+        price = Deck.fromJson(data).price()
+
+        assert(price.cheapest == 1.99)
+        assert(price.cheapest_vendor == "tcg")
+
+    def testFoilsAndExcludedCardsAndCategories(self, data: dict):
+        data["cards"][1]["modifier"] = "Foil"
+        data["cards"][1]["categories"] = ["Commander", "Sorcery"]
+        deck = Deck.fromJson(data)
+        assert(deck.price().totals["tcg"] == 10.38)
+
+        next(x for x in deck.categories if x.name == "Commander").included_in_price = False
+        assert(deck.price().totals["tcg"] == 10.38)
+        deck.invalidate()
+        assert(deck.price().totals["tcg"] == 5.93)
+
+    def testMemoizedUntilCardsChange(self, data: dict):
+        deck = Deck.fromJson(data)
+        price = deck.price()
+        assert(deck.price() is price)
+
+        card = deck.cards[0]
+        deck.removeCard(card)
+        assert(deck.price().totals["ck"] == 0.99)
+        deck.cards.append(card)
+        assert(deck.price().totals["ck"] == 6.48)
+
+    def testBatchMatchesSingleDecks(self, data: dict):
+        decks = [Deck.fromJson(data) for _ in range(3)]
+        decks[1].cards.pop()
+        memoized = decks[1].price()
+
+        prices = priceDecks(decks)
+        assert(prices[0] == prices[2] == Deck.fromJson(data).price())
+        assert(prices[1] is memoized)
+        assert(prices[1].totals["ck"] == 5.49)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+from io import BytesIO
+from pyrchidekt.cache import DeckCache, copyDeck
+from pyrchidekt.corpus import DeckCorpus
+from pyrchidekt.deck import Deck
+from pyrchidekt.projection import Projection, SkippedFieldError
+from pyrchidekt.registry import CardRegistry
+from pyrchidekt.store import DeckStore
+import json
+import pytest
+
+
+@pytest.fixture
+def data() -> dict:
+    with open("tests/unit/resources/deck.json", "r") as f:
+        return json.load(f)
+
+
+class TestProjection:
+    def testProfileLoadsItsFields(self, data: dict):
+        deck = Deck.fromJson(data, include="gameplay")
+        full = Deck.fromJson(data)
+
+        assert(deck.name == full.name)
+        assert(len(deck.cards) == len(full.cards))
+        for card, expected in zip(deck.cards, full.cards):
+            assert(card.quantity == expected.quantity)
+            assert(card.card.oracle_card.legalities == expected.card.oracle_card.legalities)
+            assert(card.card.oracle_card.mana_cost == expected.card.oracle_card.mana_cost)
+        assert([len(x.cards) for x in deck.categories] == [len(x.cards) for x in full.categories])
+
+    def testSkippedFieldRaises(self, data: dict):
+        deck = Deck.fromJson(data, include="gameplay")
+
+        with pytest.raises(SkippedFieldError, match="Card.prices"):
+            deck.cards[0].card.prices
+        with pytest.raises(AttributeError):
+            deck.owner
+        assert(not hasattr(deck.cards[0], "created_at"))
+        assert(hasattr(deck.cards[0], "companion"))
+
+    def testFieldsAndEquality(self, data: dict):
+        include = {"Card.rarity", "ArchidektCard.modifier"}
+        deck = Deck.fromJson(data, include=include)
+
+        assert(deck.cards[0].card.rarity == "common")
+        assert(deck == Deck.fromJson(data, include=include))
+        assert(deck != Deck.fromJson(data, include="pricing"))
+        assert("<skipped>" in repr(deck.cards[0]))
+
+    def testInvalidFieldsAndProfiles(self, data: dict):
+        with pytest.raises(ValueError):
+            Deck.fromJson(data, include={"Card.bogus"})
+        with pytest.raises(ValueError):
+            Deck.fromJson(data, include="bogus")
+        assert(Projection.get("pricing") is Projection.get("pricing"))
+
+    def testLazyAndRegistry(self, data: dict):
+        registry = CardRegistry()
+        full = Deck.fromJson(data, registry=registry)
+        deck = Deck.fromJson(data, registry=registry, lazy=True, include="pricing")
+
+        assert(deck.cards[0].card.prices == full.cards[0].card.prices)
+        assert(deck.cards[0].card.oracle_card is not full.cards[0].card.oracle_card)
+        assert(full.cards[0].card.oracle_card.text is not None)
+
+    def testPricingProfile(self, data: dict):
+        pytest.importorskip("numpy")
+        deck = Deck.fromJson(data, include="pricing")
+
+        assert(deck.price() == Deck.fromJson(data).price())
+        assert(list(deck.columns().manaCurve()) == list(Deck.fromJson(data).columns().manaCurve()))
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    @pytest.mark.parametrize("include", ["gameplay", "pricing", {"Card.rarity"}])
+    def testIndexes(self, data: dict, include, lazy: bool):
+        deck = Deck.fromJson(data, lazy=lazy, include=include)
+        full = Deck.fromJson(data)
+        card = full.cards[0]
+
+        assert(deck.find(uid=card.card.uid) == deck.find(name=card.card.oracle_card.name))
+        assert([x.id for x in deck.find(uid=card.card.uid)] == [x.id for x in full.find(uid=card.card.uid)])
+        for kind in ("Creature", "Human", "Legendary", "Sorcery"):
+            assert([x.id for x in deck.byType(kind)] == [x.id for x in full.byType(kind)])
+
+    def testCopy(self, data: dict):
+        deck = Deck.fromJson(data, include="gameplay")
+        copied = copyDeck(deck)
+        copied.cards.pop()
+        copied.categories[0].name = "Renamed"
+
+        assert(copied != deck)
+        assert(len(deck.cards) == len(Deck.fromJson(data).cards))
+        assert(deck.categories[0].name != "Renamed")
+        assert(copyDeck(deck) == deck)
+        with pytest.raises(SkippedFieldError):
+            copied.editors
+
+    def testWritingRejected(self, data: dict, tmp_path):
+        deck = Deck.fromJson(data, include="pricing")
+
+        with pytest.raises(ValueError, match="pricing"):
+            deck.dump(BytesIO())
+        with pytest.raises(ValueError):
+            DeckCache().put(deck)
+        with DeckStore(tmp_path / "decks.db") as store, pytest.raises(ValueError):
+            store.add(deck)
+        with DeckCorpus(tmp_path / "decks.corpus", create=True) as corpus, pytest.raises(ValueError):
+            corpus.append(deck)
+
+    def testGameplayProfile(self, data: dict):
+        report = Deck.fromJson(data, include="gameplay").legality()
+        expected = Deck.fromJson(data).legality()
+
+        assert(report.legal == expected.legal)
+        for name in ("illegal", "restricted", "duplicates", "off_identity", "commanders"):
+            assert([x.id for x in getattr(report, name)] == [x.id for x in getattr(expected, name)])
+        with pytest.raises(SkippedFieldError):
+            Deck.fromJson(data, include="pricing").legality()
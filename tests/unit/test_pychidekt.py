@@ -1,5 +1,8 @@
 from __future__ import annotations
+from pyrchidekt.cards import OracleCard
 from pyrchidekt.deck import Deck
+from pyrchidekt.mana import ManaProduction
+from dataclasses import replace
 import json
 import pytest
 
@@ -11,4 +14,88 @@ def data() -> dict:
 
 class TestArchidekt:
     def testDeckGetsMade(self, data: dict):
-        assert(Deck.fromJson(data))
\ No newline at end of file
+        assert(Deck.fromJson(data))
+
+class TestLazyDeck:
+    def testLazyDeckEqualsEagerDeck(self, data: dict):
+        lazy = Deck.fromJson(data, lazy=True)
+        assert(lazy.cards.built == 0)
+        assert(lazy == Deck.fromJson(data))
+        assert(lazy.cards.built == len(data["cards"]))
+
+    def testCategoriesShareCards(self, data: dict):
+        deck = Deck.fromJson(data, lazy=True)
+        category = next(x for x in deck.categories if x.name == "Commander")
+
+        assert(deck.cards.built == 0)
+        card = category.cards[0]
+        assert(card.categories == ["Commander"])
+        assert(any(x is card for x in deck.cards))
+
+
+class TestModels:
+    def testModelsHaveNoInstanceDict(self, data: dict):
+        deck = Deck.fromJson(data)
+        card = deck.cards[0]
+        for x in (deck, deck.owner, deck.categories[0], card, card.card, card.card.edition, card.card.oracle_card):
+            assert(not hasattr(x, "__dict__"))
+
+    def testOracleCardDefaultsAreFreshContainers(self):
+        first, second = OracleCard(), OracleCard()
+        first.types.append("Creature")
+
+        assert(second.types == [])
+        assert(isinstance(first.mana_production, ManaProduction))
+
+
+class TestDeckIndex:
+    @pytest.mark.parametrize("lazy", [False, True])
+    def testFindsCards(self, data: dict, lazy: bool):
+        deck = Deck.fromJson(data, lazy=lazy)
+
+        assert([x.card.oracle_card.name for x in deck.find(name="hylda of the icy crown")] == ["Hylda of the Icy Crown"])
+        assert(deck.find(oracle_id=2064) == deck.find(uid="a0f7b8b1-f1dc-46a3-8f4a-c6181e8a049f"))
+        assert(deck.find(name="Broken Dam", oracle_id=35949) == [])
+        assert([x.card.oracle_card.name for x in deck.byType("legendary")] == ["Hylda of the Icy Crown"])
+        assert(deck.byType("Warlock") == deck.byCategory("Commander"))
+        if lazy:
+            assert(deck.cards.built == 2)
+
+    def testIndexFollowsCards(self, data: dict):
+        deck = Deck.fromJson(data)
+        hylda = deck.find(name="Hylda of the Icy Crown")[0]
+
+        deck.removeCard(hylda)
+        assert(deck.byType("Creature") == [])
+        assert(deck.byCategory("Commander") == [])
+        assert(next(x for x in deck.categories if x.name == "Commander").cards == [])
+
+        deck.addCard(hylda)
+        assert(deck.byType("Creature") == [hylda])
+        assert(next(x for x in deck.categories if x.name == "Commander").cards == [hylda])
+
+        deck.cards.pop()
+        assert(deck.byType("Creature") == [])
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def testReplaceCardUpdatesIndex(self, data: dict, lazy: bool):
+        deck = Deck.fromJson(data, lazy=lazy)
+        hylda = deck.find(name="Hylda of the Icy Crown")[0]
+        other = next(x for x in deck.cards if x is not hylda)
+        copy = replace(other, id=1)
+
+        deck.replaceCard(hylda, copy)
+        assert(deck.find(name="Hylda of the Icy Crown") == [])
+        assert(deck.byCategory("Commander") == [])
+        assert(deck.find(name=other.card.oracle_card.name) == [x for x in deck.cards if x is other or x is copy])
+        assert(any(x is copy for y in deck.categories for x in y.cards))
+        with pytest.raises(ValueError):
+            deck.replaceCard(hylda, copy)
+
+    def testRemovingMissingCardRaises(self, data: dict):
+        deck = Deck.fromJson(data)
+        card = deck.cards[0]
+        deck.removeCard(card)
+
+        with pytest.raises(ValueError):
+            deck.removeCard(card)
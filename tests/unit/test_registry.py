@@ -0,0 +1,31 @@
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.registry import CardRegistry
+import json
+import pytest
+
+
+@pytest.fixture
+def data() -> dict:
+    with open("tests/unit/resources/deck.json", "r") as f:
+        return json.load(f)
+
+
+class TestCardRegistry:
+    def testSharesAcrossDecks(self, data):
+        registry = CardRegistry()
+        first = Deck.fromJson(data, registry)
+        second = Deck.fromJson(json.loads(json.dumps(data)), registry)
+
+        assert(first == second == Deck.fromJson(data))
+        for a, b in zip(first.cards, second.cards):
+            assert(a.card.oracle_card is b.card.oracle_card)
+            assert(a.card.edition is b.card.edition)
+        assert(registry.oracle_stats.hits == 2 and registry.oracle_stats.misses == 2)
+
+    def testBoundedSize(self, data):
+        registry = CardRegistry(max_size=1)
+        Deck.fromJson(data, registry)
+
+        assert(len(registry) == 2)
+        assert(registry.oracle_stats.evictions == 1)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+from pyrchidekt.deck import Deck
+from pyrchidekt.registry import CardRegistry
+from pyrchidekt.snapshot import SnapshotError, dumpDecks, loadDecks
+from pyrchidekt.synthetic import generateCorpus
+import io
+import json
+import pytest
+
+
+@pytest.fixture
+def data() -> dict:
+    with open("tests/unit/resources/deck.json", "r") as f:
+        return json.load(f)
+
+
+def _roundTrip(deck: Deck, registry: CardRegistry | None = None) -> Deck:
+    file = io.BytesIO()
+    deck.dump(file)
+    file.seek(0)
+    return Deck.load(file, registry)
+
+
+class TestSnapshot:
+    def testRoundTrip(self, data: dict):
+        deck = Deck.fromJson(data)
+        loaded = _roundTrip(deck)
+
+        assert loaded == deck
+        assert loaded.format is deck.format
+        assert loaded.cards[0].created_at == deck.cards[0].created_at
+        assert [len(x.cards) for x in loaded.categories] == [
+            len(x.cards) for x in deck.categories
+        ]
+        assert loaded.categories[0].cards[0] is loaded.cards[0]
+
+    def testLazyDeckRoundTrip(self, data: dict):
+        assert _roundTrip(Deck.fromJson(data, lazy=True)) == Deck.fromJson(data)
+
+    def testCorpusSharesOracleCards(self):
+        corpus = [Deck.fromJson(x) for x in generateCorpus(20, 60)]
+        file = io.BytesIO()
+        dumpDecks(corpus, file)
+        file.seek(0)
+        loaded = loadDecks(file)
+
+        assert loaded == corpus
+        file.seek(0)
+        with pytest.raises(SnapshotError):
+            Deck.load(file)
+        by_id = {}
+        for card in (x for deck in loaded for x in deck.cards):
+            oracle_card = by_id.setdefault(
+                card.card.oracle_card.id, card.card.oracle_card
+            )
+            assert card.card.oracle_card is oracle_card
+        assert (
+            len(file.getvalue())
+            < sum(len(json.dumps(x)) for x in generateCorpus(20, 60)) / 3
+        )
+
+    def testRegistry(self, data: dict):
+        registry = CardRegistry()
+        first = _roundTrip(Deck.fromJson(data), registry)
+        second = _roundTrip(Deck.fromJson(data), registry)
+
+        assert first.cards[0].card.oracle_card is second.cards[0].card.oracle_card
+
+    def testDifferentObjectsWithTheSameIdAreKept(self, data: dict):
+        deck = Deck.fromJson(data)
+        other = Deck.fromJson(data)
+        other.cards[0].card.oracle_card.text = "Changed"
+        file = io.BytesIO()
+        dumpDecks([deck, other], file)
+        file.seek(0)
+
+        assert loadDecks(file) == [deck, other]
+
+    def testInvalidSnapshots(self, data: dict):
+        file = io.BytesIO()
+        Deck.fromJson(data).dump(file)
+        raw = file.getvalue()
+
+        with pytest.raises(SnapshotError):
+            Deck.load(io.BytesIO(b"{}"))
+        with pytest.raises(SnapshotError):
+            Deck.load(io.BytesIO(b"x" * 8 + raw[8:]))
+        with pytest.raises(SnapshotError):
+            Deck.load(io.BytesIO(raw[:8] + b"\x09\x00" + raw[10:]))
+        with pytest.raises(SnapshotError):
+            Deck.load(io.BytesIO(raw[:-10]))
+        with pytest.raises(SnapshotError):
+            Deck.load(io.BytesIO(b""))
@@ -0,0 +1,166 @@
+from __future__ import annotations
+from datetime import timedelta, timezone
+from pyrchidekt.deck import Deck
+from pyrchidekt.formats import Format
+from pyrchidekt.registry import CardRegistry
+from pyrchidekt.store import DeckRow, DeckStore, StoreError
+from pyrchidekt.synthetic import generateCorpus
+import copy
+import json
+import pytest
+import sqlite3
+
+
+@pytest.fixture
+def data() -> dict:
+    with open("tests/unit/resources/deck.json", "r") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def decks() -> list:
+    return [Deck.fromJson(x) for x in generateCorpus(40, 30)]
+
+
+@pytest.fixture
+def store(decks: list) -> DeckStore:
+    with DeckStore() as store:
+        store.extend(decks, batch_size=16)
+        yield store
+
+
+def _recentFirst(decks: list) -> list:
+    return sorted(decks, key=lambda x: (-x.updated_at.timestamp(), x.id))
+
+
+class TestStore:
+    def testRoundTrip(self, data: dict):
+        with DeckStore() as store:
+            deck = store.addJson(data)
+            loaded = store.getDeck(deck.id)
+
+        assert loaded == deck
+        assert loaded.format is deck.format
+        assert loaded.categories[0].cards[0] is loaded.cards[0]
+        assert (
+            loaded.cards[0].card.oracle_card.legalities
+            == deck.cards[0].card.oracle_card.legalities
+        )
+
+    def testReplace(self, store: DeckStore, data: dict):
+        store.addJson(data)
+        updated = copy.deepcopy(data)
+        updated["name"] = "Updated"
+        del updated["cards"][1:]
+        store.addJson(updated)
+
+        assert len(store) == 41
+        assert store.getDeck(data["id"]) == Deck.fromJson(updated)
+        store.delete(data["id"])
+        assert data["id"] not in store
+        assert store.getDeck(data["id"]) is None
+
+    def testSameDeckInBatch(self, data: dict):
+        updated = copy.deepcopy(data)
+        updated["name"] = "Updated"
+        del updated["cards"][1:]
+        with DeckStore() as store:
+            store.extend([Deck.fromJson(data), Deck.fromJson(updated)])
+
+            assert len(store) == 1
+            assert store.getDeck(data["id"]) == Deck.fromJson(updated)
+
+    def testFind(self, store: DeckStore, decks: list):
+        name = decks[0].cards[0].card.oracle_card.name
+        with_card = [
+            x for x in decks if any(y.card.oracle_card.name == name for y in x.cards)
+        ]
+        owner = decks[0].owner
+        after = _recentFirst(decks)[10].updated_at
+
+        assert [x.id for x in store.find(card=name.upper())] == [
+            x.id for x in _recentFirst(with_card)
+        ]
+        assert [x.id for x in store.find(format=Format.COMMANDER)] == [
+            x.id for x in _recentFirst(decks) if x.format is Format.COMMANDER
+        ]
+        assert [x.id for x in store.find(owner=owner.id)] == [
+            x.id for x in store.find(owner=owner.username)
+        ]
+        assert len(store.find(updated_after=after)) == 10
+        assert (
+            len(store.find(updated_before=after + timedelta(microseconds=1), limit=5))
+            == 5
+        )
+
+        row = store.find(limit=1)[0]
+        deck = _recentFirst(decks)[0]
+        assert row == DeckRow(
+            deck.id,
+            deck.name,
+            deck.format,
+            deck.owner.id,
+            deck.owner.username,
+            deck.created_at,
+            deck.updated_at,
+            deck.view_count,
+        )
+
+    def testTimeZones(self, store: DeckStore, decks: list):
+        after = _recentFirst(decks)[10].updated_at
+        elsewhere = after.astimezone(timezone(timedelta(hours=-5)))
+
+        assert store.find(updated_after=elsewhere) == store.find(updated_after=after)
+        assert len(store.find(updated_after=elsewhere)) == 10
+        with pytest.raises(ValueError):
+            store.find(updated_after=after.replace(tzinfo=None))
+        with pytest.raises(ValueError):
+            store.decks(updated_before=after.replace(tzinfo=None))
+
+    @pytest.mark.parametrize("batch_size", [1, 2])
+    def testOracleCardUpdated(self, data: dict, batch_size: int):
+        updated = copy.deepcopy(data)
+        updated["id"] += 1
+        card = updated["cards"][0]["card"]
+        card["oracleCard"]["text"] = "Changed"
+        card["oracleCard"]["legalities"]["commander"] = "banned"
+        card["edition"]["editionname"] = "Changed"
+        with DeckStore() as store:
+            store.extend(
+                [Deck.fromJson(data), Deck.fromJson(updated)], batch_size=batch_size
+            )
+            store.addJson(data)
+            store.addJson(updated)
+
+            assert store.getDeck(updated["id"]) == Deck.fromJson(updated)
+
+    def testDecks(self, store: DeckStore, decks: list):
+        commander = [x for x in _recentFirst(decks) if x.format is Format.COMMANDER]
+        loaded = list(store.decks(format=Format.COMMANDER))
+
+        assert loaded == commander
+        oracle_cards = {}
+        for card in (x for deck in loaded for x in deck.cards):
+            oracle_card = oracle_cards.setdefault(
+                card.card.oracle_card.id, card.card.oracle_card
+            )
+            assert card.card.oracle_card is oracle_card
+
+    def testRegistry(self, store: DeckStore, decks: list):
+        store.registry = CardRegistry()
+        first = store.getDeck(decks[0].id)
+        again = store.getDeck(decks[0].id)
+
+        assert first.cards[0].card.oracle_card is again.cards[0].card.oracle_card
+
+    def testSchemaVersion(self, tmp_path, data: dict):
+        path = tmp_path / "decks.sqlite"
+        with DeckStore(path) as store:
+            store.addJson(data)
+        with DeckStore(path) as store:
+            assert len(store) == 1
+        connection = sqlite3.connect(path)
+        connection.execute("PRAGMA user_version = 99")
+        connection.close()
+        with pytest.raises(StoreError):
+            DeckStore(path)
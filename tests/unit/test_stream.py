@@ -0,0 +1,56 @@
+from __future__ import annotations
+from pyrchidekt.api import ArchidektClient
+from pyrchidekt.deck import Deck
+from pyrchidekt.stream import DeckStream
+import io
+import json
+import pytest
+
+
+@pytest.fixture
+def raw() -> bytes:
+    with open("tests/unit/resources/deck.json", "rb") as f:
+        return f.read()
+
+
+class TestDeckStream:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+    def testYieldsEveryCard(self, raw, chunk_size):
+        expected = Deck.fromJson(json.loads(raw))
+        stream = DeckStream(io.BytesIO(raw), chunk_size=chunk_size)
+
+        assert(list(stream) == expected.cards)
+        assert(stream.metadata["name"] == expected.name)
+        assert(stream.metadata["owner"]["id"] == expected.owner.id)
+        assert("cards" not in stream.metadata)
+
+    def testNumbersSplitAcrossChunks(self, raw):
+        data = json.loads(raw)
+        data["points"] = 12.75
+        data["userInput"] = -2.5e3
+        data["game"] = None
+        encoded = json.dumps(data).encode()
+        stream = DeckStream(encoded[x : x + 1] for x in range(len(encoded)))
+
+        assert(list(stream) == Deck.fromJson(data).cards)
+        assert(stream.metadata["points"] == 12.75)
+        assert(stream.metadata["userInput"] == -2500)
+        assert(stream.metadata["game"] is None)
+
+    def testMetadataBeforeCardsIsAvailableWithFirstCard(self, raw):
+        stream = DeckStream(io.BytesIO(raw))
+        next(iter(stream))
+
+        assert(stream.metadata["viewCount"] == json.loads(raw)["viewCount"])
+        assert("categories" not in stream.metadata)
+        assert(len(stream.finish()["categories"]) == 2)
+
+    def testTruncatedDocumentRaises(self, raw):
+        with pytest.raises(ValueError):
+            list(DeckStream(io.BytesIO(raw[: len(raw) // 2])))
+
+    def testClientStreamsDeck(self, deckServer):
+        with ArchidektClient(base_url=deckServer.base_url) as client:
+            stream = client.streamDeckById(1)
+            assert(len(list(stream)) == 2)
+            assert(stream.metadata["id"] == 12345)